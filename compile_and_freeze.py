@@ -0,0 +1,90 @@
+"""
+compile_and_freeze.py - Deployment build helper for DesktopControllerMCP-MCP (v0.1.5)
+
+Byte-compiles the `mcp` package ahead of time and bundles the result into a
+single zip archive that can be placed on `PYTHONPATH` (Python imports it via
+`zipimport`). On container or serverless cold starts this replaces one
+`stat()` + `read()` per module with a single archive read, and no `.py` file is
+compiled at runtime.
+
+Key operations:
+- Compiles every module with `compileall` at optimization level 2 (`-OO`),
+  writing legacy `.pyc` files next to the sources (`-b`), equivalent to
+  `python -m compileall -b -o 2 mcp/`.
+- Packs the compiled modules (no sources) into `dist/mcp-<version>-py<XY>-opt2.zip`.
+
+Notes:
+- The archive is tied to the interpreter that built it (the .pyc magic number);
+  build it with the same Python version as the deployment target.
+- `-OO` strips docstrings and `assert` statements. The FastAPI/Pydantic models
+  declare their descriptions explicitly, but class docstrings of request models
+  no longer show up in the generated OpenAPI schema.
+
+Usage:
+    python compile_and_freeze.py [--output-dir dist] [--keep-pyc]
+"""
+
+import argparse
+import compileall
+import sys
+import zipfile
+from pathlib import Path
+
+PROJECT_VERSION = "0.1.5" # Consistent project version
+PACKAGE_NAME = "mcp"
+OPTIMIZATION_LEVEL = 2 # Same as `python -OO`
+
+def compile_package(package_dir: Path) -> bool:
+    """Byte-compiles `package_dir` into legacy .pyc files next to the sources."""
+    print(f"Compiling '{package_dir}' (optimize={OPTIMIZATION_LEVEL}, legacy .pyc layout)...")
+    return bool(compileall.compile_dir(
+        str(package_dir),
+        quiet=1,
+        legacy=True,
+        optimize=OPTIMIZATION_LEVEL,
+        force=True,
+    ))
+
+def build_archive(project_root: Path, package_dir: Path, output_dir: Path) -> Path:
+    """Packs every compiled module of the package into a single sourceless zip archive."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    py_tag = f"py{sys.version_info.major}{sys.version_info.minor}"
+    archive_path = output_dir / f"{PACKAGE_NAME}-{PROJECT_VERSION}-{py_tag}-opt{OPTIMIZATION_LEVEL}.zip"
+
+    pyc_files = sorted(p for p in package_dir.rglob("*.pyc") if "__pycache__" not in p.parts)
+    with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for pyc_file in pyc_files:
+            zf.write(pyc_file, pyc_file.relative_to(project_root).as_posix())
+    print(f"Wrote {len(pyc_files)} modules to '{archive_path}'.")
+    return archive_path
+
+def remove_legacy_pyc(package_dir: Path) -> None:
+    """Removes the legacy .pyc files compileall wrote next to the sources."""
+    for pyc_file in package_dir.rglob("*.pyc"):
+        if "__pycache__" not in pyc_file.parts:
+            pyc_file.unlink()
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pre-compile and bundle the mcp package for deployment.")
+    parser.add_argument("--output-dir", type=Path, default=Path("dist"), help="Directory for the archive (default: dist).")
+    parser.add_argument("--keep-pyc", action="store_true", help="Keep the legacy .pyc files next to the sources.")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parent
+    package_dir = project_root / PACKAGE_NAME
+    output_dir = args.output_dir if args.output_dir.is_absolute() else project_root / args.output_dir
+
+    if not compile_package(package_dir):
+        print("ERROR: Byte-compilation failed; no archive written.", file=sys.stderr)
+        return 1
+    try:
+        archive_path = build_archive(project_root, package_dir, output_dir)
+    finally:
+        if not args.keep_pyc:
+            remove_legacy_pyc(package_dir)
+
+    print(f"Deploy with: PYTHONPATH={archive_path} python -OO -m mcp.main")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,64 +1,88 @@
 """
 MCP - Model Context Protocol
 Core package initializer for DesktopControllerMCP-MCP.
+
+Submodules (``mcp.capture``, ``mcp.input``, ...) and public names are
+resolved lazily on first attribute access (PEP 562), so a bare ``import mcp``
+does not pull in pyautogui, OpenCV or the window backends. Set
+``MCP_EAGER_IMPORT=1`` to resolve everything in ``__all__`` at import time,
+which surfaces broken deferred imports immediately (useful in CI), or
+``MCP_MINIMAL_INIT=1`` for tooling that only needs ``__version__``.
 """
 __version__ = "0.1.5" # Project version
 
+import importlib
+import os
 import sys
-import logging  # ✅ Standard logging import hinzugefügt
+from typing import Any
 
-# Local imports - mit verbessertem Error Handling
-try:
-    from .logger import setup_logging, get_logger
-except ImportError as e:
-    # Fallback falls logger Import fehlschlägt
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-    logger.warning(f"Failed to import custom logger: {e}. Using basic logging.")
-    def setup_logging(level="INFO"): 
-        logging.basicConfig(level=getattr(logging, level.upper(), logging.INFO))
-    def get_logger(name): 
-        return logging.getLogger(name)
+# Short interpreter version ("3.13.0"), parsed once for banners and system-info reporting.
+_PY_VERSION_SHORT = sys.version.partition(" ")[0]
+__python_version__ = _PY_VERSION_SHORT
+
+# Platform flags, evaluated once. Platform-gated code paths import these instead of re-checking sys.platform.
+_IS_WINDOWS: bool = sys.platform == "win32"
+_IS_MACOS: bool = sys.platform == "darwin"
+_IS_LINUX: bool = sys.platform.startswith("linux")
 
-# Default logging setup.
-# This will typically be overridden by main.py or mcp_server.py with specific configurations.
-setup_logging(level="INFO")
-_logger = get_logger(__name__)
-_logger.info(f"Initializing MCP v{__version__} on Python {sys.version.split()[0]} ({sys.platform})")
+__all__ = [
+    "__version__",
+    "__python_version__",
+    # Submodules
+    "api",
+    "capture",
+    "input",
+    "logger",
+    "recorder",
+    "vision",
+    "window",
+    # Public names
+    "setup_logging",
+    "get_logger",
+    "create_app",
+    "main_api_server",
+]
 
-# ✅ Windows DPI awareness - mit verbessertem Error Handling
-if sys.platform == "win32":
+# Submodules imported on first attribute access (``mcp.capture`` etc.)
+_SUBMODULES: frozenset[str] = frozenset({
+    "api", "capture", "input", "logger", "recorder", "vision", "window",
+})
+
+# Lazily resolved public names: name -> (relative module, attribute)
+_LAZY: dict[str, tuple[str, str]] = {
+    "setup_logging": (".logger", "setup_logging"),
+    "get_logger": (".logger", "get_logger"),
+    "create_app": (".main", "create_app"),
+    "main_api_server": (".main", "main_api_server"),
+}
+
+def __getattr__(name: str) -> Any:
+    """Resolves a lazy submodule or public name and caches it in the package namespace."""
+    if name in _SUBMODULES:
+        # import_module binds the submodule as a package attribute itself
+        return importlib.import_module(f".{name}", __name__)
     try:
-        import ctypes
-        # Constants for DPI awareness levels
-        PROCESS_DPI_UNAWARE = 0
-        PROCESS_SYSTEM_DPI_AWARE = 1
-        PROCESS_PER_MONITOR_DPI_AWARE = 2
+        module_name, attr_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value # Subsequent lookups bypass __getattr__ entirely
+    return value
 
-        awareness = ctypes.c_int()
-        # Get current DPI awareness for the process
-        result_get = ctypes.windll.shcore.GetProcessDpiAwareness(0, ctypes.byref(awareness))
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-        if result_get != 0:
-            _logger.warning(f"Failed to get current DPI awareness. Error code: {result_get}")
-        else:
-            _logger.info(f"Current process DPI awareness value: {awareness.value}")
-            # Set awareness to Per-Monitor DPI Aware if currently unaware
-            if awareness.value == PROCESS_DPI_UNAWARE:
-                ret_set = ctypes.windll.shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE)
-                if ret_set == 0:  # S_OK
-                    _logger.info("Process DPI awareness successfully set to PROCESS_PER_MONITOR_DPI_AWARE.")
-                elif ret_set == ctypes.HRESULT(0x80070005).value:  # E_ACCESSDENIED
-                    _logger.info("Failed to set DPI awareness: E_ACCESSDENIED. It might already be set by a manifest.")
-                else:
-                    _logger.warning(f"Failed to set DPI awareness. SetProcessDpiAwareness returned: {ret_set}")
-            else:
-                _logger.info("Process DPI awareness is already set (not UNAWARE). Skipping SetProcessDpiAwareness.")
+if os.environ.get("MCP_MINIMAL_INIT") == "1":
+    # Tooling mode (packaging, --version, completion generators): only __version__ matters.
+    # Logging is left unconfigured and MCP_EAGER_IMPORT is ignored.
+    def setup_logging(*args: Any, **kwargs: Any) -> None:
+        """No-op while MCP_MINIMAL_INIT=1."""
 
-    except ImportError:
-        _logger.warning("ctypes library not available. Cannot manage DPI awareness settings.")
-    except AttributeError:
-        _logger.warning("shcore.SetProcessDpiAwareness or GetProcessDpiAwareness not found. "
-                       "This might indicate an older Windows version.")
-    except Exception as e:
-        _logger.error(f"An unexpected error occurred during DPI awareness setup: {e}", exc_info=True)
\ No newline at end of file
+    def get_logger(name: str) -> Any:
+        """Plain `logging.getLogger` while MCP_MINIMAL_INIT=1 (no auto-configuration)."""
+        import logging
+        return logging.getLogger(name)
+elif os.environ.get("MCP_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        getattr(sys.modules[__name__], _name)
+    del _name
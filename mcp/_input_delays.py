@@ -0,0 +1,48 @@
+"""
+_input_delays.py – Optional settle pauses for the input backends (v0.1.5).
+
+The Windows and macOS backends used to sleep a fixed 10-50 ms around every
+click, key press and drag "so the event is processed". Modern systems queue
+synthetic events in order, so those pauses are off by default. Applications
+that do need them can opt back in through MCP_INPUT_DELAYS:
+
+    MCP_INPUT_DELAYS=compat                       # the backend's former pauses
+    MCP_INPUT_DELAYS=click_settle=0.02,key_hold=0.01
+    MCP_INPUT_DELAYS=compat,drag_settle=0         # former pauses, with overrides
+
+Values are seconds. Unknown names are ignored with a warning.
+"""
+import os
+import time
+
+from mcp.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["input_delays", "pause"]
+
+def input_delays(legacy: dict[str, float]) -> dict[str, float]:
+    """
+    Returns the pause (seconds) for each name in legacy: 0 unless MCP_INPUT_DELAYS says otherwise.
+    legacy holds the backend's former fixed pauses, which 'compat' restores.
+    """
+    delays = dict.fromkeys(legacy, 0.0)
+    for item in filter(None, (part.strip() for part in os.environ.get("MCP_INPUT_DELAYS", "").split(","))):
+        if item == "compat":
+            delays.update(legacy)
+            continue
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if name not in delays:
+            logger.warning("MCP_INPUT_DELAYS: unknown delay '%s' ignored (known: %s)", name, ", ".join(delays))
+            continue
+        try:
+            delays[name] = max(0.0, float(value))
+        except ValueError:
+            logger.warning("MCP_INPUT_DELAYS: invalid value for '%s': %r", name, value)
+    return delays
+
+def pause(seconds: float) -> None:
+    """time.sleep(seconds), skipped entirely (no syscall) for a zero delay."""
+    if seconds > 0:
+        time.sleep(seconds)
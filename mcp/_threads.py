@@ -0,0 +1,89 @@
+"""
+_threads.py – Worker-thread dispatch for DesktopControllerMCP-MCP (v0.1.5).
+
+asyncio.to_thread always wraps the call in ctx.run on a copied context. The
+server never sets context variables on its request paths, so that extra frame
+and partial are pure overhead there; to_thread_fast only pays for them when
+the copied context actually carries variables.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import os
+import threading
+from typing import Any, Callable
+
+from mcp.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["to_thread_fast", "MCP_THREADS", "install_default_executor", "uninstall_default_executor", "warm_executor"]
+
+# Screen grabs, window-manager calls and PNG encoding mostly release the GIL, so the pool is sized
+# above the core count. Set MCP_THREADS=4 on memory-constrained hosts.
+def _pool_size() -> int:
+    """MCP_THREADS if it is a positive integer, else twice the core count (at most 16)."""
+    default = min(16, (os.cpu_count() or 1) * 2)
+    value = os.environ.get("MCP_THREADS", "").strip()
+    if not value:
+        return default
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers <= 0:
+        logger.warning("MCP_THREADS: invalid value %r, using %d worker threads", value, default)
+        return default
+    return workers
+
+MCP_THREADS: int = _pool_size()
+
+async def to_thread_fast(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """
+    Drop-in for asyncio.to_thread: runs func(*args, **kwargs) in the loop's default executor.
+    Context variables are still propagated when any are set.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if ctx: # Non-empty context: keep to_thread semantics
+        func, args = ctx.run, (func, *args)
+    if kwargs:
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+    return await loop.run_in_executor(None, func, *args)
+
+def install_default_executor(loop: asyncio.AbstractEventLoop | None = None) -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Installs a process-lifetime ThreadPoolExecutor of MCP_THREADS workers as the loop's default
+    executor, which to_thread_fast and asyncio.to_thread submit to. Returns it for shutdown.
+    """
+    loop = loop or asyncio.get_running_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=MCP_THREADS, thread_name_prefix="mcp-io")
+    loop.set_default_executor(executor)
+    return executor
+
+def uninstall_default_executor(
+    executor: concurrent.futures.ThreadPoolExecutor, loop: asyncio.AbstractEventLoop | None = None
+) -> None:
+    """
+    Shuts down an executor from install_default_executor without cancelling running calls. A fresh,
+    lazily started ThreadPoolExecutor (asyncio's own default) becomes the loop's default first, so
+    to_thread_fast and asyncio.to_thread keep working for the rest of the loop's life.
+    """
+    loop = loop or asyncio.get_running_loop()
+    loop.set_default_executor(concurrent.futures.ThreadPoolExecutor())
+    executor.shutdown(wait=False, cancel_futures=True)
+
+async def warm_executor(executor: concurrent.futures.ThreadPoolExecutor, workers: int, timeout: float = 5.0) -> None:
+    """
+    Starts workers threads of the executor (its max_workers, e.g. MCP_THREADS) up front so early
+    requests do not pay for thread creation. Each task waits on a shared barrier, which forces one
+    new thread per task instead of reusing an idle one; workers must not exceed the pool size.
+    """
+    loop = asyncio.get_running_loop()
+    barrier = threading.Barrier(workers, timeout=timeout)
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, barrier.wait) for _ in range(workers)), return_exceptions=True
+    )
+    if any(isinstance(r, threading.BrokenBarrierError) for r in results):
+        raise RuntimeError(f"Only part of the {workers} executor threads started within {timeout}s")
@@ -0,0 +1,108 @@
+"""
+_win_dpi.py – Windows per-monitor DPI awareness for DesktopControllerMCP-MCP (v0.1.5).
+
+Screen coordinates reported by window backends and consumed by capture/input
+are only physical pixels once the process is DPI aware. This used to run on
+every ``import mcp``; it now runs once, on first use by the GUI-facing modules
+(capture, window, Windows input backend).
+"""
+import ctypes
+import enum
+import functools
+import logging
+import os
+from ctypes import wintypes
+
+from mcp import _IS_WINDOWS
+from mcp.logger import get_logger
+
+logger = get_logger(__name__)
+
+if not _IS_WINDOWS:
+    raise RuntimeError("_win_dpi.py loaded on a non-Windows platform.")
+
+# Constants for DPI awareness levels
+PROCESS_DPI_UNAWARE = 0
+PROCESS_SYSTEM_DPI_AWARE = 1
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+
+_E_ACCESSDENIED = -2147024891 # HRESULT 0x80070005 as returned through a signed long
+
+# shcore.dll and its DPI functions only exist on Windows 8.1+. Probe them once per process
+# and declare the prototypes up front so ctypes does not infer argument types per call.
+try:
+    _shcore = ctypes.WinDLL("shcore", use_last_error=True)
+    _GetProcessDpiAwareness = _shcore.GetProcessDpiAwareness
+    _GetProcessDpiAwareness.argtypes = (wintypes.HANDLE, ctypes.POINTER(ctypes.c_int))
+    _GetProcessDpiAwareness.restype = ctypes.c_long # HRESULT
+    _SetProcessDpiAwareness = _shcore.SetProcessDpiAwareness
+    _SetProcessDpiAwareness.argtypes = (ctypes.c_int,)
+    _SetProcessDpiAwareness.restype = ctypes.c_long # HRESULT
+    _DPI_AVAILABLE: bool = True
+except (OSError, AttributeError):
+    _GetProcessDpiAwareness = _SetProcessDpiAwareness = None
+    _DPI_AVAILABLE = False
+
+class DpiOutcome(enum.Enum):
+    """Final result of the DPI awareness setup, reported in a single log record."""
+    UNCHANGED_ALREADY_AWARE = "already DPI aware, left unchanged"
+    SET_OK = "set to PROCESS_PER_MONITOR_DPI_AWARE"
+    SET_DENIED = "E_ACCESSDENIED, probably already set by a manifest"
+    SET_FAILED = "SetProcessDpiAwareness failed"
+    GET_FAILED = "GetProcessDpiAwareness failed"
+    UNAVAILABLE = "shcore DPI functions not found (Windows older than 8.1?)"
+    SKIPPED_HEADLESS = "skipped, MCP_SERVER_MODE=stdio"
+    ERROR = "unexpected error"
+
+_OUTCOME_LOG_LEVELS: dict[DpiOutcome, int] = {
+    DpiOutcome.UNCHANGED_ALREADY_AWARE: logging.DEBUG,
+    DpiOutcome.SET_OK: logging.INFO,
+    DpiOutcome.SET_DENIED: logging.INFO,
+    DpiOutcome.SET_FAILED: logging.WARNING,
+    DpiOutcome.GET_FAILED: logging.WARNING,
+    DpiOutcome.UNAVAILABLE: logging.WARNING,
+    DpiOutcome.SKIPPED_HEADLESS: logging.DEBUG,
+    DpiOutcome.ERROR: logging.ERROR,
+}
+
+def _apply_per_monitor_dpi() -> tuple[DpiOutcome, int | None]:
+    """Performs the ctypes calls. Returns the outcome and the relevant HRESULT/awareness value."""
+    if os.environ.get("MCP_SERVER_MODE") == "stdio":
+        # Explicit opt-out for launchers that never map window geometry to input coordinates.
+        return DpiOutcome.SKIPPED_HEADLESS, None
+    if not _DPI_AVAILABLE:
+        return DpiOutcome.UNAVAILABLE, None
+
+    awareness = ctypes.c_int()
+    # Get current DPI awareness for the process (NULL handle = current process)
+    result_get = _GetProcessDpiAwareness(None, ctypes.byref(awareness))
+    if result_get != 0:
+        return DpiOutcome.GET_FAILED, result_get
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Current process DPI awareness value: %s", awareness.value)
+    if awareness.value != PROCESS_DPI_UNAWARE:
+        return DpiOutcome.UNCHANGED_ALREADY_AWARE, awareness.value
+
+    # Set awareness to Per-Monitor DPI Aware since the process is currently unaware
+    ret_set = _SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE)
+    if ret_set == 0:  # S_OK
+        return DpiOutcome.SET_OK, ret_set
+    if ret_set == _E_ACCESSDENIED:
+        return DpiOutcome.SET_DENIED, ret_set
+    return DpiOutcome.SET_FAILED, ret_set
+
+@functools.lru_cache(maxsize=1)
+def ensure_per_monitor_dpi() -> DpiOutcome:
+    """
+    Sets the process to PROCESS_PER_MONITOR_DPI_AWARE if it is currently DPI unaware.
+    Only the first call does any work; later calls return the cached outcome immediately.
+    """
+    try:
+        outcome, detail = _apply_per_monitor_dpi()
+    except Exception as e:
+        logger.error("DPI awareness: %s: %s", DpiOutcome.ERROR.value, e, exc_info=True)
+        return DpiOutcome.ERROR
+
+    logger.log(_OUTCOME_LOG_LEVELS[outcome], "DPI awareness: %s (value: %s)", outcome.value, detail)
+    return outcome
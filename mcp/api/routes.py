@@ -5,27 +5,41 @@ This module defines the HTTP API endpoints for interacting with the MCP service.
 It aims for:
 - Minimal, clear JSON contracts.
 - Async-first operations, with heavy tasks offloaded to threads.
-- BackgroundTask support for fire-and-forget actions (e.g., click).
+- A queue-backed worker pool for fire-and-forget actions (e.g., click).
 - Modularity: this router can be mounted into a parent FastAPI instance.
 """
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
+import collections
+import contextlib
+import dataclasses
 import io
+import os
 import pathlib
+import platform
+import re
 import time 
+import types
 import sys
+import threading
 import functools
+import hashlib
+import logging
 import uuid
 from pathlib import Path  # ✅ ADDED: Missing import for Path.cwd()
-from typing import Any
+from typing import Any, Literal
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Body
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, field_validator, model_validator
+from fastapi import APIRouter, FastAPI, HTTPException, status, Depends, Body, Header, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from PIL import Image  # ✅ ADDED: Missing import for Image type hints
+import psutil
+import pyautogui
 
+from mcp import __python_version__
+from mcp._threads import MCP_THREADS, install_default_executor, to_thread_fast, uninstall_default_executor, warm_executor
 from mcp.logger import get_logger
 import mcp.capture as capture
 import mcp.vision as vision
@@ -34,45 +48,175 @@ from mcp.window import WindowNotFoundError, WindowOperationError, BBox, WindowBa
 from mcp.vision import VisionError, TemplateNotFoundError, Detection
 
 from mcp.input import backend as input_backend
+_input_drag_async = getattr(input_backend, "drag_async", None) # Backends with a native async drag (Linux)
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/mcp", tags=["MCP Automation Endpoints"])
+try:
+    import pybase64 # SIMD-accelerated base64 (optional 'speedups' extra)
+
+    def _b64encode_str(data: bytes | memoryview) -> str:
+        return pybase64.b64encode_as_string(data)
+except ImportError:
+    def _b64encode_str(data: bytes | memoryview) -> str:
+        # binascii is the C routine under base64.b64encode, minus its Python wrapper; buffers are read in place
+        return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+try:
+    import xxhash # Fast non-cryptographic hash for screenshot ETags (optional 'speedups' extra)
+
+    def _frame_digest(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    def _frame_digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+try:
+    import numpy as np
+    from turbojpeg import TJPF_RGB, TurboJPEG # libjpeg-turbo SIMD encoder (optional 'speedups' extra)
+    _turbojpeg: TurboJPEG | None = TurboJPEG() # Raises if the shared libturbojpeg is not installed
+except (ImportError, OSError, RuntimeError):
+    _turbojpeg = None
+
+try:
+    import orjson # noqa: F401 # ORJSONResponse needs it at render time (optional 'speedups' extra)
+    from fastapi.responses import ORJSONResponse as DEFAULT_RESPONSE_CLASS
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
+router = APIRouter(prefix="/mcp", tags=["MCP Automation Endpoints"], default_response_class=DEFAULT_RESPONSE_CLASS)
+
+TEMPLATE_MATCHER_CACHE_SIZE = 64
+TEMPLATE_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
 
-@functools.lru_cache(maxsize=64)
 def get_cached_template_matcher(template_full_path: pathlib.Path, threshold: float) -> vision.TemplateMatcher:
-    logger.debug(f"Accessing/creating TemplateMatcher for: {template_full_path}, threshold: {threshold:.2f}")
+    """
+    Returns a TemplateMatcher for the file, reusing a cached one while the file is unchanged.
+    The cache key includes the file's mtime, so an edited template is reloaded on next use.
+    Blocking (stat, and imread on a miss): call it from a worker thread.
+    """
+    try:
+        mtime_ns = os.stat(template_full_path).st_mtime_ns
+    except OSError as e:
+        logger.error(f"Template file not found for TemplateMatcher: {template_full_path}")
+        raise TemplateNotFoundError(f"Template image file not found: {template_full_path}") from e
+    return _template_matcher_for(template_full_path, mtime_ns, threshold)
+
+@functools.lru_cache(maxsize=TEMPLATE_MATCHER_CACHE_SIZE)
+def _template_matcher_for(template_full_path: pathlib.Path, mtime_ns: int, threshold: float) -> vision.TemplateMatcher:
+    logger.debug(f"Creating TemplateMatcher for: {template_full_path} (mtime_ns: {mtime_ns}), threshold: {threshold:.2f}")
     try:
         return vision.TemplateMatcher(template_full_path, threshold=threshold)
     except TemplateNotFoundError:
         logger.error(f"Template file not found for TemplateMatcher: {template_full_path}")
         raise
     except VisionError as ve:
-        logger.error(f"VisionError creating TemplateMatcher for '{template_full_path}': {ve}", exc_info=True)
+        logger.warning(f"VisionError creating TemplateMatcher for '{template_full_path}': {ve}")
         raise
     except Exception as e:
         logger.error(f"Unexpected error creating TemplateMatcher for '{template_full_path}': {e}", exc_info=True)
         raise VisionError(f"Failed to initialize TemplateMatcher for '{template_full_path}': {e!s}") from e
 
-class FocusRequestData(BaseModel):
+def preload_template_matchers(threshold: float = 0.8) -> int:
+    """
+    Builds matchers for the templates under assets/ at the default threshold, so the first /click
+    for each does not pay for imread. Stops at the cache size. Returns the number of matchers loaded.
+    """
+    try:
+        assets_base_dir = _assets_base_dir()
+    except ValueError as e:
+        logger.info(f"Skipping template preload: {e}")
+        return 0
+    loaded = 0
+    for template_file in sorted(assets_base_dir.rglob("*")):
+        if loaded >= TEMPLATE_MATCHER_CACHE_SIZE:
+            break
+        if template_file.suffix.lower() not in TEMPLATE_IMAGE_SUFFIXES or not template_file.is_file():
+            continue
+        try:
+            get_cached_template_matcher(template_file.resolve(), threshold)
+            loaded += 1
+        except VisionError as e:
+            logger.warning(f"Could not preload template '{template_file}': {e!s}")
+    logger.info(f"Preloaded {loaded} template matcher(s) from '{assets_base_dir}'.")
+    return loaded
+
+@functools.lru_cache(maxsize=1)
+def _assets_base_dir() -> Path:
+    """Resolves the 'assets' directory once; later calls are a cache hit instead of cwd/resolve/stat syscalls."""
+    assets_base_dir = (Path.cwd() / "assets").resolve()
+    if not assets_base_dir.is_dir():
+        logger.error(f"Critical: Assets base directory '{assets_base_dir}' does not exist or is not a directory.")
+        raise ValueError(f"Server configuration error: Assets directory not found at '{assets_base_dir}'.")
+    return assets_base_dir
+
+# Absolute paths (POSIX, UNC/backslash, drive letter), any '..' and NUL bytes never name a file under assets/
+_BAD_TEMPLATE_PATH_RE = re.compile(r"^[/\\]|^[A-Za-z]:|\.\.|\x00")
+
+def _precheck_template_path(v_str: str) -> None:
+    """String-only rejection of traversal attempts and wrong suffixes, before any filesystem access."""
+    if _BAD_TEMPLATE_PATH_RE.search(v_str):
+        logger.warning(f"Rejected template_path {v_str!r}: absolute path, '..' or NUL byte.")
+        raise ValueError("Invalid template path: Path must be relative to the assets directory.")
+    dot = v_str.rfind(".")
+    if dot < 0 or v_str[dot:].lower() not in TEMPLATE_IMAGE_SUFFIXES:
+        raise ValueError(f"Template image must be one of {sorted(TEMPLATE_IMAGE_SUFFIXES)}. Found: {v_str[dot:] if dot >= 0 else ''}")
+
+@functools.lru_cache(maxsize=256)
+def _resolve_template_path(v_str: str) -> Path:
+    """
+    Validates a template path relative to the assets directory and returns its resolved absolute path.
+    Successful results are cached per input string; rejected paths raise ValueError and are not cached.
+    """
+    assets_base_dir = _assets_base_dir()
+    prospective_path = (assets_base_dir / v_str).resolve()
+
+    if not prospective_path.is_relative_to(assets_base_dir):
+        logger.warning(f"Path traversal attempt detected for template_path: '{v_str}' resolved to '{prospective_path}', which is outside '{assets_base_dir}'.")
+        raise ValueError(f"Invalid template path: Path is outside the allowed assets directory.")
+
+    if not prospective_path.is_file():
+        raise ValueError(f"Template file not found at resolved path: {prospective_path} (from input: '{v_str}')")
+
+    if prospective_path.suffix.lower() not in TEMPLATE_IMAGE_SUFFIXES:
+        raise ValueError(f"Template image must be one of {sorted(TEMPLATE_IMAGE_SUFFIXES)}. Found: {prospective_path.suffix}")
+    return prospective_path
+
+class RequestModel(BaseModel):
+    """
+    Base for all request bodies: immutable and strict about unknown fields. Validators and the core
+    schema are built once at class creation; there is no per-assignment validation to pay for.
+    """
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False)
+
+class FocusRequestData(RequestModel):
     title: str | None = Field(None, description="Substring of the window title (case-sensitive).")
     window_id: int | str | None = Field(None, description="Native window handle/ID (e.g., HWND, CGWindowID, XID).")
+    handle: str | None = Field(None, description="Token from /windows/resolve; skips window enumeration while it is fresh.")
 
     @model_validator(mode='after')
     def check_at_least_one_identifier(self) -> 'FocusRequestData':
-        if not self.title and self.window_id is None:
-            raise ValueError("Either 'title' or 'window_id' must be provided to identify the window.")
+        if not self.title and self.window_id is None and not self.handle:
+            raise ValueError("Either 'title', 'window_id' or 'handle' must be provided to identify the window.")
         return self
 
-    model_config = {
-        "json_schema_extra": {
+    @property
+    def identifier(self) -> str:
+        """Human-readable identifier for logs and job status entries."""
+        if self.title:
+            return self.title
+        return str(self.window_id) if self.window_id is not None else f"handle:{self.handle}"
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {"title": "Notepad"},
                 {"window_id": 123456},
-                {"title": "My App", "window_id": "0x7b0a45"}
+                {"title": "My App", "window_id": "0x7b0a45"},
+                {"handle": "3f2b9c1e-8d4a-4e57-9a1b-2c6d0e7f8a90"}
             ]
         }
-    }
+    )
 
 class ScreenshotResponseData(BaseModel):
     image_base64: str = Field(description="Base64 encoded string of the screenshot image.")
@@ -80,7 +224,28 @@ class ScreenshotResponseData(BaseModel):
     height: int = Field(description="Height of the captured image in pixels.")
     format: str = Field("PNG", description="Image format (e.g., 'PNG', 'JPEG').")
 
-class ClickTemplateData(BaseModel):
+class WindowBBoxData(BaseModel):
+    left: int = Field(description="Left edge in screen coordinates.")
+    top: int = Field(description="Top edge in screen coordinates.")
+    width: int = Field(description="Window width in pixels.")
+    height: int = Field(description="Window height in pixels.")
+
+class WindowInfoResponse(BaseModel):
+    title: str = Field(description="Window title.")
+    window_id: int | str | None = Field(description="Native window handle/ID, if available.")
+    bbox: WindowBBoxData = Field(description="Window bounding box.")
+    is_visible: bool
+    is_active: bool
+    is_alive: bool
+    backend: str = Field(description="Window backend in use (e.g., 'pywinctl').")
+    message: str
+
+class WindowActionResponse(BaseModel):
+    success: bool = Field(description="True if the window operation was performed.")
+    window_title: str = Field(description="Title of the target window.")
+    message: str
+
+class ClickTemplateData(RequestModel):
     template_path: str = Field(
         description="Relative path to the template image within the 'assets' directory (e.g., 'buttons/play.png')."
     )
@@ -92,25 +257,9 @@ class ClickTemplateData(BaseModel):
     @field_validator('template_path')
     @classmethod
     def validate_template_path_str(cls, v_str: str) -> str:
+        _precheck_template_path(v_str)
         try:
-            project_root = Path.cwd()
-            assets_base_dir = (project_root / "assets").resolve()
-            if not assets_base_dir.is_dir():
-                logger.error(f"Critical: Assets base directory '{assets_base_dir}' does not exist or is not a directory.")
-                raise ValueError(f"Server configuration error: Assets directory not found at '{assets_base_dir}'.")
-
-            prospective_path = (assets_base_dir / v_str).resolve()
-
-            if not prospective_path.is_relative_to(assets_base_dir):
-                logger.warning(f"Path traversal attempt detected for template_path: '{v_str}' resolved to '{prospective_path}', which is outside '{assets_base_dir}'.")
-                raise ValueError(f"Invalid template path: Path is outside the allowed assets directory.")
-
-            if not prospective_path.exists() or not prospective_path.is_file():
-                raise ValueError(f"Template file not found at resolved path: {prospective_path} (from input: '{v_str}')")
-
-            allowed_suffixes = ['.png', '.jpg', '.jpeg']
-            if prospective_path.suffix.lower() not in allowed_suffixes:
-                raise ValueError(f"Template image must be one of {allowed_suffixes}. Found: {prospective_path.suffix}")
+            _resolve_template_path(v_str)
         except ValueError:
             raise
         except Exception as e:
@@ -118,14 +267,14 @@ class ClickTemplateData(BaseModel):
             raise ValueError(f"Internal error validating template path: {e!s}") from e
         return v_str
 
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {"template_path": "ui_elements/submit_button.png", "threshold": 0.85},
                 {"template_path": "icons/save.jpg", "threshold": 0.7}
             ]
         }
-    }
+    )
 
 class ClickOperationResponse(BaseModel):
     status: str = Field(description="Status of the click operation (e.g., 'queued', 'processing', 'completed', 'error').")
@@ -136,18 +285,18 @@ class ClickOperationResponse(BaseModel):
     confidence: float | None = Field(None, description="Confidence score of the match, if found.")
 
 # Mouse Control Request Models
-class ClickRequest(BaseModel):
+class ClickRequest(RequestModel):
     """Request model for mouse click operations"""
     x: int = Field(..., description="X coordinate")
     y: int = Field(..., description="Y coordinate") 
     button: str = Field("left", description="Mouse button (left, right, middle)")
 
-class MouseMoveRequest(BaseModel):
+class MouseMoveRequest(RequestModel):
     """Request model for mouse move operations"""
     x: int = Field(..., description="X coordinate")
     y: int = Field(..., description="Y coordinate")
 
-class MouseDragRequest(BaseModel):
+class MouseDragRequest(RequestModel):
     """Request model for mouse drag operations"""
     start_x: int = Field(..., description="Start X coordinate")
     start_y: int = Field(..., description="Start Y coordinate")
@@ -156,7 +305,7 @@ class MouseDragRequest(BaseModel):
     button: str = Field("left", description="Mouse button (left, right, middle)")
     duration: float = Field(0.5, description="Drag duration in seconds")
 
-class MouseScrollRequest(BaseModel):
+class MouseScrollRequest(RequestModel):
     """Request model for mouse scroll operations"""
     x: int | None = Field(None, description="X coordinate (optional)")
     y: int | None = Field(None, description="Y coordinate (optional)")
@@ -164,46 +313,351 @@ class MouseScrollRequest(BaseModel):
     dy: int = Field(..., description="Vertical scroll amount")
 
 # Keyboard Control Request Models
-class TypeTextRequest(BaseModel):
+class TypeTextRequest(RequestModel):
     """Request model for text typing operations"""
     text: str = Field(..., description="Text to type")
 
-class KeyPressRequest(BaseModel):
+class KeyPressRequest(RequestModel):
     """Request model for key press operations"""
     key: str = Field(..., description="Key to press (e.g., 'enter', 'escape', 'tab')")
 
-class KeyboardInputRequest(BaseModel):
+class KeyboardInputRequest(RequestModel):
     """Request model for advanced keyboard operations"""
     action: str = Field(..., description="Keyboard action type (combination, special, hold, release)")
     keys: list[str] | None = Field(None, description="Keys for combination (e.g., ['ctrl', 'c'])")
     key: str | None = Field(None, description="Single key for special/hold/release")
     modifiers: list[str] | None = Field(None, description="Modifier keys (ctrl, alt, shift)")
 
-class KeyCombinationRequest(BaseModel):
+class KeyCombinationRequest(RequestModel):
     """Request model for key combination operations"""
     keys: list[str] = Field(..., description="A list of keys to press in combination, e.g., ['ctrl', 'c']")
     modifiers: list[str] = Field([], description="Optional list of modifier keys.")
 
-class SpecialKeyRequest(BaseModel):
+class SpecialKeyRequest(RequestModel):
     """Request model for special key operations"""
     special_key: str = Field(..., description="Special key to send")
 
-class KeyHoldRequest(BaseModel):
+class KeyHoldRequest(RequestModel):
     """Request model for key hold operations"""  
     key: str = Field(..., description="Key to hold down")
 
-class KeyReleaseRequest(BaseModel):
+class KeyReleaseRequest(RequestModel):
     """Request model for key release operations"""
     key: str = Field(..., description="Key to release")
 
-class ScreenshotRegionRequest(BaseModel):
+class ScreenshotRegionRequest(RequestModel):
     """Request model for region screenshot operations"""
     x: int = Field(..., description="X coordinate")
     y: int = Field(..., description="Y coordinate") 
     width: int = Field(..., description="Width of region")
     height: int = Field(..., description="Height of region")
+    encoding: Literal["png", "raw", "jpeg"] = Field(
+        "png", description="'png' (lossless), 'raw' (uncompressed pixel bytes, best over loopback) or 'jpeg' (lossy, smallest)."
+    )
+
+class BoundedLRU(collections.OrderedDict):
+    """
+    OrderedDict capped at `maxsize` entries; the least recently used entry is evicted first.
+    Only touched from the event loop thread, so no locking is needed.
+    """
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+MAX_TRACKED_CLICK_JOBS = 1024
+background_click_tasks_status: BoundedLRU = BoundedLRU(MAX_TRACKED_CLICK_JOBS) # job_id -> status dict
+
+# Click jobs run on a fixed pool of worker tasks fed by a bounded queue, so a burst of /click
+# submissions returns immediately and a full queue pushes back with 503 instead of piling up.
+CLICK_WORKER_COUNT = 4
+CLICK_QUEUE_MAXSIZE = 256
+_click_queue: asyncio.Queue | None = None
+_click_workers: list[asyncio.Task] = []
+_input_lock = asyncio.Lock() # Held around every synthetic input call, so e.g. a queued click never lands inside a drag
+
+def _ensure_click_workers(worker_count: int = CLICK_WORKER_COUNT) -> asyncio.Queue:
+    """Creates the click queue and starts its workers on the running loop, once."""
+    global _click_queue
+    if _click_queue is None:
+        _click_queue = asyncio.Queue(maxsize=CLICK_QUEUE_MAXSIZE)
+        for i in range(worker_count):
+            _click_workers.append(asyncio.create_task(_click_worker(_click_queue), name=f"mcp-click-worker-{i}"))
+        logger.info(f"Started {worker_count} click workers (queue size {CLICK_QUEUE_MAXSIZE}).")
+    return _click_queue
+
+async def stop_click_workers() -> None:
+    """Cancels the click workers; queued jobs that have not started are dropped."""
+    global _click_queue
+    for task in _click_workers:
+        task.cancel()
+    await asyncio.gather(*_click_workers, return_exceptions=True)
+    _click_workers.clear()
+    _click_queue = None
+
+def _preload_caches() -> None:
+    """Startup warm-up: template matchers, then one window enumeration to initialise the window backend."""
+    preload_template_matchers()
+    try:
+        window.list_all_windows_snapshot(only_visible_titled=True)
+    except Exception as e:
+        logger.debug(f"Window backend warm-up skipped: {e}")
+
+@contextlib.asynccontextmanager
+async def click_worker_lifespan(app: FastAPI):
+    """
+    Lifespan for apps mounting this router: installs and warms the sized worker-thread pool, starts the
+    click workers up front, warms the template matcher cache and window backend in the background, and
+    stops the workers on shutdown.
+    """
+    executor = install_default_executor()
+    try:
+        await warm_executor(executor, MCP_THREADS)
+        logger.info(f"Default executor: {MCP_THREADS} 'mcp-io' worker threads started")
+    except RuntimeError as e:
+        logger.warning(f"Executor warm-up incomplete: {e}")
+    _ensure_click_workers()
+    preload_task = asyncio.create_task(to_thread_fast(_preload_caches), name="mcp-template-preload")
+    try:
+        yield
+    finally:
+        preload_task.cancel()
+        await stop_click_workers()
+        uninstall_default_executor(executor)
+
+async def _click_worker(queue: asyncio.Queue) -> None:
+    while True:
+        job_id, window_spec_data, click_spec_data = await queue.get()
+        try:
+            await _background_click_task(job_id, window_spec_data, click_spec_data)
+        finally:
+            queue.task_done()
+
+WINDOW_HANDLE_TTL_S = 30.0 # After this, a handle re-resolves its window (by native ID) on next use
+MAX_WINDOW_HANDLES = 256
+
+@dataclasses.dataclass(slots=True)
+class _WindowHandle:
+    title: str | None
+    window_id: int | str | None
+    window: window.Window
+    expires_at: float # time.monotonic()
+
+_window_handles: BoundedLRU = BoundedLRU(MAX_WINDOW_HANDLES) # handle token -> _WindowHandle
+
+def _lookup_handle(handle: str) -> _WindowHandle:
+    entry: _WindowHandle | None = _window_handles.get(handle)
+    if entry is None:
+        raise WindowNotFoundError(f"Unknown or evicted window handle '{handle}'. Resolve the window again.")
+    return entry
 
-background_click_tasks_status: dict[str, dict[str, Any]] = {}
+async def _get_target_window(spec: FocusRequestData) -> window.Window:
+    """
+    Resolves the window for a request. A fresh handle token returns the cached Window without
+    enumerating windows; a stale one is re-resolved and refreshed. Raises WindowNotFoundError.
+    """
+    if spec.handle:
+        entry = _lookup_handle(spec.handle)
+        if time.monotonic() < entry.expires_at:
+            return entry.window
+        entry.window = await to_thread_fast(window.get_window, title=entry.title, window_id=entry.window_id)
+        entry.expires_at = time.monotonic() + WINDOW_HANDLE_TTL_S
+        return entry.window
+    return await to_thread_fast(window.get_window, title=spec.title, window_id=spec.window_id)
+
+def _resolve_and_call(title: str | None, window_id: int | str | None, func, args: tuple) -> tuple[window.Window, Any]:
+    target_win = window.get_window(title=title, window_id=window_id)
+    return target_win, func(target_win, *args)
+
+async def _with_target_window(spec: FocusRequestData, func, *args) -> tuple[window.Window, Any]:
+    """
+    Resolves the request's window and runs func(window, *args) in one worker-thread call: the
+    lookup and the action execute back to back instead of in two hops. A fresh handle skips the
+    lookup entirely. Returns (window, result). Raises WindowNotFoundError.
+    """
+    entry: _WindowHandle | None = None
+    if spec.handle:
+        entry = _lookup_handle(spec.handle)
+        if time.monotonic() < entry.expires_at:
+            return entry.window, await to_thread_fast(func, entry.window, *args)
+        title, window_id = entry.title, entry.window_id
+    else:
+        title, window_id = spec.title, spec.window_id
+    target_win, result = await to_thread_fast(_resolve_and_call, title, window_id, func, args)
+    if entry is not None:
+        entry.window = target_win
+        entry.expires_at = time.monotonic() + WINDOW_HANDLE_TTL_S
+    return target_win, result
+
+_SCREEN_SIZE_TTL_S = 5.0 # Resolution changes are rare; re-query the display at most this often
+_screen_size_cache: tuple[tuple[int, int], float] | None = None # ((width, height), expiry on time.monotonic())
+
+def _fresh_screen_size() -> tuple[int, int] | None:
+    """Returns the cached screen size while its TTL has not expired, else None. Non-blocking."""
+    if _screen_size_cache is not None and time.monotonic() < _screen_size_cache[1]:
+        return _screen_size_cache[0]
+    return None
+
+def _refresh_screen_size() -> tuple[int, int]:
+    """Queries the display via pyautogui.size() and caches the result. Blocking: run in a worker thread."""
+    global _screen_size_cache
+    width, height = pyautogui.size()
+    _screen_size_cache = ((width, height), time.monotonic() + _SCREEN_SIZE_TTL_S)
+    return width, height
+
+DEFAULT_PNG_COMPRESS_LEVEL = 1 # zlib level 1 encodes several times faster than the default 6 with a modestly larger payload
+
+def _encode_png(img: Image.Image, compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL) -> bytearray:
+    """Encodes an image as PNG into a new bytearray. No optimize pass: it is a second full compression run."""
+    return capture.encode_image(img, "PNG", compress_level=compress_level)
+
+PNG_BUFFER_POOL_MAX_BYTES = 16 * 1024 * 1024 # Larger buffers are dropped after use instead of being pinned per thread
+_png_buffers = threading.local()
+
+def _encode_png_base64(img: Image.Image, compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL) -> str:
+    """
+    Encodes an image as base64 PNG through a BytesIO reused by the calling worker thread.
+    The buffer is rewound, not truncated, so its allocation survives between requests; base64
+    runs in the same call because the next job on this thread overwrites the buffer.
+    """
+    buffer: io.BytesIO | None = getattr(_png_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _png_buffers.buffer = io.BytesIO()
+    buffer.seek(0)
+    img.save(buffer, format="PNG", compress_level=compress_level)
+    end = buffer.tell()
+    with buffer.getbuffer() as view, view[:end] as png_view:
+        encoded = _b64encode_str(png_view)
+    if end > PNG_BUFFER_POOL_MAX_BYTES:
+        _png_buffers.buffer = None
+    return encoded
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluates an If-None-Match header (a list of entity tags or '*') against our ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def _etag_and_png(img: Image.Image, compress_level: int, if_none_match: str | None, encode=_encode_png) -> tuple[str, Any]:
+    """
+    Hashes the raw pixels into an ETag and encodes the PNG only if the client's copy is stale.
+    Returns (etag, None) when If-None-Match matches, else (etag, encode(img, compress_level)).
+    One worker-thread call for both steps.
+    """
+    digest = _frame_digest(img.tobytes())
+    etag = f'"{digest}-{img.width}x{img.height}-{img.mode}-z{compress_level}"'
+    if _etag_matches(if_none_match, etag):
+        return etag, None
+    return etag, encode(img, compress_level)
+
+DEFAULT_JPEG_QUALITY = 85
+IMAGE_MEDIA_TYPES: dict[str, str] = {"png": "image/png", "jpeg": "image/jpeg", "raw": "application/octet-stream"}
+
+def _encode_jpeg(img: Image.Image, quality: int = DEFAULT_JPEG_QUALITY) -> bytes | bytearray:
+    """Encodes an image as JPEG, through libjpeg-turbo's SIMD encoder when PyTurboJPEG is available."""
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    if _turbojpeg is not None:
+        return _turbojpeg.encode(np.asarray(img), quality=quality, pixel_format=TJPF_RGB)
+    return capture.encode_image(img, "JPEG", quality=quality)
+
+def _encode_image(img: Image.Image, encoding: str, compress_level: int) -> bytes | bytearray:
+    """Encodes for a streamed response: PNG, JPEG, or the raw pixel bytes (no compression)."""
+    if encoding == "raw":
+        return img.tobytes()
+    if encoding == "jpeg":
+        return _encode_jpeg(img)
+    return _encode_png(img, compress_level)
+
+def _encode_image_base64(img: Image.Image, encoding: str, compress_level: int) -> str:
+    """Same as _encode_image, base64-encoded; PNG goes through the per-thread buffer."""
+    if encoding == "png":
+        return _encode_png_base64(img, compress_level)
+    return _b64encode_str(_encode_image(img, encoding, compress_level))
+
+PNG_STREAM_CHUNK_SIZE = 64 * 1024
+
+def _iter_buffer_chunks(buffer: bytes | bytearray, chunk_size: int = PNG_STREAM_CHUNK_SIZE):
+    """Yields zero-copy memoryview slices of an encoded buffer for StreamingResponse."""
+    view = memoryview(buffer)
+    try:
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+    finally:
+        view.release()
+
+def _collect_system_info() -> dict[str, Any]:
+    """Static system facts plus the current screen count. Blocking: run in a worker thread."""
+    # Get screen count (monitors can be attached at runtime, so this is not cached)
+    try:
+        screen_count = len(pyautogui.getAllDisplays())
+    except Exception:
+        screen_count = 1
+    return {**_static_system_info(), "screen_count": screen_count}
+
+@functools.cache
+def _static_system_info() -> types.MappingProxyType[str, Any]:
+    """System facts that cannot change while the process runs; collected on first request, then frozen."""
+    return types.MappingProxyType({
+        "os": platform.system(),
+        "os_version": platform.version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": psutil.cpu_count(),
+        "memory_gb": round(psutil.virtual_memory().total / (1024**3), 2),
+        "python_version": __python_version__,
+    })
+
+def _snapshot_window(w: window.Window) -> tuple[str, int | str | None, BBox, str]:
+    """Reads title, ID, bbox and backend name in one call, so handlers need a single thread hop."""
+    return w.title, w.window_id, w.bbox, w._backend_name_used
+
+def _activate_window(w: window.Window) -> tuple[str, int | str | None, BBox, str]:
+    """Activates the window and snapshots it afterwards, in one call."""
+    w.activate()
+    return _snapshot_window(w)
+
+def _collect_window_info(w: window.Window) -> tuple[str, int | str | None, BBox, bool, bool, bool, str]:
+    """Reads everything /get_window_info reports (title, ID, bbox, visible, active, alive, backend) in one call."""
+    return w.title, w.window_id, w.bbox, w.is_visible(), w.is_active(), w.is_alive(), w._backend_name_used
+
+def _close_window(w: window.Window) -> str:
+    """Reads the title and closes the window in one call. Returns the title."""
+    title = w.title
+    w.close()
+    return title
+
+def _window_state_action(w: window.Window, action: str) -> tuple[str, bool, str | None]:
+    """
+    Reads the title and runs a backend state change ('minimize'/'maximize') in one call.
+    Returns (title, supported, error message or None); backend failures are reported, not raised.
+    """
+    title = w.title
+    if not (w._supports_minimize if action == "minimize" else w._supports_maximize):
+        return title, False, None
+    try:
+        getattr(w._window_impl, action)()
+    except Exception as e:
+        return title, True, str(e)
+    return title, True, None
 
 @router.post(
     "/focus",
@@ -212,20 +666,15 @@ background_click_tasks_status: dict[str, dict[str, Any]] = {}
     description="Brings the specified window (identified by title or ID) to the foreground and activates it."
 )
 async def api_focus_window(focus_data: FocusRequestData):
-    logger.info(f"API Focus request: title='{focus_data.title}', window_id={focus_data.window_id}")
+    logger.info(f"API Focus request: {focus_data.identifier}")
     try:
-        target_win = await asyncio.to_thread(
-            window.get_window, title=focus_data.title, window_id=focus_data.window_id
-        )
-        await asyncio.to_thread(target_win.activate)
-        actual_title = await asyncio.to_thread(lambda: target_win.title)
-        actual_id = await asyncio.to_thread(lambda: target_win.window_id)
+        _, (actual_title, actual_id, _, _) = await _with_target_window(focus_data, _activate_window)
         logger.info(f"Window focused successfully: '{actual_title}' (ID: {actual_id})")
     except WindowNotFoundError as e:
         logger.warning(f"Window not found for focus operation: {e!s}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error_type": "window_not_found", "message": str(e)})
     except WindowOperationError as e:
-        logger.error(f"Window operation error during focus: {e!s}", exc_info=True)
+        logger.warning(f"Window operation error during focus: {e!s}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error_type": "window_operation_failed", "message": str(e)})
     except Exception as e:
         logger.error(f"Unexpected error during focus operation: {e!s}", exc_info=True)
@@ -235,20 +684,25 @@ async def api_focus_window(focus_data: FocusRequestData):
     "/screenshot",
     response_model=ScreenshotResponseData,
     summary="Take Window Screenshot",
-    description="Captures a screenshot of the specified window and returns it as a base64 encoded PNG."
+    description="Captures a screenshot of the specified window and returns it as a base64 encoded PNG. "
+                "Responses carry an ETag of the pixel data; send it back in If-None-Match to get 304 while the window is unchanged."
 )
-async def api_take_screenshot(focus_data: FocusRequestData):
-    logger.info(f"API Screenshot request: title='{focus_data.title}', window_id={focus_data.window_id}")
+async def api_take_screenshot(
+    focus_data: FocusRequestData,
+    response: Response,
+    compress_level: int = Query(DEFAULT_PNG_COMPRESS_LEVEL, ge=0, le=9, description="PNG zlib level; higher values trade encode time for smaller payloads."),
+    if_none_match: str | None = Header(None),
+):
+    logger.info(f"API Screenshot request: {focus_data.identifier}")
     try:
-        target_win = await asyncio.to_thread(
-            window.get_window, title=focus_data.title, window_id=focus_data.window_id
-        )
-        actual_title = await asyncio.to_thread(lambda: target_win.title)
-        win_bbox: BBox = await asyncio.to_thread(lambda: target_win.bbox)
+        target_win = await _get_target_window(focus_data)
+        actual_title, _, win_bbox, _ = await to_thread_fast(_snapshot_window, target_win)
         img: Image = await capture.screenshot_async(win_bbox, img_format="PNG")  # ✅ FIXED: Using Image instead of Image.Image
-        buffer = io.BytesIO()
-        await asyncio.to_thread(img.save, buffer, format="PNG", optimize=True)
-        img_base64_str: str = base64.b64encode(buffer.getvalue()).decode('utf-8')
+        etag, img_base64_str = await to_thread_fast(_etag_and_png, img, compress_level, if_none_match, _encode_png_base64)
+        if img_base64_str is None:
+            logger.info(f"Screenshot for '{actual_title}' unchanged (ETag {etag}), returning 304")
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         logger.info(f"Screenshot captured for '{actual_title}': {img.width}x{img.height}, Format: PNG")
         return ScreenshotResponseData(
             image_base64=img_base64_str,
@@ -260,12 +714,54 @@ async def api_take_screenshot(focus_data: FocusRequestData):
         logger.warning(f"Window not found for screenshot: {e!s}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error_type": "window_not_found", "message": str(e)})
     except (capture.CaptureError, WindowOperationError) as e:
-        logger.error(f"Error during screenshot capture or window operation: {e!s}", exc_info=True)
+        logger.warning(f"Error during screenshot capture or window operation: {e!s}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error_type": "screenshot_failed", "message": str(e)})
     except Exception as e:
         logger.error(f"Unexpected error during screenshot operation: {e!s}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error_type": "internal_server_error", "message": f"An unexpected server error occurred: {e!s}"})
 
+@router.post(
+    "/screenshot/raw",
+    response_class=StreamingResponse,
+    summary="Take Window Screenshot (raw PNG)",
+    description="Captures a screenshot of the specified window and streams the PNG bytes directly (no base64/JSON envelope). "
+                "Image dimensions are returned in the X-Image-Width / X-Image-Height headers. Supports ETag / If-None-Match like /screenshot."
+)
+async def api_take_screenshot_raw(
+    focus_data: FocusRequestData,
+    compress_level: int = Query(DEFAULT_PNG_COMPRESS_LEVEL, ge=0, le=9, description="PNG zlib level; higher values trade encode time for smaller payloads."),
+    if_none_match: str | None = Header(None),
+):
+    logger.info(f"API Raw Screenshot request: {focus_data.identifier}")
+    try:
+        target_win = await _get_target_window(focus_data)
+        actual_title, _, win_bbox, _ = await to_thread_fast(_snapshot_window, target_win)
+        img: Image = await capture.screenshot_async(win_bbox, img_format="PNG")
+        etag, buffer = await to_thread_fast(_etag_and_png, img, compress_level, if_none_match)
+        if buffer is None:
+            logger.info(f"Raw screenshot for '{actual_title}' unchanged (ETag {etag}), returning 304")
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        logger.info(f"Raw screenshot captured for '{actual_title}': {img.width}x{img.height}, {len(buffer)} bytes")
+        return StreamingResponse(
+            _iter_buffer_chunks(buffer),
+            media_type="image/png",
+            headers={
+                "Content-Length": str(len(buffer)),
+                "ETag": etag,
+                "X-Image-Width": str(img.width),
+                "X-Image-Height": str(img.height),
+            },
+        )
+    except WindowNotFoundError as e:
+        logger.warning(f"Window not found for raw screenshot: {e!s}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error_type": "window_not_found", "message": str(e)})
+    except (capture.CaptureError, WindowOperationError) as e:
+        logger.warning(f"Error during raw screenshot capture or window operation: {e!s}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error_type": "screenshot_failed", "message": str(e)})
+    except Exception as e:
+        logger.error(f"Unexpected error during raw screenshot operation: {e!s}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error_type": "internal_server_error", "message": f"An unexpected server error occurred: {e!s}"})
+
 async def _background_click_task(
     job_id: str,
     window_spec_data: FocusRequestData,
@@ -274,24 +770,17 @@ async def _background_click_task(
     current_task_status = background_click_tasks_status[job_id]
     current_task_status["status"] = "processing"
     current_task_status["message"] = "Click operation is now being processed."
-    logger.info(f"Background Job ID {job_id}: Starting click task. Window: '{window_spec_data.title or window_spec_data.window_id}', Template: '{click_spec_data.template_path}'")
+    logger.info(f"Background Job ID {job_id}: Starting click task. Window: '{window_spec_data.identifier}', Template: '{click_spec_data.template_path}'")
 
     try:
-        project_root = Path.cwd()
-        assets_dir = (project_root / "assets").resolve()
-        absolute_template_path = (assets_dir / click_spec_data.template_path).resolve()
+        absolute_template_path = _resolve_template_path(click_spec_data.template_path)
 
-        target_win = await asyncio.to_thread(
-            window.get_window,
-            title=window_spec_data.title,
-            window_id=window_spec_data.window_id
-        )
-        actual_win_title = await asyncio.to_thread(lambda: target_win.title)
+        target_win = await _get_target_window(window_spec_data)
+        actual_win_title, _, win_bbox, _ = await to_thread_fast(_snapshot_window, target_win)
         current_task_status["window_actual_title"] = actual_win_title
-        win_bbox: BBox = await asyncio.to_thread(lambda: target_win.bbox)
         screenshot_img: Image = await capture.screenshot_async(win_bbox)  # ✅ FIXED: Using Image instead of Image.Image
-        detector = get_cached_template_matcher(absolute_template_path, click_spec_data.threshold)
-        detection_result: Detection | None = await asyncio.to_thread(vision.locate, screenshot_img, detector)
+        detector = await to_thread_fast(get_cached_template_matcher, absolute_template_path, click_spec_data.threshold)
+        detection_result: Detection | None = await to_thread_fast(vision.locate, screenshot_img, detector)
 
         if not detection_result:
             message = f"Template '{click_spec_data.template_path}' not found in window '{actual_win_title}' with threshold {click_spec_data.threshold:.2f}."
@@ -302,7 +791,8 @@ async def _background_click_task(
         click_x_abs = win_bbox[0] + detection_result.center[0]
         click_y_abs = win_bbox[1] + detection_result.center[1]
         click_pos_abs = (click_x_abs, click_y_abs)
-        await asyncio.to_thread(input_backend.click, click_pos_abs)
+        async with _input_lock:
+            await to_thread_fast(input_backend.click, click_pos_abs)
         message = (f"Successfully clicked template '{click_spec_data.template_path}' in window '{actual_win_title}' "
                    f"at screen coordinates {click_pos_abs} (Confidence: {detection_result.score:.3f}).")
         logger.info(f"Job ID {job_id}: {message}")
@@ -319,7 +809,7 @@ async def _background_click_task(
         current_task_status.update({"status": "error", "error_type": "window_not_found", "message": msg})
     except (VisionError, capture.CaptureError, WindowOperationError) as e:
         msg = f"Error during vision processing, capture, or window op: {type(e).__name__} - {e!s}"
-        logger.error(f"Job ID {job_id}: {msg}", exc_info=True)
+        logger.warning(f"Job ID {job_id}: {msg}")
         current_task_status.update({"status": "error", "error_type": type(e).__name__.lower(), "message": msg})
     except Exception as e:
         msg = f"Unexpected error during background click task: {type(e).__name__} - {e!s}"
@@ -331,33 +821,36 @@ async def _background_click_task(
     response_model=ClickOperationResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Click UI Element by Template",
-    description="Locates a template image within a specified window and clicks its center. This is a background operation."
+    description="Locates a template image within a specified window and clicks its center. This is a background operation; "
+                "returns 503 if the click queue is full."
 )
 async def api_click_template(
-    background_tasks_runner: BackgroundTasks,
     window_spec: FocusRequestData = Body(..., embed=True, title="Window Specification"),
     click_spec: ClickTemplateData = Body(..., embed=True, title="Click Template Specification"),
 ):
     job_id = str(uuid.uuid4())
     logger.info(
         f"API Click request queued (Job ID: {job_id}). "
-        f"Window: '{window_spec.title or window_spec.window_id}', Template: '{click_spec.template_path}', Threshold: {click_spec.threshold:.2f}"
+        f"Window: '{window_spec.identifier}', Template: '{click_spec.template_path}', Threshold: {click_spec.threshold:.2f}"
     )
     initial_job_status = {
         "status": "queued",
         "message": "Click operation has been queued for background execution.",
         "job_id": job_id,
         "template_path": click_spec.template_path,
-        "window_identifier": window_spec.title or str(window_spec.window_id),
+        "window_identifier": window_spec.identifier,
         "timestamp_queued": time.time() 
     }
+    click_queue = _ensure_click_workers() # No-op once the lifespan (or an earlier request) started them
+    try:
+        click_queue.put_nowait((job_id, window_spec, click_spec))
+    except asyncio.QueueFull:
+        logger.warning(f"Click queue full ({CLICK_QUEUE_MAXSIZE} jobs); rejecting Job ID {job_id}.")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"error_type": "click_queue_full", "message": "Too many pending click operations. Retry later."}
+        )
     background_click_tasks_status[job_id] = initial_job_status
-    background_tasks_runner.add_task(
-        _background_click_task,
-        job_id,
-        window_spec,
-        click_spec
-    )
     return ClickOperationResponse(
         status="queued",
         job_id=job_id,
@@ -391,32 +884,11 @@ async def api_get_click_status(job_id: str):
 async def api_list_windows() -> list[dict[str, Any]]:
     logger.info("API List Windows request received.")
     try:
-        mcp_windows: list[window.Window] = await asyncio.to_thread(window.list_all_windows)
-        
-        result_list: list[dict[str, Any]] = []
-        for w_obj in mcp_windows:
-            try:
-                w_title: str = await asyncio.to_thread(lambda: w_obj.title)
-                # ✅ FIXED: Corrected lambda to call the method
-                w_is_visible: bool = await asyncio.to_thread(lambda: w_obj.is_visible()) 
-
-                if w_title and w_title != "Untitled Window" and w_is_visible:
-                    w_bbox: BBox = await asyncio.to_thread(lambda: w_obj.bbox)
-                    w_id: int | str | None = await asyncio.to_thread(lambda: w_obj.window_id)
-                    result_list.append({
-                        "title": w_title,
-                        "window_id": w_id,
-                        "is_visible": w_is_visible,
-                        "bbox": {
-                            "left": w_bbox[0], "top": w_bbox[1],
-                            "width": w_bbox[2], "height": w_bbox[3]
-                        },
-                        "backend_used": w_obj._backend_name_used
-                    })
-            except WindowOperationError as e_win_op:
-                logger.warning(f"Could not fully process a window during list_windows: {e_win_op!s}")
-            except Exception as e_ind_win:
-                logger.warning(f"Generic error processing individual window in list_windows: {e_ind_win!s}", exc_info=False)
+        # One thread hop for the whole listing; hidden/untitled windows are filtered out during enumeration
+        snapshots: list[window.WindowSnapshot] = await to_thread_fast(
+            window.list_all_windows_snapshot, only_visible_titled=True
+        )
+        result_list: list[dict[str, Any]] = [snap.as_dict() for snap in snapshots]
         
         logger.info(f"Listed {len(result_list)} processable windows.")
         return result_list
@@ -427,6 +899,43 @@ async def api_list_windows() -> list[dict[str, Any]]:
         logger.error(f"Unexpected error during list_windows operation: {e!s}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail={"error_type": "internal_server_error", "message": f"Failed to enumerate windows: {e!s}"})# === PHASE 1 BACKEND APIS ===
 
+@router.post(
+    "/windows/resolve",
+    response_model=dict[str, Any],
+    summary="Resolve Window Handle",
+    description="Looks up a window once and returns an opaque handle token. Passing the token as 'handle' to "
+                "/focus, /screenshot, /click and the window management endpoints skips window enumeration."
+)
+async def api_resolve_window(window_spec: FocusRequestData):
+    logger.info(f"API Resolve Window request: {window_spec.identifier}")
+    try:
+        target_win = await _get_target_window(window_spec)
+        win_title, win_id, _, _ = await to_thread_fast(_snapshot_window, target_win)
+        handle = str(uuid.uuid4())
+        # Store the native ID so a stale handle re-resolves to the same window, not a title match
+        _window_handles[handle] = _WindowHandle(
+            title=None if win_id is not None else win_title,
+            window_id=win_id,
+            window=target_win,
+            expires_at=time.monotonic() + WINDOW_HANDLE_TTL_S,
+        )
+        return {
+            "handle": handle,
+            "title": win_title,
+            "window_id": win_id,
+            "ttl_seconds": WINDOW_HANDLE_TTL_S,
+            "message": f"Window '{win_title}' resolved"
+        }
+    except WindowNotFoundError as e:
+        logger.warning(f"Window not found for resolve request: {e!s}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error_type": "window_not_found", "message": str(e)})
+    except Exception as e:
+        logger.error(f"Error resolving window: {e!s}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "window_error", "message": f"Resolve window failed: {e!s}"}
+        )
+
 # SYSTEM INFO APIs
 @router.get(
     "/get_screen_resolution",
@@ -437,8 +946,8 @@ async def api_list_windows() -> list[dict[str, Any]]:
 async def api_get_screen_resolution():
     logger.info("API Get Screen Resolution request received.")
     try:
-        import pyautogui
-        width, height = pyautogui.size()
+        # Only a cache miss needs the display server, and that call must not block the event loop
+        width, height = _fresh_screen_size() or await to_thread_fast(_refresh_screen_size)
         return {
             "width": width,
             "height": height,
@@ -460,8 +969,7 @@ async def api_get_screen_resolution():
 async def api_get_mouse_position():
     logger.info("API Get Mouse Position request received.")
     try:
-        import pyautogui
-        x, y = pyautogui.position()
+        x, y = await to_thread_fast(pyautogui.position)
         return {
             "x": x,
             "y": y,
@@ -483,27 +991,7 @@ async def api_get_mouse_position():
 async def api_get_system_info():
     logger.info("API Get System Info request received.")
     try:
-        import platform
-        import psutil
-        import pyautogui
-        
-        # Get screen count
-        try:
-            screen_count = len(pyautogui.getAllDisplays())
-        except:
-            screen_count = 1
-            
-        system_info = {
-            "os": platform.system(),
-            "os_version": platform.version(),
-            "platform": platform.platform(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "cpu_count": psutil.cpu_count(),
-            "memory_gb": round(psutil.virtual_memory().total / (1024**3), 2),
-            "screen_count": screen_count,
-            "python_version": platform.python_version()
-        }
+        system_info = await to_thread_fast(_collect_system_info)
         
         return {
             **system_info,
@@ -526,9 +1014,8 @@ async def api_get_system_info():
 async def api_double_click(data: ClickRequest):
     logger.info(f"API Double Click request: ({data.x}, {data.y}) with {data.button} button")
     try:
-        await asyncio.to_thread(input_backend.click, (data.x, data.y), data.button)
-        await asyncio.to_thread(time.sleep, 0.1)  # Short delay between clicks
-        await asyncio.to_thread(input_backend.click, (data.x, data.y), data.button)
+        async with _input_lock:
+            await to_thread_fast(input_backend.double_click, (data.x, data.y), data.button)
         
         return {
             "success": True,
@@ -538,7 +1025,7 @@ async def api_double_click(data: ClickRequest):
             "message": f"Double click completed at ({data.x}, {data.y}) with {data.button} button"
         }
     except Exception as e:
-        logger.error(f"Error during double click: {e!s}", exc_info=True)
+        logger.error(f"Error during double click: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Double click failed: {e!s}"}
@@ -553,7 +1040,8 @@ async def api_double_click(data: ClickRequest):
 async def api_right_click(data: ClickRequest):
     logger.info(f"API Right Click request: ({data.x}, {data.y})")
     try:
-        await asyncio.to_thread(input_backend.click, (data.x, data.y), "right")
+        async with _input_lock:
+            await to_thread_fast(input_backend.click, (data.x, data.y), "right")
         
         return {
             "success": True,
@@ -563,7 +1051,7 @@ async def api_right_click(data: ClickRequest):
             "message": f"Right click completed at ({data.x}, {data.y})"
         }
     except Exception as e:
-        logger.error(f"Error during right click: {e!s}", exc_info=True)
+        logger.error(f"Error during right click: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Right click failed: {e!s}"}
@@ -578,7 +1066,8 @@ async def api_right_click(data: ClickRequest):
 async def api_mouse_move(data: MouseMoveRequest):
     logger.info(f"API Mouse Move request: ({data.x}, {data.y})")
     try:
-        await asyncio.to_thread(input_backend.move, (data.x, data.y))
+        async with _input_lock:
+            await to_thread_fast(input_backend.move, (data.x, data.y))
         
         return {
             "success": True,
@@ -587,7 +1076,7 @@ async def api_mouse_move(data: MouseMoveRequest):
             "message": f"Mouse moved to ({data.x}, {data.y})"
         }
     except Exception as e:
-        logger.error(f"Error during mouse move: {e!s}", exc_info=True)
+        logger.error(f"Error during mouse move: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Mouse move failed: {e!s}"}
@@ -602,13 +1091,12 @@ async def api_mouse_move(data: MouseMoveRequest):
 async def api_mouse_drag(data: MouseDragRequest):
     logger.info(f"API Mouse Drag request: ({data.start_x}, {data.start_y}) to ({data.end_x}, {data.end_y})")
     try:
-        await asyncio.to_thread(
-            input_backend.drag, 
-            (data.start_x, data.start_y), 
-            (data.end_x, data.end_y), 
-            data.button, 
-            data.duration
-        )
+        drag_args = ((data.start_x, data.start_y), (data.end_x, data.end_y), data.button, data.duration)
+        async with _input_lock:
+            if _input_drag_async is not None:
+                await _input_drag_async(*drag_args)
+            else:
+                await to_thread_fast(input_backend.drag, *drag_args)
         
         return {
             "success": True,
@@ -621,7 +1109,7 @@ async def api_mouse_drag(data: MouseDragRequest):
             "message": f"Mouse drag completed from ({data.start_x}, {data.start_y}) to ({data.end_x}, {data.end_y})"
         }
     except Exception as e:
-        logger.error(f"Error during mouse drag: {e!s}", exc_info=True)
+        logger.error(f"Error during mouse drag: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Mouse drag failed: {e!s}"}
@@ -636,11 +1124,10 @@ async def api_mouse_drag(data: MouseDragRequest):
 async def api_mouse_scroll(data: MouseScrollRequest):
     logger.info(f"API Mouse Scroll request: data.dx={data.dx}, data.dy={data.dy} at ({data.x}, {data.y})")
     try:
-        # Move to coordinates if specified
-        if data.x is not None and data.y is not None:
-            await asyncio.to_thread(input_backend.move, (data.x, data.y))
-            
-        await asyncio.to_thread(input_backend.scroll, data.dx, data.dy)
+        # The backend moves to the coordinates (if specified) and scrolls in one call
+        point = (data.x, data.y) if data.x is not None and data.y is not None else None
+        async with _input_lock:
+            await to_thread_fast(input_backend.scroll, data.dx, data.dy, point)
         
         return {
             "success": True,
@@ -651,7 +1138,7 @@ async def api_mouse_scroll(data: MouseScrollRequest):
             "message": f"Mouse scroll completed: dx={data.dx}, dy={data.dy}"
         }
     except Exception as e:
-        logger.error(f"Error during mouse scroll: {e!s}", exc_info=True)
+        logger.error(f"Error during mouse scroll: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Mouse scroll failed: {e!s}"}
@@ -660,47 +1147,39 @@ async def api_mouse_scroll(data: MouseScrollRequest):
 # WINDOW MANAGEMENT APIs
 @router.post(
     "/get_window_info",
-    response_model=dict[str, Any],
+    response_model=WindowInfoResponse,
     summary="Get Window Info",
     description="Get detailed information about a window"
 )
 async def api_get_window_info(window_spec: FocusRequestData):
-    logger.info(f"API Get Window Info request: {window_spec.title or window_spec.window_id}")
+    logger.info(f"API Get Window Info request: {window_spec.identifier}")
     try:
-        target_win = await asyncio.to_thread(
-            window.get_window,
-            title=window_spec.title,
-            window_id=window_spec.window_id
+        _, (win_title, win_id, win_bbox, is_visible, is_active, is_alive, backend_name) = await _with_target_window(
+            window_spec, _collect_window_info
         )
         
-        win_title = await asyncio.to_thread(lambda: target_win.title)
-        win_id = await asyncio.to_thread(lambda: target_win.window_id)
-        win_bbox = await asyncio.to_thread(lambda: target_win.bbox)
-        is_visible = await asyncio.to_thread(lambda: target_win.is_visible())
-        is_active = await asyncio.to_thread(lambda: target_win.is_active())
-        is_alive = await asyncio.to_thread(lambda: target_win.is_alive())
-        
-        return {
-            "title": win_title,
-            "window_id": win_id,
-            "bbox": {
-                "left": win_bbox[0],
-                "top": win_bbox[1], 
-                "width": win_bbox[2],
-                "height": win_bbox[3]
-            },
-            "is_visible": is_visible,
-            "is_active": is_active,
-            "is_alive": is_alive,
-            "backend": target_win._backend_name_used,
-            "message": f"Window info for '{win_title}'"
-        }
+        return WindowInfoResponse(
+            title=win_title,
+            window_id=win_id,
+            bbox=WindowBBoxData(left=win_bbox[0], top=win_bbox[1], width=win_bbox[2], height=win_bbox[3]),
+            is_visible=is_visible,
+            is_active=is_active,
+            is_alive=is_alive,
+            backend=backend_name,
+            message=f"Window info for '{win_title}'"
+        )
     except WindowNotFoundError as e:
         logger.warning(f"Window not found for info request: {e!s}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error_type": "window_not_found", "message": str(e)}
         )
+    except WindowOperationError as e:
+        logger.warning(f"Window operation error getting window info: {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "window_error", "message": f"Get window info failed: {e!s}"}
+        )
     except Exception as e:
         logger.error(f"Error getting window info: {e!s}", exc_info=True)
         raise HTTPException(
@@ -710,33 +1189,34 @@ async def api_get_window_info(window_spec: FocusRequestData):
 
 @router.post(
     "/close_window",
-    response_model=dict[str, Any],
+    response_model=WindowActionResponse,
     summary="Close Window",
     description="Close a specific window"
 )
 async def api_close_window(window_spec: FocusRequestData):
-    logger.info(f"API Close Window request: {window_spec.title or window_spec.window_id}")
+    logger.info(f"API Close Window request: {window_spec.identifier}")
     try:
-        target_win = await asyncio.to_thread(
-            window.get_window,
-            title=window_spec.title,
-            window_id=window_spec.window_id
-        )
-        
-        win_title = await asyncio.to_thread(lambda: target_win.title)
-        await asyncio.to_thread(target_win.close)
+        _, win_title = await _with_target_window(window_spec, _close_window)
+        if window_spec.handle:
+            _window_handles.pop(window_spec.handle, None)
         
-        return {
-            "success": True,
-            "window_title": win_title,
-            "message": f"Window '{win_title}' closed successfully"
-        }
+        return WindowActionResponse(
+            success=True,
+            window_title=win_title,
+            message=f"Window '{win_title}' closed successfully"
+        )
     except WindowNotFoundError as e:
         logger.warning(f"Window not found for close request: {e!s}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error_type": "window_not_found", "message": str(e)}
         )
+    except WindowOperationError as e:
+        logger.warning(f"Window operation error closing window: {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "window_error", "message": f"Close window failed: {e!s}"}
+        )
     except Exception as e:
         logger.error(f"Error closing window: {e!s}", exc_info=True)
         raise HTTPException(
@@ -746,52 +1226,48 @@ async def api_close_window(window_spec: FocusRequestData):
 
 @router.post(
     "/minimize_window",
-    response_model=dict[str, Any],
+    response_model=WindowActionResponse,
     summary="Minimize Window",
     description="Minimize a specific window"
 )
 async def api_minimize_window(window_spec: FocusRequestData):
-    logger.info(f"API Minimize Window request: {window_spec.title or window_spec.window_id}")
+    logger.info(f"API Minimize Window request: {window_spec.identifier}")
     try:
-        target_win = await asyncio.to_thread(
-            window.get_window,
-            title=window_spec.title,
-            window_id=window_spec.window_id
-        )
-        
-        win_title = await asyncio.to_thread(lambda: target_win.title)
-        
         # pywinctl und pygetwindow haben unterschiedliche minimize Methoden
-        try:
-            if hasattr(target_win._window_impl, 'minimize'):
-                await asyncio.to_thread(target_win._window_impl.minimize)
-            else:
-                # Fallback for backends without minimize
-                logger.warning(f"Window backend does not support minimize for '{win_title}'")
-                return {
-                    "success": False,
-                    "window_title": win_title,
-                    "message": f"Minimize not supported for window '{win_title}' with backend {target_win._backend_name_used}"
-                }
-        except Exception as e_min:
-            logger.warning(f"Minimize operation failed for '{win_title}': {e_min!s}")
-            return {
-                "success": False,
-                "window_title": win_title,
-                "message": f"Minimize failed for window '{win_title}': {e_min!s}"
-            }
+        target_win, (win_title, supported, e_min) = await _with_target_window(window_spec, _window_state_action, "minimize")
+        if not supported:
+            # Fallback for backends without minimize
+            logger.warning(f"Window backend does not support minimize for '{win_title}'")
+            return WindowActionResponse(
+                success=False,
+                window_title=win_title,
+                message=f"Minimize not supported for window '{win_title}' with backend {target_win._backend_name_used}"
+            )
+        if e_min is not None:
+            logger.warning(f"Minimize operation failed for '{win_title}': {e_min}")
+            return WindowActionResponse(
+                success=False,
+                window_title=win_title,
+                message=f"Minimize failed for window '{win_title}': {e_min}"
+            )
         
-        return {
-            "success": True,
-            "window_title": win_title,
-            "message": f"Window '{win_title}' minimized successfully"
-        }
+        return WindowActionResponse(
+            success=True,
+            window_title=win_title,
+            message=f"Window '{win_title}' minimized successfully"
+        )
     except WindowNotFoundError as e:
         logger.warning(f"Window not found for minimize request: {e!s}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error_type": "window_not_found", "message": str(e)}
         )
+    except WindowOperationError as e:
+        logger.warning(f"Window operation error minimizing window: {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "window_error", "message": f"Minimize window failed: {e!s}"}
+        )
     except Exception as e:
         logger.error(f"Error minimizing window: {e!s}", exc_info=True)
         raise HTTPException(
@@ -801,52 +1277,48 @@ async def api_minimize_window(window_spec: FocusRequestData):
 
 @router.post(
     "/maximize_window", 
-    response_model=dict[str, Any],
+    response_model=WindowActionResponse,
     summary="Maximize Window",
     description="Maximize a specific window"
 )
 async def api_maximize_window(window_spec: FocusRequestData):
-    logger.info(f"API Maximize Window request: {window_spec.title or window_spec.window_id}")
+    logger.info(f"API Maximize Window request: {window_spec.identifier}")
     try:
-        target_win = await asyncio.to_thread(
-            window.get_window,
-            title=window_spec.title,
-            window_id=window_spec.window_id
-        )
-        
-        win_title = await asyncio.to_thread(lambda: target_win.title)
-        
         # pywinctl und pygetwindow haben unterschiedliche maximize Methoden
-        try:
-            if hasattr(target_win._window_impl, 'maximize'):
-                await asyncio.to_thread(target_win._window_impl.maximize)
-            else:
-                # Fallback for backends without maximize
-                logger.warning(f"Window backend does not support maximize for '{win_title}'")
-                return {
-                    "success": False,
-                    "window_title": win_title,
-                    "message": f"Maximize not supported for window '{win_title}' with backend {target_win._backend_name_used}"
-                }
-        except Exception as e_max:
-            logger.warning(f"Maximize operation failed for '{win_title}': {e_max!s}")
-            return {
-                "success": False,
-                "window_title": win_title,
-                "message": f"Maximize failed for window '{win_title}': {e_max!s}"
-            }
+        target_win, (win_title, supported, e_max) = await _with_target_window(window_spec, _window_state_action, "maximize")
+        if not supported:
+            # Fallback for backends without maximize
+            logger.warning(f"Window backend does not support maximize for '{win_title}'")
+            return WindowActionResponse(
+                success=False,
+                window_title=win_title,
+                message=f"Maximize not supported for window '{win_title}' with backend {target_win._backend_name_used}"
+            )
+        if e_max is not None:
+            logger.warning(f"Maximize operation failed for '{win_title}': {e_max}")
+            return WindowActionResponse(
+                success=False,
+                window_title=win_title,
+                message=f"Maximize failed for window '{win_title}': {e_max}"
+            )
         
-        return {
-            "success": True,
-            "window_title": win_title,
-            "message": f"Window '{win_title}' maximized successfully"
-        }
+        return WindowActionResponse(
+            success=True,
+            window_title=win_title,
+            message=f"Window '{win_title}' maximized successfully"
+        )
     except WindowNotFoundError as e:
         logger.warning(f"Window not found for maximize request: {e!s}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error_type": "window_not_found", "message": str(e)}
         )
+    except WindowOperationError as e:
+        logger.warning(f"Window operation error maximizing window: {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "window_error", "message": f"Maximize window failed: {e!s}"}
+        )
     except Exception as e:
         logger.error(f"Error maximizing window: {e!s}", exc_info=True)
         raise HTTPException(
@@ -861,7 +1333,10 @@ async def api_maximize_window(window_spec: FocusRequestData):
     summary="Screenshot Region",
     description="Take screenshot of a specific screen region"
 )
-async def api_screenshot_region(data: ScreenshotRegionRequest):
+async def api_screenshot_region(
+    data: ScreenshotRegionRequest,
+    compress_level: int = Query(DEFAULT_PNG_COMPRESS_LEVEL, ge=0, le=9, description="PNG zlib level; higher values trade encode time for smaller payloads."),
+):
     logger.info(f"API Screenshot Region request: ({data.x}, {data.y}) {data.width}x{data.height}")
     try:
         # Create bbox for region
@@ -870,19 +1345,24 @@ async def api_screenshot_region(data: ScreenshotRegionRequest):
         # Take screenshot of region
         img: Image = await capture.screenshot_async(region_bbox, img_format="PNG")
         
-        # Convert to base64
-        buffer = io.BytesIO()
-        await asyncio.to_thread(img.save, buffer, format="PNG", optimize=True)
-        img_base64_str: str = base64.b64encode(buffer.getvalue()).decode('utf-8')
+        # Encode and convert to base64 in one worker call
+        img_base64_str: str = await to_thread_fast(_encode_image_base64, img, data.encoding, compress_level)
         
         return {
             "image_base64": img_base64_str,
             "width": data.width,
             "height": data.height,
-            "format": "PNG",
+            "format": data.encoding.upper(),
+            "mode": img.mode,
             "region": {"x": data.x, "y": data.y, "width": data.width, "height": data.height},
             "message": f"Screenshot region captured: ({data.x}, {data.y}) {data.width}x{data.height}"
         }
+    except capture.CaptureError as e:
+        logger.warning(f"Error taking region screenshot: {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "capture_error", "message": f"Screenshot region failed: {e!s}"}
+        )
     except Exception as e:
         logger.error(f"Error taking region screenshot: {e!s}", exc_info=True)
         raise HTTPException(
@@ -890,7 +1370,88 @@ async def api_screenshot_region(data: ScreenshotRegionRequest):
             detail={"error_type": "capture_error", "message": f"Screenshot region failed: {e!s}"}
         )
 
+@router.post(
+    "/screenshot_region/raw",
+    response_class=StreamingResponse,
+    summary="Screenshot Region (raw bytes)",
+    description="Takes a screenshot of a specific screen region and streams the encoded bytes directly (no base64/JSON envelope). "
+                "Image dimensions and pixel mode are returned in the X-Image-Width / X-Image-Height / X-Image-Mode headers; "
+                "with encoding 'raw' the body is the uncompressed pixel data."
+)
+async def api_screenshot_region_raw(
+    data: ScreenshotRegionRequest,
+    compress_level: int = Query(DEFAULT_PNG_COMPRESS_LEVEL, ge=0, le=9, description="PNG zlib level; higher values trade encode time for smaller payloads."),
+):
+    logger.info(f"API Raw Screenshot Region request: ({data.x}, {data.y}) {data.width}x{data.height}")
+    try:
+        region_bbox: BBox = (data.x, data.y, data.width, data.height)
+        if data.encoding == "png":
+            # No Pillow work needed: capture straight to PNG bytes
+            payload = await capture.screenshot_png_bytes_async(region_bbox, compress_level)
+            width, height, mode = data.width, data.height, "RGB"
+        else:
+            img: Image = await capture.screenshot_async(region_bbox)
+            payload = await to_thread_fast(_encode_image, img, data.encoding, compress_level)
+            width, height, mode = img.width, img.height, img.mode
+        return StreamingResponse(
+            _iter_buffer_chunks(payload),
+            media_type=IMAGE_MEDIA_TYPES[data.encoding],
+            headers={
+                "Content-Length": str(len(payload)),
+                "X-Image-Width": str(width),
+                "X-Image-Height": str(height),
+                "X-Image-Mode": mode,
+            },
+        )
+    except capture.CaptureError as e:
+        logger.warning(f"Error taking raw region screenshot: {e!s}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "capture_error", "message": f"Screenshot region failed: {e!s}"}
+        )
+    except Exception as e:
+        logger.error(f"Error taking raw region screenshot: {e!s}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error_type": "capture_error", "message": f"Screenshot region failed: {e!s}"}
+        )
+
 # KEYBOARD CONTROL APIs
+# Map common special key names (built once, read-only)
+_SPECIAL_KEY_MAP: types.MappingProxyType[str, str] = types.MappingProxyType({
+    "enter": "enter",
+    "return": "enter",
+    "escape": "esc",
+    "tab": "tab",
+    "space": "space",
+    "delete": "delete",
+    "backspace": "backspace",
+    "home": "home",
+    "end": "end",
+    "pageup": "pageup",
+    "pagedown": "pagedown",
+    "arrowup": "up",
+    "arrowdown": "down",
+    "arrowleft": "left",
+    "arrowright": "right",
+})
+
+def _press_combo(modifiers: list[str], keys: list[str]) -> None:
+    """Holds the modifiers, presses the keys, and releases the modifiers in reverse order, in one worker call."""
+    held: list[str] = []
+    try:
+        # Press modifiers first
+        for modifier in modifiers:
+            input_backend.keydown(modifier)
+            held.append(modifier)
+        # Press main keys
+        for key in keys:
+            input_backend.press(key)
+    finally:
+        # Release modifiers, also when a key press failed, so none stays stuck down
+        for modifier in reversed(held):
+            input_backend.keyup(modifier)
+
 @router.post(
     "/key_combination",
     response_model=dict[str, Any],
@@ -898,29 +1459,21 @@ async def api_screenshot_region(data: ScreenshotRegionRequest):
     description="Press key combination (e.g., Ctrl+C)"
 )
 async def api_key_combination(data: KeyCombinationRequest):
-    logger.info(f"API Key Combination request: {'+'.join(data.modifiers + data.keys)}")
+    combination = '+'.join(data.modifiers + data.keys)
+    logger.info(f"API Key Combination request: {combination}")
     try:
-        # Press modifiers first
-        for modifier in data.modifiers:
-            await asyncio.to_thread(input_backend.keydown, modifier)
-            
-        # Press main keys
-        for key in data.keys:
-            await asyncio.to_thread(input_backend.press, key)
-            
-        # Release modifiers
-        for modifier in reversed(data.modifiers):
-            await asyncio.to_thread(input_backend.keyup, modifier)
+        async with _input_lock:
+            await to_thread_fast(_press_combo, data.modifiers, data.keys)
         
         return {
             "success": True,
             "keys": data.keys,
             "modifiers": data.modifiers,
-            "combination": '+'.join(data.modifiers + data.keys),
-            "message": f"Key combination '{'+'.join(data.modifiers + data.keys)}' pressed"
+            "combination": combination,
+            "message": f"Key combination '{combination}' pressed"
         }
     except Exception as e:
-        logger.error(f"Error pressing key combination: {e!s}", exc_info=True)
+        logger.error(f"Error pressing key combination: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Key combination failed: {e!s}"}
@@ -935,29 +1488,11 @@ async def api_key_combination(data: KeyCombinationRequest):
 async def api_send_special_key(data: SpecialKeyRequest):
     logger.info(f"API Send Special Key request: {data.special_key}")
     try:
-        # Map common special key names
-        key_mapping = {
-            "enter": "enter",
-            "return": "enter", 
-            "escape": "esc",
-            "tab": "tab",
-            "space": "space",
-            "delete": "delete",
-            "backspace": "backspace",
-            "home": "home",
-            "end": "end",
-            "pageup": "pageup",
-            "pagedown": "pagedown",
-            "arrowup": "up",
-            "arrowdown": "down", 
-            "arrowleft": "left",
-            "arrowright": "right"
-        }
-        
         # Get the correct key name
-        key_to_press = key_mapping.get(data.special_key.lower(), data.special_key)
+        key_to_press = _SPECIAL_KEY_MAP.get(data.special_key.lower(), data.special_key)
         
-        await asyncio.to_thread(input_backend.press, key_to_press)
+        async with _input_lock:
+            await to_thread_fast(input_backend.press, key_to_press)
         
         return {
             "success": True,
@@ -966,7 +1501,7 @@ async def api_send_special_key(data: SpecialKeyRequest):
             "message": f"Special key '{data.special_key}' sent"
         }
     except Exception as e:
-        logger.error(f"Error sending special key: {e!s}", exc_info=True)
+        logger.error(f"Error sending special key: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Send special key failed: {e!s}"}
@@ -981,7 +1516,8 @@ async def api_send_special_key(data: SpecialKeyRequest):
 async def api_key_hold(data: KeyHoldRequest):
     logger.info(f"API Key Hold request: {data.key}")
     try:
-        await asyncio.to_thread(input_backend.keydown, data.key)
+        async with _input_lock:
+            await to_thread_fast(input_backend.keydown, data.key)
         
         return {
             "success": True,
@@ -989,7 +1525,7 @@ async def api_key_hold(data: KeyHoldRequest):
             "message": f"Key '{data.key}' held down"
         }
     except Exception as e:
-        logger.error(f"Error holding key: {e!s}", exc_info=True)
+        logger.error(f"Error holding key: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Key hold failed: {e!s}"}
@@ -1004,7 +1540,8 @@ async def api_key_hold(data: KeyHoldRequest):
 async def api_key_release(data: KeyReleaseRequest):
     logger.info(f"API Key Release request: {data.key}")
     try:
-        await asyncio.to_thread(input_backend.keyup, data.key)
+        async with _input_lock:
+            await to_thread_fast(input_backend.keyup, data.key)
         
         return {
             "success": True,
@@ -1012,7 +1549,7 @@ async def api_key_release(data: KeyReleaseRequest):
             "message": f"Key '{data.key}' released"
         }
     except Exception as e:
-        logger.error(f"Error releasing key: {e!s}", exc_info=True)
+        logger.error(f"Error releasing key: {e!s}", exc_info=logger.isEnabledFor(logging.DEBUG))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error_type": "input_error", "message": f"Key release failed: {e!s}"}
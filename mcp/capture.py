@@ -7,19 +7,52 @@ cropping and saving functionality.
 from __future__ import annotations # Still good practice for type hints within class methods referring to the class itself
 
 import asyncio
+import collections
+import concurrent.futures
 import pathlib
+import threading
+import weakref
+from collections.abc import Iterator
 from PIL import Image # type: ignore[import-untyped] # If Pillow stubs are not perfect
 
+from mcp import _IS_WINDOWS
+from mcp._threads import to_thread_fast
 from mcp.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bound once at import instead of an import statement + attribute lookup per screenshot. The module
+# still loads without pyautogui (or without a display, where its import raises); capture then fails.
+try:
+    import pyautogui as _pag
+    _pag_screenshot = _pag.screenshot
+except Exception as e: # ImportError, or Xlib/display errors raised while pyautogui initialises
+    _pag = _pag_screenshot = None
+    _pag_import_error: Exception | None = e
+else:
+    _pag_import_error = None
+
+try:
+    import mss # Grabs just the requested sub-rectangle (BitBlt / XGetImage / CGWindowListCreateImage)
+    import mss.tools
+    from mss.exception import ScreenShotError as _MssError
+except ImportError:
+    mss = None
+    _MssError = OSError
+
+_mss_local = threading.local() # mss instances are not thread-safe: one per worker thread
+
+_pyautogui_settings: tuple[bool, float] | None = None # Last applied (disable_fail_safe, pause_duration)
+
 # Type alias for bounding box using Python 3.12 'type' statement (PEP 695)
 type BBox = tuple[int, int, int, int]  # (left, top, width, height)
 
 __all__ = [
     "screenshot",
     "screenshot_async",
+    "screenshot_png_bytes",
+    "encode_image",
+    "screenshot_png_bytes_async",
     "CaptureError",
     "BBox",
 ]
@@ -46,7 +79,56 @@ def validate_bbox(bbox: BBox) -> None:
     if left < 0 or top < 0:
         # Negative coordinates might be valid in multi-monitor setups,
         # but for single window captures, they are unusual.
-        logger.warning(f"Bounding box has negative top-left coordinates: left={left}, top={top}.")
+        # %-style: the message is only formatted if a handler actually emits the record.
+        logger.warning("Bounding box has negative top-left coordinates: left=%s, top=%s.", left, top)
+
+class _BytearrayWriter:
+    """Minimal write-only file object: Pillow appends encoded chunks to a bytearray, with no getvalue() copy."""
+    __slots__ = ("data",)
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def write(self, chunk: bytes) -> int:
+        self.data += chunk
+        return len(chunk)
+
+    def flush(self) -> None:
+        pass
+
+def encode_image(img: Image.Image, img_format: str, **save_options) -> bytearray:
+    """Encodes an image (e.g. "PNG" with compress_level=1) and returns the encoded bytes as a bytearray."""
+    writer = _BytearrayWriter()
+    img.save(writer, format=img_format, **save_options)
+    return writer.data
+
+def _thread_mss():
+    """
+    Returns this thread's mss instance, creating it on first use. Executor threads keep theirs for
+    their lifetime; it is closed (X display / DCs released) when the thread object goes away or at exit.
+    """
+    sct = getattr(_mss_local, "sct", None)
+    if sct is None:
+        sct = _mss_local.sct = mss.mss()
+        weakref.finalize(threading.current_thread(), sct.close)
+    return sct
+
+def _grab_region(left: int, top: int, width: int, height: int) -> Image.Image | None:
+    """
+    Grabs a screen region as an RGB image. Uses this thread's mss instance when mss is installed;
+    falls back to pyautogui (a full-screen grab plus crop on some platforms) otherwise or if mss fails.
+    """
+    if mss is not None:
+        try:
+            raw = _thread_mss().grab({"left": left, "top": top, "width": width, "height": height})
+            # BGRA -> RGB in Pillow's C decoder instead of mss's Python-level .rgb conversion
+            return Image.frombytes("RGB", raw.size, raw.bgra, "raw", "BGRX")
+        except _MssError as e:
+            if _pag_screenshot is None:
+                raise
+            logger.debug(f"mss capture failed ({e}), falling back to pyautogui")
+    # pyautogui.screenshot may return None or raise an error on failure.
+    return _pag_screenshot(region=(left, top, width, height))
 
 def screenshot(
     bbox: BBox,
@@ -77,24 +159,27 @@ def screenshot(
         CaptureError: If screenshot capture fails.
         ValueError: If parameters are invalid.
     """
-    import pyautogui # Import pyautogui here to potentially allow module to load even if pyautogui is missing for some reason.
+    if _IS_WINDOWS:
+        from mcp._win_dpi import ensure_per_monitor_dpi
+        ensure_per_monitor_dpi() # Window bboxes are physical pixels only once DPI aware
 
     validate_bbox(bbox)
     logger.debug(
-        f"Capturing screenshot: bbox={bbox}, crop={crop}, "
-        f"save_path={save_path}, format={img_format}"
+        "Capturing screenshot: bbox=%s, crop=%s, save_path=%s, format=%s",
+        bbox, crop, save_path, img_format,
     )
 
+    if mss is None and _pag_screenshot is None:
+        raise CaptureError(f"pyautogui is not available for screen capture: {_pag_import_error}")
+
     try:
         # Capture the specified region
-        left, top, width, height = bbox
-        # pyautogui.screenshot may return None or raise an error on failure.
-        img: Image.Image | None = pyautogui.screenshot(region=(left, top, width, height))
+        img: Image.Image | None = _grab_region(*bbox)
 
         if img is None:
             raise CaptureError("pyautogui.screenshot() returned None. Capture failed.")
 
-        logger.debug(f"Screenshot captured: {img.width}x{img.height}")
+        logger.debug("Screenshot captured: %sx%s", img.width, img.height)
 
         # Apply crop if specified
         if crop is not None:
@@ -139,6 +224,34 @@ def screenshot(
             raise
         raise CaptureError(f"An unexpected error occurred during screenshot capture: {e}") from e
 
+def screenshot_png_bytes(bbox: BBox, compress_level: int = 1) -> bytes | bytearray:
+    """
+    Captures a region straight to PNG bytes, for callers that need no Pillow operations.
+
+    With mss installed the capture buffer goes to mss's PNG writer without building a PIL image;
+    otherwise (or if mss fails) this falls back to screenshot() plus a Pillow PNG encode.
+
+    Raises:
+        CaptureError: If screenshot capture fails.
+        ValueError: If the bbox is invalid.
+    """
+    if mss is not None:
+        if _IS_WINDOWS:
+            from mcp._win_dpi import ensure_per_monitor_dpi
+            ensure_per_monitor_dpi()
+        validate_bbox(bbox)
+        left, top, width, height = bbox
+        try:
+            raw = _thread_mss().grab({"left": left, "top": top, "width": width, "height": height})
+            return mss.tools.to_png(raw.rgb, raw.size, level=compress_level)
+        except _MssError as e:
+            logger.debug(f"mss PNG capture failed ({e}), falling back to screenshot()")
+    return encode_image(screenshot(bbox), "PNG", compress_level=compress_level)
+
+async def screenshot_png_bytes_async(bbox: BBox, compress_level: int = 1) -> bytes | bytearray:
+    """Runs screenshot_png_bytes() in a worker thread."""
+    return await to_thread_fast(screenshot_png_bytes, bbox, compress_level)
+
 async def screenshot_async(
     bbox: BBox,
     **kwargs,
@@ -146,7 +259,7 @@ async def screenshot_async(
     """
     Asynchronous wrapper for screenshot capture.
 
-    Uses asyncio.to_thread to avoid blocking the event loop.
+    Uses to_thread_fast (an asyncio.to_thread equivalent) to avoid blocking the event loop.
     All parameters are identical to screenshot() and forwarded directly.
 
     Args:
@@ -158,18 +271,62 @@ async def screenshot_async(
 
     Raises:
         CaptureError: If screenshot capture fails.
+        ValueError: If parameters are invalid.
     """
-    logger.debug(f"Asynchronous screenshot requested for bbox: {bbox}")
+    # screenshot() already logs and wraps unexpected errors in CaptureError; nothing to add here
+    return await to_thread_fast(screenshot, bbox, **kwargs)
+
+MAX_PARALLEL_REGION_CAPTURES = 8 # Grabs and PNG saves release the GIL, so regions capture concurrently
+
+def _capture_region(i: int, bbox: BBox, save_dir: pathlib.Path | None, img_format: str) -> Image.Image | None:
+    """Captures (and optionally saves) region i. Failures are logged and return None."""
     try:
-        # Run the synchronous screenshot function in a separate thread
-        return await asyncio.to_thread(screenshot, bbox, **kwargs)
-    except Exception as e: # Catch any exception from the thread
-        logger.error(f"Asynchronous screenshot failed: {e}", exc_info=True)
-        # Re-raise as CaptureError or allow original exception type?
-        # For consistency, let's wrap it if it's not already a CaptureError/ValueError.
-        if isinstance(e, (CaptureError, ValueError)):
-            raise
-        raise CaptureError(f"Async screenshot task failed: {e}") from e
+        current_save_path = save_dir / f"region_{i}.{img_format.lower()}" if save_dir else None
+        return screenshot(bbox, save_path=current_save_path, img_format=img_format)
+    except Exception as e:
+        # Log the error for the specific region but continue with others
+        logger.error(f"Failed to capture region {i} (bbox: {bbox}): {e}", exc_info=True)
+        return None
+
+def capture_multiple_regions_iter(
+    regions: list[BBox],
+    save_dir: pathlib.Path | None = None,
+    img_format: str = "PNG",
+    max_in_flight: int = MAX_PARALLEL_REGION_CAPTURES,
+) -> Iterator[Image.Image]:
+    """
+    Yields region screenshots in region order (failed regions are skipped) without collecting them.
+
+    At most `max_in_flight` captures run or wait to be consumed at any time, so a caller that saves
+    or processes each image and drops it holds that many images in memory, not len(regions).
+    Use max_in_flight=1 for strictly sequential capture.
+
+    Args:
+        regions: A list of BBox tuples to capture.
+        save_dir: Optional directory to save screenshots.
+                  Files will be named region_0.png, region_1.png, etc.
+        img_format: Image format for saving (default: "PNG").
+        max_in_flight: Maximum number of concurrent captures.
+    """
+    if not regions:
+        return
+    if save_dir:
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+    max_in_flight = max(1, min(max_in_flight, len(regions)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="mcp-capture") as executor:
+        pending: collections.deque[concurrent.futures.Future] = collections.deque()
+        for i, bbox in enumerate(regions):
+            pending.append(executor.submit(_capture_region, i, bbox, save_dir, img_format))
+            if len(pending) < max_in_flight:
+                continue
+            img = pending.popleft().result()
+            if img is not None:
+                yield img
+        while pending:
+            img = pending.popleft().result()
+            if img is not None:
+                yield img
 
 def capture_multiple_regions(
     regions: list[BBox],
@@ -177,7 +334,8 @@ def capture_multiple_regions(
     img_format: str = "PNG",
 ) -> list[Image.Image]:
     """
-    Captures screenshots of multiple regions.
+    Captures screenshots of multiple regions, up to MAX_PARALLEL_REGION_CAPTURES at a time.
+    List form of capture_multiple_regions_iter(); prefer the iterator when images are consumed one by one.
 
     Args:
         regions: A list of BBox tuples to capture.
@@ -186,28 +344,36 @@ def capture_multiple_regions(
         img_format: Image format for saving (default: "PNG").
 
     Returns:
-        A list of captured PIL.Image.Image objects.
+        A list of captured PIL.Image.Image objects, in region order (failed regions are skipped).
     """
     if not regions:
         logger.info("No regions provided to capture_multiple_regions.")
         return []
 
     logger.info(f"Attempting to capture {len(regions)} regions.")
-    captured_screenshots: list[Image.Image] = []
-
-    for i, bbox in enumerate(regions):
-        try:
-            current_save_path = None
-            if save_dir:
-                save_dir.mkdir(parents=True, exist_ok=True)
-                current_save_path = save_dir / f"region_{i}.{img_format.lower()}"
+    captured_screenshots = list(capture_multiple_regions_iter(regions, save_dir, img_format))
+    logger.info(f"Successfully captured {len(captured_screenshots)}/{len(regions)} regions.")
+    return captured_screenshots
 
-            img = screenshot(bbox, save_path=current_save_path, img_format=img_format)
-            captured_screenshots.append(img)
-        except Exception as e:
-            # Log the error for the specific region but continue with others
-            logger.error(f"Failed to capture region {i} (bbox: {bbox}): {e}", exc_info=True)
+async def capture_multiple_regions_async(
+    regions: list[BBox],
+    save_dir: pathlib.Path | None = None,
+    img_format: str = "PNG",
+) -> list[Image.Image]:
+    """
+    Async counterpart of capture_multiple_regions(): all regions are submitted to the event loop's
+    default executor at once and gathered. Same arguments and result.
+    """
+    if not regions:
+        logger.info("No regions provided to capture_multiple_regions_async.")
+        return []
 
+    if save_dir:
+        save_dir.mkdir(parents=True, exist_ok=True)
+    results = await asyncio.gather(
+        *(to_thread_fast(_capture_region, i, bbox, save_dir, img_format) for i, bbox in enumerate(regions))
+    )
+    captured_screenshots = [img for img in results if img is not None]
     logger.info(f"Successfully captured {len(captured_screenshots)}/{len(regions)} regions.")
     return captured_screenshots
 
@@ -223,14 +389,23 @@ def configure_pyautogui_performance(
                            (moving mouse to a corner to abort). Use with caution.
         pause_duration: Duration in seconds to pause after each PyAutoGUI call.
                         Default is 0.0 (no pause).
+
+    Repeating a call with the settings already applied is a no-op.
     """
-    import pyautogui # Local import
+    global _pyautogui_settings
+    if _pag is None:
+        logger.warning(f"pyautogui is not available, cannot configure it: {_pag_import_error}")
+        return
+    if _pyautogui_settings == (disable_fail_safe, pause_duration):
+        return
+    _pyautogui_settings = (disable_fail_safe, pause_duration)
+
     if disable_fail_safe:
         logger.warning("Disabling PyAutoGUI fail-safe mechanism. Use with extreme caution.")
-        pyautogui.FAILSAFE = False
+        _pag.FAILSAFE = False
 
     if pause_duration >= 0:
-        pyautogui.PAUSE = pause_duration
+        _pag.PAUSE = pause_duration
         logger.info(f"PyAutoGUI PAUSE duration set to {pause_duration} seconds.")
     else:
         logger.warning(f"Invalid pause_duration ({pause_duration}) for PyAutoGUI. Must be non-negative.")
\ No newline at end of file
@@ -11,12 +11,14 @@ selected platform's input functions or the dummy backend.
 import sys
 from typing import Tuple, Any # For type hints in DummyInputBackend
 
+from mcp import _IS_LINUX, _IS_MACOS, _IS_WINDOWS
+
 # Dynamically select and import the platform-specific backend
-if sys.platform == "win32":
+if _IS_WINDOWS:
     from . import win as backend
-elif sys.platform == "darwin": # macOS
+elif _IS_MACOS: # macOS
     from . import mac as backend
-elif sys.platform.startswith("linux"): # Covers various Linux distributions
+elif _IS_LINUX: # Covers various Linux distributions
     from . import linux as backend
 else:  # pragma: no cover (Covers unsupported platforms)
     print(
@@ -30,16 +32,15 @@ else:  # pragma: no cover (Covers unsupported platforms)
         A dummy input backend that logs attempted actions to stderr.
         Used when DesktopControllerMCP-MCP is run on an unsupported platform for input control.
         """
+        __slots__ = () # Stateless; no per-instance __dict__
+
         def _log_action(self, action_name: str, *args: Any, **kwargs: Any) -> None:
-            arg_str = ", ".join(map(str, args))
-            kwarg_str = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-            log_msg = f"DummyInputBackend: {action_name}("
-            if arg_str: log_msg += arg_str
-            if kwarg_str:
-                if arg_str: log_msg += ", "
-                log_msg += kwarg_str
-            log_msg += ")"
-            print(log_msg, file=sys.stderr)
+            if not args and not kwargs:
+                print(f"DummyInputBackend: {action_name}()", file=sys.stderr)
+                return
+            params = [str(a) for a in args]
+            params.extend(f"{k}={v}" for k, v in kwargs.items())
+            print(f"DummyInputBackend: {action_name}({', '.join(params)})", file=sys.stderr)
 
         def move(self, point: tuple[int, int], *args: Any, **kwargs: Any) -> None:
             self._log_action("move", point, *args, **kwargs)
@@ -47,6 +48,9 @@ else:  # pragma: no cover (Covers unsupported platforms)
         def click(self, point: tuple[int, int], button: str = "left", *args: Any, **kwargs: Any) -> None:
             self._log_action("click", point, button=button, *args, **kwargs)
 
+        def double_click(self, point: tuple[int, int], button: str = "left", *args: Any, **kwargs: Any) -> None:
+            self._log_action("double_click", point, button=button, *args, **kwargs)
+
         def mousedown(self, point: tuple[int, int], button: str = "left", *args: Any, **kwargs: Any) -> None:
             self._log_action("mousedown", point, button=button, *args, **kwargs)
 
@@ -56,8 +60,8 @@ else:  # pragma: no cover (Covers unsupported platforms)
         def drag(self, start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5, *args: Any, **kwargs: Any) -> None:
             self._log_action("drag", start_point, end_point, button=button, duration=duration, *args, **kwargs)
 
-        def scroll(self, dx: int, dy: int, *args: Any, **kwargs: Any) -> None:
-            self._log_action("scroll", dx=dx, dy=dy, *args, **kwargs)
+        def scroll(self, dx: int, dy: int, point: tuple[int, int] | None = None, *args: Any, **kwargs: Any) -> None:
+            self._log_action("scroll", dx=dx, dy=dy, point=point, *args, **kwargs)
 
         def keydown(self, key_spec: Any, *args: Any, **kwargs: Any) -> None:
             self._log_action("keydown", key_spec, *args, **kwargs)
@@ -69,7 +73,7 @@ else:  # pragma: no cover (Covers unsupported platforms)
             self._log_action("press", key_spec, *args, **kwargs)
 
         def type_text(self, text: str, *args: Any, **kwargs: Any) -> None:
-            self_log_action("type_text", text, *args, **kwargs)
+            self._log_action("type_text", text, *args, **kwargs)
 
     backend = DummyInputBackend()
 
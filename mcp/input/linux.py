@@ -8,18 +8,22 @@ For X11 sessions:
   - Prioritizes 'xdotool' command-line utility if available.
   - Falls back to 'pynput' if 'xdotool' is not found or functional.
 
-For Wayland sessions:
-  - Uses 'pynput'. Global input control under Wayland is heavily
+For Wayland sessions (and X11 without xdotool):
+  - Prefers a running 'dotoold' daemon, fed through its command pipe. dotool
+    injects events via the kernel's uinput device, so it works under Wayland.
+  - Otherwise uses 'pynput'. Global input control under Wayland is heavily
     restricted for security reasons; functionality to control other
     applications may be limited or fail.
 
 Features:
 * ``move(point)``: Moves the mouse cursor.
 * ``click(point, button)``: Simulates a mouse click.
+* ``double_click(point, button)``: Simulates a double click in one backend call.
 * ``mousedown(point, button)``: Presses and holds a mouse button.
 * ``mouseup(point, button)``: Releases a mouse button.
 * ``drag(start_point, end_point, button, duration)``: Drags the mouse.
-* ``scroll(dx, dy)``: Simulates mouse wheel scrolling.
+* ``drag_async(...)``: Awaitable drag() that waits on the event loop instead of a worker thread.
+* ``scroll(dx, dy, point)``: Simulates mouse wheel scrolling, optionally at a point.
 * ``keydown(key_spec)`` / ``keyup(key_spec)`` / ``press(key_spec)``: Simulates key events.
 * ``type_text(text)``: Simulates typing of Unicode text.
 
@@ -30,27 +34,50 @@ Key event `key_spec` types depend on the active mechanism:
 """
 from __future__ import annotations # For type hints like Optional from older Python
 
+import asyncio
+import logging
 import os
+import shutil
+import stat
 import subprocess
 import sys
 import threading
 import time
-from typing import Tuple, Any, Optional # For Python < 3.9 tuple, any, optional
+from typing import Tuple, Any, Optional, TextIO # For Python < 3.9 tuple, any, optional
 
 # Assuming mcp.logger is correctly set up in the project structure
+from mcp import _IS_LINUX
+from mcp._threads import to_thread_fast
 from mcp.logger import get_logger
 
 logger = get_logger(__name__)
 
-if not sys.platform.startswith("linux"): # pragma: no cover
+if not _IS_LINUX: # pragma: no cover
     raise RuntimeError("linux.py input backend loaded on a non-Linux platform.")
 
+def _detect_session_type() -> str:
+    """Returns the desktop session type ("x11", "wayland", ...) or "unknown", from the environment."""
+    session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
+    if session_type:
+        return session_type
+    # Fallback if XDG_SESSION_TYPE is not set
+    if os.environ.get("WAYLAND_DISPLAY"):
+        return "wayland"
+    if os.environ.get("DISPLAY"): # Common for X11
+        return "x11"
+    return "unknown" # Unable to determine
+
+# The session is fixed for the life of the process, so it is read from the environment once.
+_SESSION_TYPE: str = _detect_session_type()
+
 # --- Global Variables for Backend State and Controllers ---
 _initialized: bool = False
 _initialization_lock = threading.Lock() # Ensures _initialize_backend runs once
 
-_session_type: Optional[str] = None  # "x11", "wayland", or "unknown"
 _xdotool_path: Optional[str] = None  # Path to xdotool executable if found
+_dotool_pipe: Optional[TextIO] = None # Write end of a running dotoold's command pipe
+_dotool_lock = threading.Lock() # Serializes writes to _dotool_pipe
+_screen_size_cached: Optional[tuple[int, int]] = None # Set by the first successful _screen_size()
 
 _mouse_controller_pynput: Optional[Any] = None # pynput.mouse.Controller instance
 _keyboard_controller_pynput: Optional[Any] = None # pynput.keyboard.Controller instance
@@ -75,38 +102,148 @@ except ImportError:  # pragma: no cover
         def from_char(char_val: str): return None
 
 
+try:
+    import numpy as np # Optional: vectorized drag paths for long drags (installed with opencv-python)
+except ImportError:  # pragma: no cover
+    np = None
+
+
 # --- Mappings for Button Names ---
-_PYNPUT_BUTTON_MAP = {
-    "left": PyMouseButton.left if _pynput_available else "left_str_dummy",
-    "right": PyMouseButton.right if _pynput_available else "right_str_dummy",
-    "middle": PyMouseButton.middle if _pynput_available else "middle_str_dummy",
+# Button name -> (xdotool button code, pynput button, dotool button), resolved once per call.
+_BUTTON_TABLE: dict[str, tuple[str, Any, str]] = {
+    "left": ("1", PyMouseButton.left if _pynput_available else "left_str_dummy", "left"),
+    "right": ("3", PyMouseButton.right if _pynput_available else "right_str_dummy", "right"),
+    "middle": ("2", PyMouseButton.middle if _pynput_available else "middle_str_dummy", "middle"),
+}
+# xdotool type waits 12 ms between keys by default. Raise this (in ms) if an application drops
+# characters or xdotool's keymap remapping races the target on long strings.
+XDOTOOL_TYPE_DELAY: str = str(int(os.environ.get("XDOTOOL_TYPE_DELAY", "0")))
+_TYPE_CHUNK_THRESHOLD_CHARS = 4096 # type_text splits strings longer than this ...
+_TYPE_CHUNK_CHARS = 2048 # ... into pieces of this size, one xdotool command each
+_DOTOOL_MODIFIERS = frozenset({"ctrl", "shift", "alt", "super"}) # Chord prefixes dotool takes by name
+# X keysym names for ASCII punctuation. Raw characters are unsafe in an xdotool key spec: '+'
+# separates chord keys, and xdotool only resolves other symbols through keysym lookup by name.
+_PUNCTUATION_KEYSYMS: dict[str, str] = {
+    "!": "exclam", '"': "quotedbl", "#": "numbersign", "$": "dollar", "%": "percent",
+    "&": "ampersand", "'": "apostrophe", "(": "parenleft", ")": "parenright", "*": "asterisk",
+    "+": "plus", ",": "comma", "-": "minus", ".": "period", "/": "slash", ":": "colon",
+    ";": "semicolon", "<": "less", "=": "equal", ">": "greater", "?": "question", "@": "at",
+    "[": "bracketleft", "\\": "backslash", "]": "bracketright", "^": "asciicircum",
+    "_": "underscore", "`": "grave", "{": "braceleft", "|": "bar", "}": "braceright", "~": "asciitilde",
 }
-_XDOTOOL_BUTTON_MAP = {"left": "1", "middle": "2", "right": "3"}
+# Ready-made 'xdotool key' commands for press() on printable ASCII characters and common named keys.
+# Shared lists: _run_xdotool_command never mutates its argument.
+_XDOTOOL_PRESS_ARGS: dict[str, list[str]] = {
+    key: ["key", _PUNCTUATION_KEYSYMS.get(key, key)]
+    for key in (
+        *(chr(c) for c in range(0x21, 0x7F)),
+        "space", "Return", "Tab", "Escape", "BackSpace", "Delete", "Home", "End",
+        "Page_Up", "Page_Down", "Up", "Down", "Left", "Right",
+    )
+}
+_SCROLL_STEP_DELAY_MS = 10 # Pause between wheel clicks of one scroll() call, applied inside xdotool
 
 
 # --- Initialization and Helper Functions ---
 def _check_xdotool() -> Optional[str]:
     """Checks if xdotool is installed and functional, returns its path if so."""
+    path_to_xdotool = shutil.which("xdotool") # In-process PATH lookup
+    if not path_to_xdotool:
+        logger.info("xdotool not found in PATH.")
+        return None
+    # Absolute, so subprocess can launch it via vfork/posix_spawn without a PATH search in the
+    # child and without copying this process's page tables (see _run_xdotool_command).
+    path_to_xdotool = os.path.abspath(path_to_xdotool)
     try:
-        # 'which' command finds the executable in PATH
-        proc_which = subprocess.run(["which", "xdotool"], capture_output=True, text=True, check=False)
-        if proc_which.returncode == 0 and proc_which.stdout.strip():
-            path_to_xdotool = proc_which.stdout.strip()
-            # Verify it's somewhat functional by calling --version
-            subprocess.run([path_to_xdotool, "--version"], capture_output=True, text=True, check=True, timeout=1)
-            logger.info(f"xdotool executable found and verified at: {path_to_xdotool}")
-            return path_to_xdotool
-        logger.info("xdotool not found in PATH using 'which'.")
+        # Verify it's somewhat functional by calling --version
+        subprocess.run([path_to_xdotool, "--version"], capture_output=True, text=True, check=True, timeout=1)
+        logger.info(f"xdotool executable found and verified at: {path_to_xdotool}")
+        return path_to_xdotool
+    except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"xdotool was found but failed basic version check: {e}. Marking as unavailable.")
         return None
-    except FileNotFoundError: # 'which' command itself not found
-        logger.info("'which' command not found. Cannot locate xdotool this way.")
+
+
+def _open_dotool_pipe() -> Optional[TextIO]:
+    """
+    Opens the command pipe of an already running dotoold ($DOTOOL_PIPE, default /tmp/dotool-pipe).
+    Returns None if there is no pipe or no daemon reading it; dotoold needs uinput access and is
+    started by the user's session, not by this backend.
+    """
+    pipe_path = os.environ.get("DOTOOL_PIPE", "/tmp/dotool-pipe")
+    try:
+        if not stat.S_ISFIFO(os.stat(pipe_path).st_mode):
+            return None
+        # O_NONBLOCK makes the open fail with ENXIO instead of hanging when no dotoold is reading.
+        fd = os.open(pipe_path, os.O_WRONLY | os.O_NONBLOCK)
+    except OSError:
         return None
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-        logger.warning(f"xdotool was found but failed basic version check: {e}. Marking as unavailable.")
+    os.set_blocking(fd, True)
+    logger.info(f"dotoold command pipe found at {pipe_path}; using dotool for input.")
+    return os.fdopen(fd, "w", buffering=1)
+
+
+def _run_dotool_command(*lines: str) -> bool:
+    """Writes newline-terminated commands to dotoold. Returns False if the daemon has gone away."""
+    global _dotool_pipe
+    with _dotool_lock:
+        if _dotool_pipe is None:
+            return False
+        try:
+            _dotool_pipe.write("\n".join(lines) + "\n")
+            _dotool_pipe.flush()
+            return True
+        except OSError as e: # BrokenPipeError once dotoold exits
+            logger.error(f"Writing to dotoold failed: {e}. dotool input disabled.")
+            _dotool_pipe = None
+            return False
+
+
+def _screen_size() -> Optional[tuple[int, int]]:
+    """
+    Screen size for dotool's 'mouseto', which takes coordinates as fractions of the screen.
+    Only a successful lookup is cached; after a failure the next pointer move asks again.
+    """
+    global _screen_size_cached
+    if _screen_size_cached is not None:
+        return _screen_size_cached
+    try:
+        import pyautogui
+        width, height = pyautogui.size()
+        _screen_size_cached = int(width), int(height)
+        return _screen_size_cached
+    except Exception as e:
+        logger.error(f"Could not determine screen size for dotool pointer moves: {e}")
         return None
-    except Exception as e_general: # Catch any other unexpected error
-        logger.error(f"Unexpected error during xdotool check: {e_general}")
+
+
+def _dotool_mouseto(x_coord: int, y_coord: int) -> Optional[str]:
+    """Builds a dotool 'mouseto' command for absolute screen pixels, or None without a screen size."""
+    size = _screen_size()
+    if size is None:
         return None
+    return f"mouseto {x_coord / size[0]:.6f} {y_coord / size[1]:.6f}"
+
+
+def _dotool_key_chord(key_spec: str) -> str:
+    """
+    Translates an xdotool-style spec ('ctrl+l', 'Return') into dotool's, with XKB names as 'x:<name>'.
+    Punctuation keys use their keysym names, and a lone or trailing '+' ('+', 'ctrl++') is the plus key.
+    """
+    if key_spec.endswith("+"): # The last '+' is the key itself, not a separator
+        modifiers = key_spec[:-1].rstrip("+")
+        parts = (modifiers.split("+") if modifiers else []) + ["+"]
+    else:
+        parts = key_spec.split("+")
+    return "+".join(
+        part if part.lower() in _DOTOOL_MODIFIERS else f"x:{_PUNCTUATION_KEYSYMS.get(part, part)}" for part in parts
+    )
+
+
+def _dotool_pointer(point: tuple[int, int], *lines: str) -> bool:
+    """Moves the pointer to point, then runs lines, all in one dotool write."""
+    mouseto = _dotool_mouseto(int(point[0]), int(point[1]))
+    return mouseto is not None and _run_dotool_command(mouseto, *lines)
 
 
 def _initialize_backend() -> None:
@@ -114,32 +251,24 @@ def _initialize_backend() -> None:
     Initializes the Linux input backend.
     Detects session type (X11/Wayland), checks for xdotool, and initializes pynput controllers.
     This function is thread-safe and ensures initialization happens only once.
+    Public functions guard the call with `if not _initialized:` so the already-initialized case
+    costs a global lookup rather than a function call; _initialized only ever goes False -> True.
+    That unlocked read is the first half of the double-checked lock; the check below is the second.
     """
-    global _initialized, _session_type, _xdotool_path
+    global _initialized, _xdotool_path, _dotool_pipe
     global _mouse_controller_pynput, _keyboard_controller_pynput, _pynput_available
 
-    if _initialized:
-        return
-
     with _initialization_lock:
-        if _initialized: # Double-check after acquiring lock
+        if _initialized: # Another thread finished initialization while we waited
             return
 
         logger.info("Initializing Linux input backend (v0.1.5)...")
 
-        # 1. Determine session type (X11 or Wayland)
-        _session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
-        if not _session_type: # Fallback if XDG_SESSION_TYPE is not set
-            if os.environ.get("WAYLAND_DISPLAY"):
-                _session_type = "wayland"
-            elif os.environ.get("DISPLAY"): # Common for X11
-                _session_type = "x11"
-            else:
-                _session_type = "unknown" # Unable to determine
-        logger.info(f"Detected desktop session type: '{_session_type}'")
+        # 1. Session type was detected at import (_SESSION_TYPE)
+        logger.info(f"Detected desktop session type: '{_SESSION_TYPE}'")
 
         # 2. Check for xdotool if in an X11 session
-        if _session_type == "x11":
+        if _SESSION_TYPE == "x11":
             _xdotool_path = _check_xdotool()
             if not _xdotool_path:
                 logger.warning("xdotool not found or not functional. "
@@ -147,6 +276,9 @@ def _initialize_backend() -> None:
         else:
             logger.info("Not an X11 session (or unknown), xdotool check skipped.")
 
+        # 2b. Without xdotool (always the case under Wayland), use dotoold if one is running
+        if not _xdotool_path:
+            _dotool_pipe = _open_dotool_pipe()
 
         # 3. Initialize pynput controllers (if pynput was imported successfully)
         if _pynput_available:
@@ -165,22 +297,28 @@ def _initialize_backend() -> None:
 
         _initialized = True
         logger.info("Linux input backend initialization complete.")
-        if _session_type == "wayland" and _pynput_available:
+        if _SESSION_TYPE == "wayland" and _pynput_available and _dotool_pipe is None:
             logger.warning("WAYLAND SESSION: Global input control via pynput is highly restricted "
                            "and may not affect other applications due to security policies.")
 
 
-def _run_xdotool_command(command_args: list[str]) -> bool:
+def _run_xdotool_command(command_args: list[str], timeout: float = 2.0) -> bool:
     """Helper function to execute an xdotool command."""
     if not _xdotool_path: # Should be checked before calling
         logger.error("Attempted to run xdotool command, but xdotool path is not configured.")
         return False
     try:
-        full_command = [_xdotool_path] + command_args
-        logger.debug(f"Executing xdotool command: {' '.join(full_command)}")
+        # Keep these launches spawn-friendly: an absolute executable, no shell, preexec_fn, cwd or
+        # start_new_session. CPython then starts the child with vfork() or posix_spawn() instead of
+        # fork(), whose cost grows with the resident size of this process (large image buffers).
+        full_command = (_xdotool_path, *command_args)
         # Using short timeout as input commands should be quick.
-        # capture_output=True helps in debugging if xdotool prints errors to stderr.
-        result = subprocess.run(full_command, check=True, capture_output=True, text=True, timeout=2.0)
+        # xdotool prints nothing useful on success, so its output is only piped (and decoded) for DEBUG logging.
+        if not logger.isEnabledFor(logging.DEBUG):
+            subprocess.run(full_command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
+            return True
+        logger.debug(f"Executing xdotool command: {' '.join(full_command)}")
+        result = subprocess.run(full_command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=timeout)
         if result.stderr: # Log stderr even on success, as it might contain warnings
             logger.debug(f"xdotool stderr (command: {' '.join(command_args)}): {result.stderr.strip()}")
         return True
@@ -188,7 +326,7 @@ def _run_xdotool_command(command_args: list[str]) -> bool:
         logger.error(f"xdotool command failed: Executable '{_xdotool_path}' not found during execution.")
         return False
     except subprocess.CalledProcessError as e_called:
-        error_output = e_called.stderr.strip() if e_called.stderr else "No stderr output."
+        error_output = e_called.stderr.strip() if e_called.stderr else "No stderr captured (enable DEBUG logging to see it)."
         logger.error(f"xdotool command failed with exit code {e_called.returncode} "
                      f"(Command: {' '.join(command_args)}): {error_output}")
         return False
@@ -201,90 +339,95 @@ def _run_xdotool_command(command_args: list[str]) -> bool:
 
 # --- Public Mouse API ---
 def mousedown(point: tuple[int, int], button: str = "left") -> None:
-    _initialize_backend()
+    if not _initialized:
+        _initialize_backend()
     btn_key = button.lower()
+    xdotool_btn_code, pynput_btn, dotool_btn = _BUTTON_TABLE.get(btn_key) or _BUTTON_TABLE["left"]
     x_coord, y_coord = int(point[0]), int(point[1])
 
-    if _session_type == "x11" and _xdotool_path:
-        xdotool_btn_code = _XDOTOOL_BUTTON_MAP.get(btn_key, "1") # Default to left click
-        # xdotool 'mousedown' does not move the cursor, so move it first.
-        if _run_xdotool_command(["mousemove", str(x_coord), str(y_coord)]):
-            if not _run_xdotool_command(["mousedown", xdotool_btn_code]):
-                logger.warning("xdotool mousedown command failed. Attempting pynput fallback if available.")
-                if _mouse_controller_pynput: # Fallback for mousedown
-                    try:
-                        _mouse_controller_pynput.position = (x_coord, y_coord)
-                        _mouse_controller_pynput.press(_PYNPUT_BUTTON_MAP.get(btn_key))
-                    except Exception as e_fb: logger.error(f"pynput mousedown fallback failed: {e_fb}")
-        else: # xdotool mousemove failed
-            logger.warning("xdotool mousemove (before mousedown) failed. Pynput fallback not attempted for this sequence.")
+    if _SESSION_TYPE == "x11" and _xdotool_path:
+        # xdotool 'mousedown' does not move the cursor, so the move is chained into the same command.
+        if not _run_xdotool_command(["mousemove", str(x_coord), str(y_coord), "mousedown", xdotool_btn_code]):
+            logger.warning("xdotool mousedown command failed. Attempting pynput fallback if available.")
+            if _mouse_controller_pynput: # Fallback for mousedown
+                try:
+                    _mouse_controller_pynput.position = (x_coord, y_coord)
+                    _mouse_controller_pynput.press(pynput_btn)
+                except Exception as e_fb: logger.error(f"pynput mousedown fallback failed: {e_fb}")
 
+    elif _dotool_pipe is not None:
+        if not _dotool_pointer((x_coord, y_coord), f"buttondown {dotool_btn}"):
+            logger.error("dotool mousedown failed.")
     elif _mouse_controller_pynput:
         logger.debug(f"Using pynput for mousedown: {btn_key} at ({x_coord},{y_coord})")
         try:
             _mouse_controller_pynput.position = (x_coord, y_coord)
-            _mouse_controller_pynput.press(_PYNPUT_BUTTON_MAP.get(btn_key))
+            _mouse_controller_pynput.press(pynput_btn)
         except Exception as e: logger.error(f"pynput mousedown failed: {e}")
     else:
-        logger.error("No available input mechanism (xdotool or pynput) for mousedown.")
+        logger.error("No available input mechanism (xdotool, dotool or pynput) for mousedown.")
 
 
 def mouseup(point: tuple[int, int], button: str = "left") -> None:
-    _initialize_backend()
+    if not _initialized:
+        _initialize_backend()
     btn_key = button.lower()
+    xdotool_btn_code, pynput_btn, dotool_btn = _BUTTON_TABLE.get(btn_key) or _BUTTON_TABLE["left"]
     x_coord, y_coord = int(point[0]), int(point[1]) # Ensure integer coords
 
-    if _session_type == "x11" and _xdotool_path:
-        xdotool_btn_code = _XDOTOOL_BUTTON_MAP.get(btn_key, "1")
+    if _SESSION_TYPE == "x11" and _xdotool_path:
         # It's good practice to ensure the mouse is at the release point, though xdotool mouseup
         # itself doesn't typically require current position if a previous mousedown set the target.
-        if _run_xdotool_command(["mousemove", str(x_coord), str(y_coord)]): # Optional: ensure position
-            if not _run_xdotool_command(["mouseup", xdotool_btn_code]):
-                logger.warning("xdotool mouseup command failed. Attempting pynput fallback if available.")
-                if _mouse_controller_pynput: # Fallback for mouseup
-                    try:
-                        _mouse_controller_pynput.position = (x_coord, y_coord)
-                        _mouse_controller_pynput.release(_PYNPUT_BUTTON_MAP.get(btn_key))
-                    except Exception as e_fb: logger.error(f"pynput mouseup fallback failed: {e_fb}")
-        else:
-             logger.warning("xdotool mousemove (before mouseup) failed.")
-
-
+        if not _run_xdotool_command(["mousemove", str(x_coord), str(y_coord), "mouseup", xdotool_btn_code]):
+            logger.warning("xdotool mouseup command failed. Attempting pynput fallback if available.")
+            if _mouse_controller_pynput: # Fallback for mouseup
+                try:
+                    _mouse_controller_pynput.position = (x_coord, y_coord)
+                    _mouse_controller_pynput.release(pynput_btn)
+                except Exception as e_fb: logger.error(f"pynput mouseup fallback failed: {e_fb}")
+    elif _dotool_pipe is not None:
+        if not _dotool_pointer((x_coord, y_coord), f"buttonup {dotool_btn}"):
+            logger.error("dotool mouseup failed.")
     elif _mouse_controller_pynput:
         logger.debug(f"Using pynput for mouseup: {btn_key} at ({x_coord},{y_coord})")
         try:
             _mouse_controller_pynput.position = (x_coord, y_coord) # Ensure position for release
-            _mouse_controller_pynput.release(_PYNPUT_BUTTON_MAP.get(btn_key))
+            _mouse_controller_pynput.release(pynput_btn)
         except Exception as e: logger.error(f"pynput mouseup failed: {e}")
     else:
-        logger.error("No available input mechanism (xdotool or pynput) for mouseup.")
+        logger.error("No available input mechanism (xdotool, dotool or pynput) for mouseup.")
 
 
 def move(point: tuple[int, int]) -> None:
-    _initialize_backend()
+    if not _initialized:
+        _initialize_backend()
     x_coord, y_coord = int(point[0]), int(point[1])
 
-    if _session_type == "x11" and _xdotool_path:
+    if _SESSION_TYPE == "x11" and _xdotool_path:
         if not _run_xdotool_command(["mousemove", str(x_coord), str(y_coord)]):
             logger.warning("xdotool mousemove failed. Attempting pynput fallback if available.")
             if _mouse_controller_pynput: # Fallback
                 try: _mouse_controller_pynput.position = (x_coord, y_coord)
                 except Exception as e_fb: logger.error(f"pynput mouse move fallback failed: {e_fb}")
+    elif _dotool_pipe is not None:
+        if not _dotool_pointer((x_coord, y_coord)):
+            logger.error("dotool mouse move failed.")
     elif _mouse_controller_pynput:
         logger.debug(f"Using pynput for move to ({x_coord},{y_coord})")
         try: _mouse_controller_pynput.position = (x_coord, y_coord)
         except Exception as e: logger.error(f"pynput mouse move failed: {e}")
     else:
-        logger.error("No available input mechanism (xdotool or pynput) for move.")
+        logger.error("No available input mechanism (xdotool, dotool or pynput) for move.")
 
 
 def click(point: tuple[int, int], button: str = "left") -> None:
-    _initialize_backend()
+    if not _initialized:
+        _initialize_backend()
     btn_key = button.lower()
+    xdotool_btn_code, pynput_btn, dotool_btn = _BUTTON_TABLE.get(btn_key) or _BUTTON_TABLE["left"]
     x_coord, y_coord = int(point[0]), int(point[1])
 
-    if _session_type == "x11" and _xdotool_path:
-        xdotool_btn_code = _XDOTOOL_BUTTON_MAP.get(btn_key, "1")
+    if _SESSION_TYPE == "x11" and _xdotool_path:
         # xdotool 'click' command sequence usually includes a mousemove to the target.
         # However, ensuring position first with a separate mousemove can be more explicit.
         # The command `xdotool mousemove x y click button_code` does this in one go.
@@ -293,101 +436,288 @@ def click(point: tuple[int, int], button: str = "left") -> None:
             if _mouse_controller_pynput: # Fallback
                 try:
                     _mouse_controller_pynput.position = (x_coord, y_coord)
-                    _mouse_controller_pynput.click(_PYNPUT_BUTTON_MAP.get(btn_key), 1) # 1 click
+                    _mouse_controller_pynput.click(pynput_btn, 1) # 1 click
                 except Exception as e_fb: logger.error(f"pynput click fallback failed: {e_fb}")
+    elif _dotool_pipe is not None:
+        if not _dotool_pointer((x_coord, y_coord), f"click {dotool_btn}"):
+            logger.error("dotool click failed.")
     elif _mouse_controller_pynput:
         logger.debug(f"Using pynput for click: {btn_key} at ({x_coord},{y_coord})")
         try:
             _mouse_controller_pynput.position = (x_coord, y_coord)
-            _mouse_controller_pynput.click(_PYNPUT_BUTTON_MAP.get(btn_key), 1)
+            _mouse_controller_pynput.click(pynput_btn, 1)
         except Exception as e: logger.error(f"pynput click failed: {e}")
     else:
-        logger.error("No available input mechanism (xdotool or pynput) for click.")
+        logger.error("No available input mechanism (xdotool, dotool or pynput) for click.")
+
+
+def double_click(point: tuple[int, int], button: str = "left") -> None:
+    if not _initialized:
+        _initialize_backend()
+    btn_key = button.lower()
+    xdotool_btn_code, pynput_btn, dotool_btn = _BUTTON_TABLE.get(btn_key) or _BUTTON_TABLE["left"]
+    x_coord, y_coord = int(point[0]), int(point[1])
+
+    if _SESSION_TYPE == "x11" and _xdotool_path:
+        # One xdotool process: move, then two clicks 50ms apart (well inside the double-click interval).
+        if not _run_xdotool_command(["mousemove", str(x_coord), str(y_coord),
+                                     "click", "--repeat", "2", "--delay", "50", xdotool_btn_code]):
+            logger.warning("xdotool double click command failed. Attempting pynput fallback if available.")
+            if _mouse_controller_pynput: # Fallback
+                try:
+                    _mouse_controller_pynput.position = (x_coord, y_coord)
+                    _mouse_controller_pynput.click(pynput_btn, 2)
+                except Exception as e_fb: logger.error(f"pynput double click fallback failed: {e_fb}")
+    elif _dotool_pipe is not None:
+        if not _dotool_pointer((x_coord, y_coord), f"click {dotool_btn}", f"click {dotool_btn}"):
+            logger.error("dotool double click failed.")
+    elif _mouse_controller_pynput:
+        logger.debug(f"Using pynput for double click: {btn_key} at ({x_coord},{y_coord})")
+        try:
+            _mouse_controller_pynput.position = (x_coord, y_coord)
+            _mouse_controller_pynput.click(pynput_btn, 2)
+        except Exception as e: logger.error(f"pynput double click failed: {e}")
+    else:
+        logger.error("No available input mechanism (xdotool, dotool or pynput) for double click.")
+
 
+_NUMPY_PATH_MIN_STEPS = 128 # Below this the numpy call and tolist() cost more than the Python loop
 
-def drag(start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5) -> None:
-    _initialize_backend()
-    # Note: xdotool has 'mousemove_relative --sync x y' and can chain mousedown/mouseup.
-    # For simplicity and consistency with other backends, we use interpolated moves.
-    # This means `move` will be called repeatedly, which internally handles xdotool/pynput.
 
-    move(start_point)
-    time.sleep(0.05) # Ensure move is processed
-    mousedown(start_point, button) # Uses our mousedown, which handles xdotool/pynput
-    time.sleep(0.05) # Ensure mousedown is processed
+def _drag_path(start_point: tuple[int, int], end_point: tuple[int, int], num_steps: int) -> list[tuple[int, int]]:
+    """Interpolates num_steps + 1 integer points from start_point to end_point (both included)."""
+    start_x, start_y = int(start_point[0]), int(start_point[1])
+    span_x, span_y = int(end_point[0]) - start_x, int(end_point[1]) - start_y
+    if np is not None and num_steps >= _NUMPY_PATH_MIN_STEPS:
+        # Same floor-division arithmetic as below, so both branches produce identical points.
+        steps = np.arange(num_steps + 1, dtype=np.int64)
+        xs = start_x + span_x * steps // num_steps
+        ys = start_y + span_y * steps // num_steps
+        return list(zip(xs.tolist(), ys.tolist()))
+    return [(start_x + span_x * i // num_steps, start_y + span_y * i // num_steps) for i in range(num_steps + 1)]
 
+
+_DRAG_SETTLE_S = 0.005 # dotool/pynput only: brief pause after the press, which they cannot synchronize
+
+
+DRAG_STEP_MS = 20 # Interval between interpolated moves of a smooth drag (~50 steps per second)
+
+
+def _drag_plan(start_point: tuple[int, int], end_point: tuple[int, int], duration: float) -> tuple[list[tuple[int, int]], float]:
+    """Returns the drag path and the pause before each step after the first point."""
     if duration <= 0:
-        move(end_point) # Move directly if no duration
-    else:
-        start_x, start_y = start_point
-        end_x, end_y = end_point
-        num_steps = max(2, int(duration / 0.02)) # Aim for ~50 FPS for smooth drag
-        time_per_step = duration / num_steps
-
-        for i in range(num_steps + 1): # Include the end_point
-            ratio = i / num_steps
-            current_x = int(start_x + (end_x - start_x) * ratio)
-            current_y = int(start_y + (end_y - start_y) * ratio)
-            # `move` will use the best available backend (xdotool or pynput)
-            # For xdotool, `mousemove` works even if a button is held.
-            # For pynput, setting `.position` while a button is held results in a drag.
-            move((current_x, current_y))
-            if i < num_steps:
+        return _drag_path(start_point, end_point, 1), 0.0 # Move directly to the end point
+    num_steps = max(2, int(duration * 1000 / DRAG_STEP_MS))
+    return _drag_path(start_point, end_point, num_steps), duration / num_steps
+
+
+_DRAG_STEPS_PER_COMMAND = 64 # Path steps per xdotool command, so even very long drags keep argv small
+
+
+def _drag_xdotool_commands(points: list[tuple[int, int]], sleep_per_step: float, button_code: str) -> list[list[str]]:
+    """
+    Builds a drag as chained xdotool commands: move to the first point and mousedown, walk the path
+    ('sleep s mousemove x y ...') in segments of at most _DRAG_STEPS_PER_COMMAND steps, mouseup at
+    the end of the last one. xdotool paces every step itself, and the button stays held between
+    commands because the X server, not xdotool, tracks it. Events are processed in order, so no
+    settle pauses are needed around the press and release.
+    """
+    first_x, first_y = points[0]
+    commands: list[list[str]] = []
+    command_args = ["mousemove", str(first_x), str(first_y), "mousedown", button_code]
+    step_sleep = ["sleep", f"{sleep_per_step:.3f}"] if sleep_per_step > 0 else []
+    for step, (x_coord, y_coord) in enumerate(points[1:], start=1):
+        command_args += step_sleep + ["mousemove", str(x_coord), str(y_coord)]
+        if step % _DRAG_STEPS_PER_COMMAND == 0:
+            commands.append(command_args)
+            command_args = []
+    command_args += ["mouseup", button_code]
+    commands.append(command_args)
+    return commands
+
+
+def _drag_xdotool(points: list[tuple[int, int]], sleep_per_step: float, button_code: str) -> bool:
+    """
+    Runs a drag built by _drag_xdotool_commands through _run_xdotool_command. If a later segment
+    fails the button is released, so a failed drag never leaves it held.
+    """
+    # Each process has to outlive its segment, not just the usual 2 s command timeout.
+    timeout = 2.0 + sleep_per_step * _DRAG_STEPS_PER_COMMAND
+    for index, command_args in enumerate(_drag_xdotool_commands(points, sleep_per_step, button_code)):
+        if not _run_xdotool_command(command_args, timeout=timeout):
+            if index:
+                _run_xdotool_command(["mouseup", button_code])
+            return False
+    return True
+
+
+def drag(start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5, smooth: bool = True) -> None:
+    """
+    Drags the mouse from start_point to end_point with a button held down.
+    With smooth=False the button is pressed, the pointer jumps to end_point and the button is
+    released with no intermediate steps or pauses; duration is ignored. Smooth drags step every
+    DRAG_STEP_MS milliseconds.
+    """
+    if not _initialized:
+        _initialize_backend()
+    if not smooth:
+        duration = 0.0
+    points, time_per_step = _drag_plan(start_point, end_point, duration)
+
+    if _SESSION_TYPE == "x11" and _xdotool_path:
+        xdotool_btn_code = (_BUTTON_TABLE.get(button.lower()) or _BUTTON_TABLE["left"])[0]
+        if _drag_xdotool(points, time_per_step, xdotool_btn_code):
+            return
+        logger.warning("xdotool drag command failed. Falling back to a step-by-step drag.")
+    _drag_steps(points, time_per_step, button, smooth)
+
+
+def _drag_steps(points: list[tuple[int, int]], time_per_step: float, button: str, settle: bool) -> None:
+    """
+    Step-by-step drag along points: mousedown(), a dotool or pynput position loop, mouseup().
+    drag() and drag_async() use it when the chained xdotool drag is unavailable or has failed,
+    so the xdotool command is never run a second time.
+    """
+    mousedown(points[0], button) # Moves to the start point first; handles xdotool/dotool/pynput
+    if settle:
+        time.sleep(_DRAG_SETTLE_S)
+
+    # Setting the pointer position while a button is held results in a drag.
+    if _dotool_pipe is not None:
+        for point in points[1:]:
+            time.sleep(time_per_step)
+            if not _dotool_pointer(point):
+                logger.error("dotool drag move failed.")
+                break
+    elif _mouse_controller_pynput:
+        try:
+            for point in points[1:]:
                 time.sleep(time_per_step)
-    
-    time.sleep(0.05) # Ensure final move/drag is processed
-    mouseup(end_point, button) # Uses our mouseup
+                _mouse_controller_pynput.position = point
+        except Exception as e: logger.error(f"pynput drag move failed: {e}")
+    else:
+        move(points[-1]) # Reports that no input mechanism is available (or retries xdotool)
+
+    mouseup(points[-1], button) # Uses our mouseup
+
+
+async def _run_xdotool_command_async(command_args: list[str], timeout: float) -> bool:
+    """
+    _run_xdotool_command for event-loop callers: the xdotool process is awaited, not waited on
+    by a blocked thread. It is killed if it times out or the awaiting task is cancelled.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            _xdotool_path, *command_args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        logger.error("Could not start xdotool: %s", e)
+        return False
+    try:
+        returncode = await asyncio.wait_for(proc.wait(), timeout)
+    except BaseException as e: # TimeoutError, or CancelledError (which is re-raised)
+        proc.kill()
+        if not isinstance(e, asyncio.TimeoutError):
+            raise
+        logger.error("xdotool command timed out: %s", " ".join(command_args))
+        return False
+    if returncode:
+        logger.error("xdotool command failed with exit code %d: %s", returncode, " ".join(command_args))
+        return False
+    return True
 
 
-def scroll(dx: int, dy: int) -> None:
-    _initialize_backend()
+async def drag_async(start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5, smooth: bool = True) -> None:
+    """
+    drag() for event-loop callers. Under xdotool each drag segment runs as an awaited subprocess
+    that paces its own steps, so no worker thread sits blocked for the length of the drag and
+    failures are still detected. Every other setup runs drag() in a worker thread, and a failed
+    xdotool drag continues with drag()'s step-by-step fallback there.
+    """
+    if not _initialized:
+        await to_thread_fast(_initialize_backend)
+    if not (_SESSION_TYPE == "x11" and _xdotool_path):
+        await to_thread_fast(drag, start_point, end_point, button, duration, smooth)
+        return
+    if not smooth:
+        duration = 0.0
+    points, time_per_step = _drag_plan(start_point, end_point, duration)
+    xdotool_btn_code = (_BUTTON_TABLE.get(button.lower()) or _BUTTON_TABLE["left"])[0]
+    timeout = 2.0 + time_per_step * _DRAG_STEPS_PER_COMMAND
+    pressed = True # From the first segment's mousedown until the last segment's mouseup has run
+    try:
+        for command_args in _drag_xdotool_commands(points, time_per_step, xdotool_btn_code):
+            if not await _run_xdotool_command_async(command_args, timeout):
+                break
+            pressed = command_args[-2] != "mouseup"
+        else:
+            return
+    finally:
+        if pressed: # A segment failed or the task was cancelled mid-drag
+            # Shielded so a cancelled drag still releases the button instead of killing the release too.
+            await asyncio.shield(_run_xdotool_command_async(["mouseup", xdotool_btn_code], 2.0))
+    logger.warning("xdotool drag command failed. Falling back to a step-by-step drag.")
+    await to_thread_fast(_drag_steps, points, time_per_step, button, smooth)
+
+
+def scroll(dx: int, dy: int, point: tuple[int, int] | None = None) -> None:
+    if not _initialized:
+        _initialize_backend()
     if dx == 0 and dy == 0:
+        if point is not None:
+            move(point)
         return # Nothing to scroll
 
-    if _session_type == "x11" and _xdotool_path:
+    if _SESSION_TYPE == "x11" and _xdotool_path:
         logger.debug(f"Scrolling dx={dx}, dy={dy} using xdotool.")
         # xdotool uses button clicks for scrolling: 4=up, 5=down, 6=left, 7=right.
-        # Convert dx/dy units into a sequence of these button clicks.
-        commands_to_run: list[list[str]] = []
-        if dy < 0: # Scroll Up (dy is negative)
-            for _ in range(abs(dy)): commands_to_run.append(["click", "4"])
-        elif dy > 0: # Scroll Down (dy is positive)
-            for _ in range(abs(dy)): commands_to_run.append(["click", "5"])
-        
-        if dx < 0: # Scroll Left (dx is negative)
-            for _ in range(abs(dx)): commands_to_run.append(["click", "6"])
-        elif dx > 0: # Scroll Right (dx is positive)
-            for _ in range(abs(dx)): commands_to_run.append(["click", "7"])
-        
-        all_succeeded = True
-        for cmd_args in commands_to_run:
-            if not _run_xdotool_command(cmd_args):
-                all_succeeded = False # Mark failure but try all scroll steps
-            time.sleep(0.01) # Small delay between individual scroll "clicks"
+        # All wheel clicks go into one xdotool process: 'click --repeat N --delay 10 <button>' per axis,
+        # chained after an optional mousemove, instead of one process (and a sleep) per unit.
+        command_args: list[str] = []
+        if point is not None:
+            command_args += ["mousemove", str(int(point[0])), str(int(point[1]))]
+        if dy != 0: # Negative dy scrolls up, positive down
+            command_args += ["click", "--repeat", str(abs(dy)), "--delay", str(_SCROLL_STEP_DELAY_MS), "4" if dy < 0 else "5"]
+        if dx != 0: # Negative dx scrolls left, positive right
+            command_args += ["click", "--repeat", str(abs(dx)), "--delay", str(_SCROLL_STEP_DELAY_MS), "6" if dx < 0 else "7"]
+
+        all_succeeded = _run_xdotool_command(command_args)
 
         if not all_succeeded and _mouse_controller_pynput:
-             logger.warning("One or more xdotool scroll commands failed. Attempting pynput fallback.")
-             try: _mouse_controller_pynput.scroll(dx, dy)
+             logger.warning("xdotool scroll command failed. Attempting pynput fallback.")
+             try:
+                 if point is not None:
+                     _mouse_controller_pynput.position = (int(point[0]), int(point[1]))
+                 _mouse_controller_pynput.scroll(dx, dy)
              except Exception as e_fb: logger.error(f"pynput scroll fallback also failed: {e_fb}")
         elif not all_succeeded:
              logger.error("xdotool scroll failed and pynput fallback not available/failed.")
 
+    elif _dotool_pipe is not None:
+        # uinput wheel values are positive for up/right; this API uses negative dy for up.
+        wheel_lines = ([f"wheel {-dy}"] if dy else []) + ([f"hwheel {dx}"] if dx else [])
+        sent = _dotool_pointer(point, *wheel_lines) if point is not None else _run_dotool_command(*wheel_lines)
+        if not sent:
+            logger.error(f"dotool scroll(dx={dx}, dy={dy}) failed.")
     elif _mouse_controller_pynput:
         logger.debug(f"Scrolling dx={dx}, dy={dy} using pynput.")
         try:
+            if point is not None:
+                _mouse_controller_pynput.position = (int(point[0]), int(point[1]))
             _mouse_controller_pynput.scroll(dx, dy) # pynput handles dx, dy directly
         except Exception as e:  # pragma: no cover (pynput errors can be varied)
             logger.error(f"pynput scroll(dx={dx}, dy={dy}) failed: {e}")
     else:
-        logger.error("No available input mechanism (xdotool or pynput) for scroll.")
+        logger.error("No available input mechanism (xdotool, dotool or pynput) for scroll.")
 
 
 # --- Public Keyboard API ---
 def _handle_key_event(key_spec: Any, action: str) -> None: # action: "down", "up", or "press"
     """Internal helper to dispatch key events to xdotool or pynput."""
-    _initialize_backend()
+    if not _initialized:
+        _initialize_backend()
 
-    if _session_type == "x11" and _xdotool_path:
+    if _SESSION_TYPE == "x11" and _xdotool_path:
         if not isinstance(key_spec, str):
             logger.error(f"xdotool key action ('{action}') expects a string Keysym "
                          f"(e.g., 'Control_L', 'a', 'Return'), but got type {type(key_spec)}: '{key_spec}'. Action aborted.")
@@ -398,6 +728,10 @@ def _handle_key_event(key_spec: Any, action: str) -> None: # action: "down", "up
         if action == "down": xdotool_cmd = "keydown"
         elif action == "up": xdotool_cmd = "keyup"
         _run_xdotool_command([xdotool_cmd, key_spec])
+    elif _dotool_pipe is not None and isinstance(key_spec, str):
+        dotool_cmd = {"down": "keydown", "up": "keyup"}.get(action, "key")
+        if not _run_dotool_command(f"{dotool_cmd} {_dotool_key_chord(key_spec)}"):
+            logger.error(f"dotool key {action} for '{key_spec}' failed.")
     elif _keyboard_controller_pynput:
         logger.debug(f"Performing key {action} for key_spec '{key_spec}' using pynput.")
         try:
@@ -410,7 +744,7 @@ def _handle_key_event(key_spec: Any, action: str) -> None: # action: "down", "up
         except Exception as e:  # pragma: no cover (pynput can raise various errors)
             logger.error(f"pynput key {action} for key_spec '{key_spec}' failed: {e}")
     else:
-        logger.error(f"No available input mechanism (xdotool or pynput) for key {action}.")
+        logger.error(f"No available input mechanism (xdotool, dotool or pynput) for key {action}.")
 
 
 def keydown(key_spec: Any) -> None:
@@ -423,20 +757,42 @@ def keyup(key_spec: Any) -> None:
 
 def press(key_spec: Any) -> None:
     """Simulates a full key press (key down followed by key up)."""
+    if _initialized and _SESSION_TYPE == "x11" and _xdotool_path and type(key_spec) is str:
+        command_args = _XDOTOOL_PRESS_ARGS.get(key_spec)
+        if command_args is not None: # Common key: skip the generic dispatch
+            _run_xdotool_command(command_args)
+            return
     _handle_key_event(key_spec, "press")
 
 def type_text(text: str) -> None:
     """Simulates typing of an arbitrary Unicode string."""
-    _initialize_backend()
+    if not _initialized:
+        _initialize_backend()
     if not isinstance(text, str):
         logger.error(f"type_text expects a string argument, but got {type(text)}. Action aborted.")
         return
 
-    if _session_type == "x11" and _xdotool_path:
+    if _SESSION_TYPE == "x11" and _xdotool_path:
         logger.debug(f"Typing text (first 20 chars: '{text[:20]}...') using xdotool.")
         # '--clearmodifiers' helps ensure stray modifiers don't affect typing.
-        # '--delay' can be added if typing is too fast for some applications.
-        _run_xdotool_command(["type", "--clearmodifiers", text])
+        # '--' stops text starting with '-' from being parsed as an option.
+        # Long strings are split so no single argv gets near the system's argument length limit.
+        chunk_size = _TYPE_CHUNK_CHARS if len(text) > _TYPE_CHUNK_THRESHOLD_CHARS else max(1, len(text))
+        for offset in range(0, len(text), chunk_size):
+            chunk = text[offset:offset + chunk_size]
+            if not _run_xdotool_command(["type", "--clearmodifiers", "--delay", XDOTOOL_TYPE_DELAY, "--", chunk]):
+                logger.warning(f"xdotool type failed; {len(text) - offset} characters were not typed.")
+                break
+    elif _dotool_pipe is not None:
+        # dotool reads one command per line, so line breaks in the text become Enter presses.
+        commands: list[str] = []
+        for i, line in enumerate(text.split("\n")):
+            if i:
+                commands.append("key enter")
+            if line:
+                commands.append(f"type {line}")
+        if commands and not _run_dotool_command(*commands):
+            logger.error("dotool type_text failed.")
     elif _keyboard_controller_pynput:
         logger.debug(f"Typing text (first 20 chars: '{text[:20]}...') using pynput.")
         try:
@@ -444,7 +800,7 @@ def type_text(text: str) -> None:
         except Exception as e:  # pragma: no cover
             logger.error(f"pynput type_text failed: {e}")
     else:
-        logger.error("No available input mechanism (xdotool or pynput) for type_text.")
+        logger.error("No available input mechanism (xdotool, dotool or pynput) for type_text.")
 
 # --- Test Block (for direct execution of this file) ---
 if __name__ == "__main__":  # pragma: no cover
@@ -453,14 +809,14 @@ if __name__ == "__main__":  # pragma: no cover
     print(f"--- Linux Input Backend Test (v0.1.5) ---")
     _initialize_backend() # Explicitly initialize for test run
     print(f"Test Environment Configuration:")
-    print(f"  Session Type: {_session_type or 'Not Determined'}")
+    print(f"  Session Type: {_SESSION_TYPE or 'Not Determined'}")
     print(f"  xdotool Path: {_xdotool_path or 'Not Found / Not Used'}")
     print(f"  pynput Available: {_pynput_available}")
     print(f"  pynput Mouse Controller: {'Initialized' if _mouse_controller_pynput else 'Not Initialized'}")
     print(f"  pynput Keyboard Controller: {'Initialized' if _keyboard_controller_pynput else 'Not Initialized'}")
     print("-----------------------------------------------------")
 
-    if not ((_session_type == "x11" and _xdotool_path) or _pynput_available):
+    if not ((_SESSION_TYPE == "x11" and _xdotool_path) or _pynput_available):
         print("CRITICAL: No functional input mechanism (neither xdotool for X11 nor pynput) "
               "could be initialized. Cannot run tests effectively.")
         sys.exit(1)
@@ -486,7 +842,7 @@ if __name__ == "__main__":  # pragma: no cover
         time.sleep(0.5)
 
         # Key press test (Enter key)
-        if _session_type == "x11" and _xdotool_path:
+        if _SESSION_TYPE == "x11" and _xdotool_path:
             logger.info("TEST: Pressing Enter key (using xdotool with 'Return' Keysym)")
             press("Return")
         elif _pynput_available and PyKey: # Check if PyKey was successfully imported
@@ -518,7 +874,7 @@ if __name__ == "__main__":  # pragma: no cover
         logger.info("\n--- Linux input simulation tests finished. ---")
         print("\n--- Linux input simulation tests finished. ---")
         print("Please check your target application (text editor/drawing app) for the results.")
-        if _session_type == "wayland":
+        if _SESSION_TYPE == "wayland":
             print("NOTE: If on Wayland, global input effects on other applications might be limited or absent.")
 
     except Exception as e_test:
@@ -3,11 +3,12 @@ mac.py – macOS low-level input backend using Quartz CGEvent (v0.1.5).
 
 Features:
 * ``click(point, button="left")`` – Down/Up pair via ``CGEventPost``.
+* ``double_click(point, button="left")`` – Two Down/Up pairs tagged with ``kCGMouseEventClickState``.
 * ``move(point)`` – Cursor movement only (``kCGEventMouseMoved``).
 * ``mousedown(point, button)`` – Press and hold a mouse button.
 * ``mouseup(point, button)`` – Release a mouse button.
 * ``drag(start, end, button, duration)`` – Drag mouse from start to end with button held.
-* ``scroll(dx, dy)`` – Horizontal and vertical scrolling.
+* ``scroll(dx, dy, point=None)`` – Horizontal and vertical scrolling, optionally at a point.
 * ``keydown(key_code)`` / ``keyup(key_code)`` / ``press(key_code)`` – Virtual key code events.
 * ``type_text(text)`` – Proper Unicode text input using ``CGEventKeyboardSetUnicodeString``.
 
@@ -18,14 +19,21 @@ for synthetic CGEvent s to be accepted by the system.
 """
 from __future__ import annotations # For type hints like Tuple from older Python versions
 
-import sys
 import time
 from typing import Tuple # For Python < 3.9, for 3.9+ tuple is fine
 
-if sys.platform != "darwin":
+from mcp import _IS_MACOS
+
+if not _IS_MACOS:
     raise RuntimeError("mac.py input backend loaded on a non-macOS platform.")
 
+from mcp._input_delays import input_delays, pause
+
+# Settle pauses, 0 unless enabled via MCP_INPUT_DELAYS; the values here are the former fixed pauses.
+_DELAYS = input_delays({"click_settle": 0.05, "drag_settle": 0.05, "key_hold": 0.01, "scroll_settle": 0.01})
+
 try:
+    import objc # type: ignore[import-untyped] # pyobjc-core, installed with the Quartz framework
     import Quartz # type: ignore[import-untyped]
 except ImportError as exc:
     # This is a critical dependency for this module.
@@ -34,57 +42,66 @@ except ImportError as exc:
         "Please install it: `pip install pyobjc-framework-Quartz`"
     ) from exc
 
+# --- Event Source ---
+# One shared source for every synthetic event, instead of Quartz creating a default source per
+# CGEventCreate* call with None. A zero suppression interval stops the system from swallowing
+# local hardware events for 250 ms after each posted event (the "rapid input" lag).
+try:
+    _EVENT_SOURCE = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+    if _EVENT_SOURCE is not None:
+        Quartz.CGEventSourceSetLocalEventsSuppressionInterval(_EVENT_SOURCE, 0.0)
+except Exception: # pragma: no cover (fall back to per-event default sources)
+    _EVENT_SOURCE = None
+
 # --- Mouse Event Helper Constants ---
-# Mapping for CGEventCreateMouseEvent buttonNumber parameter
-_CG_BUTTON_MAP = {
-    "left": Quartz.kCGMouseButtonLeft,    # 0
-    "right": Quartz.kCGMouseButtonRight,   # 1
-    "middle": Quartz.kCGMouseButtonCenter, # 2
-}
-
-# Mapping for CGEvent type parameter for mouse button events
-_CG_EVENT_TYPE_DOWN = {
-    "left": Quartz.kCGEventLeftMouseDown,
-    "right": Quartz.kCGEventRightMouseDown,
-    "middle": Quartz.kCGEventOtherMouseDown, # 'Other' is used for middle button
-}
-_CG_EVENT_TYPE_UP = {
-    "left": Quartz.kCGEventLeftMouseUp,
-    "right": Quartz.kCGEventRightMouseUp,
-    "middle": Quartz.kCGEventOtherMouseUp,
-}
-_CG_EVENT_TYPE_DRAGGED = {
-    "left": Quartz.kCGEventLeftMouseDragged,
-    "right": Quartz.kCGEventRightMouseDragged,
-    "middle": Quartz.kCGEventOtherMouseDragged,
-}
-
-def _post_mouse_event(event_type: int, point: tuple[int, int], cg_button_code: int) -> None:
-    """Helper to create and post a mouse event using Quartz."""
+# Button names are resolved to an index once at the public API boundary; internal helpers and
+# drag loops index _BUTTON_TABLE instead of lowercasing and hashing the name per event.
+_BTN_LEFT, _BTN_RIGHT, _BTN_MIDDLE = 0, 1, 2
+_STR_TO_ID = {"left": _BTN_LEFT, "right": _BTN_RIGHT, "middle": _BTN_MIDDLE}
+
+# (CGEventCreateMouseEvent buttonNumber, down type, up type, dragged type) per button id
+_BUTTON_TABLE = (
+    (Quartz.kCGMouseButtonLeft, Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp, Quartz.kCGEventLeftMouseDragged),
+    (Quartz.kCGMouseButtonRight, Quartz.kCGEventRightMouseDown, Quartz.kCGEventRightMouseUp, Quartz.kCGEventRightMouseDragged),
+    # 'Other' event types are used for the middle button
+    (Quartz.kCGMouseButtonCenter, Quartz.kCGEventOtherMouseDown, Quartz.kCGEventOtherMouseUp, Quartz.kCGEventOtherMouseDragged),
+)
+
+def _button_id(button: str) -> int:
+    """Maps a button name to its _BUTTON_TABLE index (case-insensitive, unknown names mean left)."""
+    btn = _STR_TO_ID.get(button)
+    return btn if btn is not None else _STR_TO_ID.get(button.lower(), _BTN_LEFT)
+
+def _post_mouse_event(event_type: int, point: tuple[int, int], cg_button_code: int, click_state: int = 0) -> None:
+    """Helper to create and post a mouse event using Quartz. A non-zero click_state marks multi-clicks."""
     # CGEventCreateMouseEvent(source, mouseType, mouseCursorPosition, mouseButton)
-    event = Quartz.CGEventCreateMouseEvent(None, event_type, point, cg_button_code)
+    event = Quartz.CGEventCreateMouseEvent(_EVENT_SOURCE, event_type, point, cg_button_code)
     if not event: # pragma: no cover (should not happen if params are valid)
         # Consider logging this error if it occurs.
         # print(f"Error: Failed to create CGEvent for type {event_type} at {point}", file=sys.stderr)
         return
+    if click_state:
+        Quartz.CGEventSetIntegerValueField(event, Quartz.kCGMouseEventClickState, click_state)
     Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
     # CFRelease is typically handled by pyobjc's garbage collector for CGEvent objects.
     # Quartz.CFRelease(event) # Usually not needed with pyobjc
 
 # --- Public Mouse API ---
+def _mousedown(point: tuple[int, int], btn: int) -> None:
+    cg_button, down_type, _, _ = _BUTTON_TABLE[btn]
+    _post_mouse_event(down_type, point, cg_button)
+
+def _mouseup(point: tuple[int, int], btn: int) -> None:
+    cg_button, _, up_type, _ = _BUTTON_TABLE[btn]
+    _post_mouse_event(up_type, point, cg_button)
+
 def mousedown(point: tuple[int, int], button: str = "left") -> None:
     """Presses and holds the specified mouse button at the given screen coordinates."""
-    button_key = button.lower()
-    cg_button_enum_val = _CG_BUTTON_MAP.get(button_key, Quartz.kCGMouseButtonLeft)
-    event_type_enum_val = _CG_EVENT_TYPE_DOWN.get(button_key, Quartz.kCGEventLeftMouseDown)
-    _post_mouse_event(event_type_enum_val, point, cg_button_enum_val)
+    _mousedown(point, _button_id(button))
 
 def mouseup(point: tuple[int, int], button: str = "left") -> None:
     """Releases the specified mouse button at the given screen coordinates."""
-    button_key = button.lower()
-    cg_button_enum_val = _CG_BUTTON_MAP.get(button_key, Quartz.kCGMouseButtonLeft)
-    event_type_enum_val = _CG_EVENT_TYPE_UP.get(button_key, Quartz.kCGEventLeftMouseUp)
-    _post_mouse_event(event_type_enum_val, point, cg_button_enum_val)
+    _mouseup(point, _button_id(button))
 
 def move(point: tuple[int, int]) -> None:
     """Moves the mouse cursor to the specified screen coordinates without clicking."""
@@ -94,22 +111,48 @@ def move(point: tuple[int, int]) -> None:
 
 def click(point: tuple[int, int], button: str = "left") -> None:
     """Performs a mouse click (press and release) at the specified screen coordinates."""
+    btn = _button_id(button)
     move(point) # Ensure cursor is at the target location first
-    time.sleep(0.05) # Small delay can improve reliability for some applications
-    mousedown(point, button)
-    time.sleep(0.05) # Delay between press and release
-    mouseup(point, button)
+    pause(_DELAYS["click_settle"])
+    _mousedown(point, btn)
+    pause(_DELAYS["click_settle"]) # Between press and release
+    _mouseup(point, btn)
 
-def drag(start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5) -> None:
-    """Drags the mouse from start_point to end_point with the specified button held down."""
-    button_key = button.lower()
-    cg_button_enum_val = _CG_BUTTON_MAP.get(button_key, Quartz.kCGMouseButtonLeft)
-    drag_event_type_enum_val = _CG_EVENT_TYPE_DRAGGED.get(button_key, Quartz.kCGEventLeftMouseDragged)
+def double_click(point: tuple[int, int], button: str = "left") -> None:
+    """
+    Performs a double click at the specified screen coordinates.
+    The second Down/Up pair carries kCGMouseEventClickState = 2, which is how applications
+    recognize a double click; no inter-click delay is required.
+    """
+    cg_button_enum_val, down_type, up_type, _ = _BUTTON_TABLE[_button_id(button)]
+    move(point)
+    for click_state in (1, 2):
+        _post_mouse_event(down_type, point, cg_button_enum_val, click_state)
+        _post_mouse_event(up_type, point, cg_button_enum_val, click_state)
+
+DRAG_STEP_MS = 20 # Interval between interpolated events of a smooth drag (~50 steps per second)
+
+def drag(start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5, smooth: bool = True) -> None:
+    """
+    Drags the mouse from start_point to end_point with the specified button held down.
+    With smooth=False the button is pressed, the pointer jumps to end_point and the button is
+    released with no intermediate steps or pauses; duration is ignored. Smooth drags step every
+    DRAG_STEP_MS milliseconds.
+    """
+    btn = _button_id(button) # Resolved once, not per step
+    cg_button_enum_val, _, _, drag_event_type_enum_val = _BUTTON_TABLE[btn]
+
+    if not smooth: # Press, one drag event at the destination, release
+        move(start_point)
+        _mousedown(start_point, btn)
+        _post_mouse_event(drag_event_type_enum_val, end_point, cg_button_enum_val)
+        _mouseup(end_point, btn)
+        return
 
     move(start_point)
-    time.sleep(0.05) # Ensure move is processed
-    mousedown(start_point, button) # Use our mousedown
-    time.sleep(0.05) # Ensure mousedown is processed
+    pause(_DELAYS["drag_settle"])
+    _mousedown(start_point, btn)
+    pause(_DELAYS["drag_settle"])
 
     if duration <= 0:
         # If no duration, directly "drag" to the end point with a single drag event
@@ -117,28 +160,38 @@ def drag(start_point: tuple[int, int], end_point: tuple[int, int], button: str =
     else:
         start_x, start_y = start_point
         end_x, end_y = end_point
-        num_steps = max(2, int(duration / 0.02)) # Aim for ~50 steps per second
+        num_steps = max(2, int(duration * 1000 / DRAG_STEP_MS))
         time_per_step = duration / num_steps
 
+        # One drag event, moved and re-posted per step, instead of a new CGEvent per step.
+        drag_event = Quartz.CGEventCreateMouseEvent(_EVENT_SOURCE, drag_event_type_enum_val, start_point, cg_button_enum_val)
         for i in range(num_steps + 1): # Include the end point
             ratio = i / num_steps
             current_x = int(start_x + (end_x - start_x) * ratio)
             current_y = int(start_y + (end_y - start_y) * ratio)
-            _post_mouse_event(drag_event_type_enum_val, (current_x, current_y), cg_button_enum_val)
+            # No run loop drains autoreleased CF objects on this thread; give each step its own pool.
+            with objc.autorelease_pool():
+                if drag_event:
+                    Quartz.CGEventSetLocation(drag_event, (current_x, current_y))
+                    Quartz.CGEventPost(Quartz.kCGHIDEventTap, drag_event)
+                else: # pragma: no cover (creation failed; fall back to a fresh event per step)
+                    _post_mouse_event(drag_event_type_enum_val, (current_x, current_y), cg_button_enum_val)
             if i < num_steps: # No sleep after the final drag event
                 time.sleep(time_per_step)
     
-    time.sleep(0.05) # Ensure final drag event is processed
+    pause(_DELAYS["drag_settle"])
     # Release the button at the end_point (or the last position of the drag)
-    mouseup(end_point, button) # Use our mouseup
+    _mouseup(end_point, btn)
 
-def scroll(dx: int, dy: int) -> None:
+def scroll(dx: int, dy: int, point: tuple[int, int] | None = None) -> None:
     """
     Scrolls horizontally by dx units and vertically by dy units.
     Positive dx scrolls right, negative dx scrolls left.
     Positive dy scrolls down, negative dy scrolls up (natural scroll direction).
-    Units are typically lines.
+    Units are typically lines. If point is given, the cursor is moved there first.
     """
+    if point is not None:
+        move(point)
     # CGScrollEventUnit can be kCGScrollEventUnitPixel or kCGScrollEventUnitLine.
     # kCGScrollEventUnitLine is generally preferred for mouse-wheel like scrolling.
     # CGEventCreateScrollWheelEvent(source, units, wheelCount, wheel1, wheel2, wheel3, ...)
@@ -148,35 +201,35 @@ def scroll(dx: int, dy: int) -> None:
     
     scroll_event = None
     if dy != 0 and dx == 0: # Only vertical scroll
-        scroll_event = Quartz.CGEventCreateScrollWheelEvent(None, Quartz.kCGScrollEventUnitLine, 1, int(dy))
+        scroll_event = Quartz.CGEventCreateScrollWheelEvent(_EVENT_SOURCE, Quartz.kCGScrollEventUnitLine, 1, int(dy))
     elif dx != 0 and dy == 0: # Only horizontal scroll
         # For horizontal-only, set wheelCount to 2, wheel1 (vertical) to 0.
-        scroll_event = Quartz.CGEventCreateScrollWheelEvent(None, Quartz.kCGScrollEventUnitLine, 2, 0, int(dx))
+        scroll_event = Quartz.CGEventCreateScrollWheelEvent(_EVENT_SOURCE, Quartz.kCGScrollEventUnitLine, 2, 0, int(dx))
     elif dx != 0 and dy != 0: # Both directions
-        scroll_event = Quartz.CGEventCreateScrollWheelEvent(None, Quartz.kCGScrollEventUnitLine, 2, int(dy), int(dx))
+        scroll_event = Quartz.CGEventCreateScrollWheelEvent(_EVENT_SOURCE, Quartz.kCGScrollEventUnitLine, 2, int(dy), int(dx))
     # If dx and dy are both 0, scroll_event remains None, and nothing happens.
 
     if scroll_event:
         Quartz.CGEventPost(Quartz.kCGHIDEventTap, scroll_event)
-        time.sleep(0.01) # Small delay after scroll event
+        pause(_DELAYS["scroll_settle"])
     # No CFRelease needed due to pyobjc GC.
 
 # --- Public Keyboard API ---
 def keydown(key_code: int) -> None: # Expects macOS virtual key codes
     """Simulates pressing a virtual key."""
     # CGEventCreateKeyboardEvent(source, virtualKey, keyDownBool)
-    event = Quartz.CGEventCreateKeyboardEvent(None, key_code, True)
+    event = Quartz.CGEventCreateKeyboardEvent(_EVENT_SOURCE, key_code, True)
     if event: Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
 
 def keyup(key_code: int) -> None: # Expects macOS virtual key codes
     """Simulates releasing a virtual key."""
-    event = Quartz.CGEventCreateKeyboardEvent(None, key_code, False)
+    event = Quartz.CGEventCreateKeyboardEvent(_EVENT_SOURCE, key_code, False)
     if event: Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
 
 def press(key_code: int) -> None:
     """Simulates a full key press (keydown followed by keyup)."""
     keydown(key_code)
-    time.sleep(0.01) # Small delay can help OS distinguish separate events
+    pause(_DELAYS["key_hold"])
     keyup(key_code)
 
 def _post_unicode_char(char_val: str) -> None:
@@ -187,23 +240,29 @@ def _post_unicode_char(char_val: str) -> None:
 
     # KeyDown event for the Unicode character
     # For Unicode input, virtualKey parameter is often set to 0.
-    event_down = Quartz.CGEventCreateKeyboardEvent(None, 0, True)
+    event_down = Quartz.CGEventCreateKeyboardEvent(_EVENT_SOURCE, 0, True)
     if not event_down: return # pragma: no cover
     Quartz.CGEventKeyboardSetUnicodeString(event_down, num_utf16_units, char_val)
     Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_down)
 
     # KeyUp event for the Unicode character
-    event_up = Quartz.CGEventCreateKeyboardEvent(None, 0, False)
+    event_up = Quartz.CGEventCreateKeyboardEvent(_EVENT_SOURCE, 0, False)
     if not event_up: return # pragma: no cover
     Quartz.CGEventKeyboardSetUnicodeString(event_up, num_utf16_units, char_val)
     Quartz.CGEventPost(Quartz.kCGHIDEventTap, event_up)
 
+_TYPE_POOL_CHARS = 64 # Characters typed per autorelease pool
+
 def type_text(text: str) -> None:
     """
     Simulates typing of an arbitrary Unicode string on macOS.
-    This method sends each character independently.
+    This method sends each character independently. The events are autoreleased and this thread
+    has no run loop to drain them, so every _TYPE_POOL_CHARS characters get their own pool, which
+    keeps memory flat for long strings.
     """
-    for char_val in text:
-        _post_unicode_char(char_val)
+    for start in range(0, len(text), _TYPE_POOL_CHARS):
+        with objc.autorelease_pool():
+            for char_val in text[start:start + _TYPE_POOL_CHARS]:
+                _post_unicode_char(char_val)
         # Optional: A small delay between characters if typing too fast causes issues.
         # time.sleep(0.005)
\ No newline at end of file
@@ -3,32 +3,45 @@ win.py – Windows low-level input backend (cursor-less SendInput) (v0.1.5).
 
 Features:
 • click(point, button): Simulates a mouse click (down + up) at absolute coordinates.
+• double_click(point, button): Two down/up pairs in a single SendInput batch.
 • move(point): Moves the mouse cursor to absolute coordinates. The system cursor's actual position is updated.
 • mousedown(point, button): Presses and holds a mouse button at specified coordinates.
 • mouseup(point, button): Releases a mouse button at specified coordinates.
 • drag(start_point, end_point, button, duration): Drags the mouse from start to end with a button held down.
-• scroll(dx, dy): Simulates horizontal (dx) and vertical (dy) mouse wheel scrolling.
+• scroll(dx, dy, point): Simulates horizontal (dx) and vertical (dy) mouse wheel scrolling, optionally at a point.
 • keydown(vk_code) / keyup(vk_code) / press(vk_code): Simulates virtual key code events.
 • type_text(text): Simulates typing of Unicode text.
 
 Coordinates are physical pixels. _normalize() converts them to the 0-65535
 range required by MOUSEEVENTF_ABSOLUTE, which is documented by Microsoft
-as DPI-aware.
+as DPI-aware. The screen size behind that conversion is cached; call
+refresh_screen_metrics() after a display change.
 """
 from __future__ import annotations # For type hints like Tuple from older Python versions if needed
 
 import ctypes
 import functools
-import sys
+import threading
 import time
 from ctypes import POINTER, Structure, Union, c_long, c_ulong, c_ushort, sizeof # Ensure c_ushort is imported
 from typing import Tuple # For Python < 3.9, for 3.9+ tuple is fine
 
-if sys.platform != "win32":
+from mcp import _IS_WINDOWS
+
+if not _IS_WINDOWS:
     raise RuntimeError("win.py input backend loaded on a non-Windows platform.")
 
+from mcp._input_delays import input_delays, pause
+from mcp._win_dpi import ensure_per_monitor_dpi
+
+# SendInput coordinates are physical pixels; make sure the process is DPI aware first.
+ensure_per_monitor_dpi()
+
 user32 = ctypes.WinDLL("user32", use_last_error=True)
 
+# Settle pauses, 0 unless enabled via MCP_INPUT_DELAYS; the values here are the former fixed pauses.
+_DELAYS = input_delays({"click_settle": 0.01, "drag_settle": 0.05, "key_hold": 0.01})
+
 # Win32 Constants
 INPUT_MOUSE    = 0
 INPUT_KEYBOARD = 1
@@ -45,6 +58,21 @@ MOUSEEVENTF_WHEEL       = 0x0800  # Vertical scroll
 MOUSEEVENTF_HWHEEL      = 0x1000  # Horizontal scroll
 WHEEL_DELTA             = 120     # Standard value for one scroll unit (notch)
 
+# Button names are resolved to an index once at the public API boundary; internal helpers
+# index _BUTTON_TABLE instead of lowercasing and hashing the name per event.
+_BTN_LEFT, _BTN_RIGHT, _BTN_MIDDLE = 0, 1, 2
+_STR_TO_ID = {"left": _BTN_LEFT, "right": _BTN_RIGHT, "middle": _BTN_MIDDLE}
+_BUTTON_TABLE = ( # (down flag, up flag) per button id
+    (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+    (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+    (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP),
+)
+
+def _button_id(button: str) -> int:
+    """Maps a button name to its _BUTTON_TABLE index (case-insensitive, unknown names mean left)."""
+    btn = _STR_TO_ID.get(button)
+    return btn if btn is not None else _STR_TO_ID.get(button.lower(), _BTN_LEFT)
+
 KEYEVENTF_KEYUP         = 0x0002
 KEYEVENTF_UNICODE       = 0x0004  # Flag for SendInput to interpret wScan as Unicode char
 
@@ -74,56 +102,81 @@ class _INPUTunion(Union): # Anonymous union in C
 class INPUT(Structure):
     _fields_ = (("type", c_ulong), ("union", _INPUTunion)) # type: INPUT_MOUSE or INPUT_KEYBOARD
 
+_SendInput = user32.SendInput # Bound once; attribute lookup on a WinDLL is not free
+_INPUT_SIZE = sizeof(INPUT)
+
 # Helper Functions
+def _send_input_array(input_array: ctypes.Array[INPUT], start: int = 0, count: int | None = None) -> None:
+    """Sends count INPUT structures from an already built array, beginning at index start, in one SendInput call."""
+    if count is None:
+        count = len(input_array) - start
+    if _SendInput(count, ctypes.byref(input_array, start * _INPUT_SIZE), _INPUT_SIZE) != count:
+        raise ctypes.WinError(ctypes.get_last_error())
+
 def _send_input(*inputs: INPUT) -> None:
     """Sends one or more INPUT structures using SendInput."""
-    num_inputs = len(inputs)
-    input_array = (INPUT * num_inputs)(*inputs)
-    if user32.SendInput(num_inputs, input_array, sizeof(INPUT)) != num_inputs:
-        raise ctypes.WinError(ctypes.get_last_error())
+    _send_input_array((INPUT * len(inputs))(*inputs))
 
-def _normalize(x: int, y: int) -> tuple[int, int]:
-    """Converts screen pixel coordinates to normalized absolute coordinates (0-65535)."""
+# Pixel -> 0-65535 scale factors, derived from the screen size by refresh_screen_metrics()
+_SCALE_X: float = 0.0
+_SCALE_Y: float = 0.0
+
+def refresh_screen_metrics() -> None:
+    """
+    Re-reads the screen size used by _normalize. It is read once at import; call this after the
+    display configuration changes (monitor added/removed, resolution change).
+    """
+    global _SCALE_X, _SCALE_Y
     # SM_CXVIRTUALSCREEN (78) and SM_CYVIRTUALSCREEN (79) for multi-monitor setups
     # Fallback to SM_CXSCREEN (0) and SM_CYSCREEN (1) for single monitor
     screen_width = user32.GetSystemMetrics(78) or user32.GetSystemMetrics(0)
     screen_height = user32.GetSystemMetrics(79) or user32.GetSystemMetrics(1)
-
     # Avoid division by zero if screen metrics are unusual (e.g., 1 or 0)
-    norm_x = int(x * 65535 / (screen_width - 1)) if screen_width > 1 else 0
-    norm_y = int(y * 65535 / (screen_height - 1)) if screen_height > 1 else 0
-    return norm_x, norm_y
+    _SCALE_X = 65535 / (screen_width - 1) if screen_width > 1 else 0.0
+    _SCALE_Y = 65535 / (screen_height - 1) if screen_height > 1 else 0.0
 
-def _mouse_event(flags: int, x: int = 0, y: int = 0, mouse_data: int = 0) -> None:
-    """Helper to create and send a mouse event with absolute coordinates."""
+refresh_screen_metrics()
+
+def _normalize(x: int, y: int) -> tuple[int, int]:
+    """Converts screen pixel coordinates to normalized absolute coordinates (0-65535)."""
+    return int(x * _SCALE_X), int(y * _SCALE_Y)
+
+def _mouse_input(flags: int, x: int = 0, y: int = 0, mouse_data: int = 0) -> INPUT:
+    """Builds a mouse INPUT structure with absolute coordinates."""
     # For MOUSEEVENTF_ABSOLUTE, dx and dy contain normalized absolute coordinates.
     # If not MOUSEEVENTF_ABSOLUTE, dx and dy are relative_motion. We always use ABSOLUTE.
     normalized_x, normalized_y = _normalize(x, y)
     # mouseData is ulong in struct, but for wheel events it's treated as signed by the system.
     # ctypes handles the conversion of Python int to ulong appropriately.
     mi = MOUSEINPUT(normalized_x, normalized_y, mouse_data, MOUSEEVENTF_ABSOLUTE | flags, 0, None)
-    _send_input(INPUT(type=INPUT_MOUSE, union=_INPUTunion(mi=mi)))
+    return INPUT(type=INPUT_MOUSE, union=_INPUTunion(mi=mi))
+
+# Single mouse events overwrite the fields of one preallocated INPUT instead of building
+# MOUSEINPUT/_INPUTunion/INPUT objects and a one-element array for every event.
+_mouse_scratch = (INPUT * 1)()
+_mouse_scratch[0].type = INPUT_MOUSE
+_mouse_scratch_mi = _mouse_scratch[0].union.mi # Shares the array's memory
+_mouse_scratch_lock = threading.Lock() # The scratch record is shared by all threads
+
+def _mouse_event(flags: int, x: int = 0, y: int = 0, mouse_data: int = 0) -> None:
+    """Helper to send a single mouse event with absolute coordinates."""
+    mi = _mouse_scratch_mi
+    with _mouse_scratch_lock:
+        mi.dx = int(x * _SCALE_X)
+        mi.dy = int(y * _SCALE_Y)
+        mi.mouseData = mouse_data
+        mi.dwFlags = MOUSEEVENTF_ABSOLUTE | flags
+        if _SendInput(1, _mouse_scratch, _INPUT_SIZE) != 1:
+            raise ctypes.WinError(ctypes.get_last_error())
 
 # Public Mouse API
 def mousedown(point: tuple[int, int], button: str = "left") -> None:
     """Presses and holds a mouse button at the specified point."""
-    button_flags_map = {
-        "left": MOUSEEVENTF_LEFTDOWN,
-        "right": MOUSEEVENTF_RIGHTDOWN,
-        "middle": MOUSEEVENTF_MIDDLEDOWN,
-    }
-    event_flag = button_flags_map.get(button.lower(), MOUSEEVENTF_LEFTDOWN)
-    _mouse_event(event_flag, point[0], point[1])
+    _mouse_event(_BUTTON_TABLE[_button_id(button)][0], point[0], point[1])
 
 def mouseup(point: tuple[int, int], button: str = "left") -> None:
     """Releases a mouse button at the specified point."""
-    button_flags_map = {
-        "left": MOUSEEVENTF_LEFTUP,
-        "right": MOUSEEVENTF_RIGHTUP,
-        "middle": MOUSEEVENTF_MIDDLEUP,
-    }
-    event_flag = button_flags_map.get(button.lower(), MOUSEEVENTF_LEFTUP)
-    _mouse_event(event_flag, point[0], point[1])
+    _mouse_event(_BUTTON_TABLE[_button_id(button)][1], point[0], point[1])
 
 @functools.singledispatch # Allows overloading `click` for different first arg types if needed
 def click(point: Any, button: str = "left") -> None: # `Any` for singledispatch base
@@ -133,61 +186,106 @@ def click(point: Any, button: str = "left") -> None: # `Any` for singledispatch
 @click.register(tuple) # type: ignore[no-redef]
 def _click_tuple(point: tuple[int, int], button: str = "left") -> None:
     """Performs a mouse click (down + up) at the specified screen coordinates."""
+    down_flag, up_flag = _BUTTON_TABLE[_button_id(button)]
     move(point) # Ensure cursor is at the target point
-    time.sleep(0.01) # Small delay can improve reliability in some apps
-    mousedown(point, button)
-    time.sleep(0.01) # Delay between press and release
-    mouseup(point, button)
+    pause(_DELAYS["click_settle"])
+    _mouse_event(down_flag, point[0], point[1])
+    pause(_DELAYS["click_settle"]) # Between press and release
+    _mouse_event(up_flag, point[0], point[1])
+
+def double_click(point: tuple[int, int], button: str = "left") -> None:
+    """
+    Performs a double click at the specified screen coordinates.
+    Both down/up pairs go out in one SendInput call, so the system sees them well within
+    the double-click time and synthesizes the WM_*BUTTONDBLCLK message itself.
+    """
+    down_flag, up_flag = _BUTTON_TABLE[_button_id(button)]
+    x, y = point
+    _send_input(
+        _mouse_input(MOUSEEVENTF_MOVE, x, y),
+        _mouse_input(down_flag, x, y),
+        _mouse_input(up_flag, x, y),
+        _mouse_input(down_flag, x, y),
+        _mouse_input(up_flag, x, y),
+    )
 
 def move(point: tuple[int, int]) -> None:
     """Moves the mouse cursor to the specified screen coordinates."""
     _mouse_event(MOUSEEVENTF_MOVE, point[0], point[1])
 
-def drag(start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5) -> None:
-    """Drags the mouse from start_point to end_point with a button held down."""
+DRAG_STEP_MS = 20 # Interval between interpolated moves of a smooth drag (~50 steps per second)
+
+def drag(start_point: tuple[int, int], end_point: tuple[int, int], button: str = "left", duration: float = 0.5, smooth: bool = True) -> None:
+    """
+    Drags the mouse from start_point to end_point with a button held down.
+    With smooth=False the button is pressed, the pointer jumps to end_point and the button is
+    released with no intermediate steps or pauses; duration is ignored. Smooth drags step every
+    DRAG_STEP_MS milliseconds.
+    """
+    down_flag, up_flag = _BUTTON_TABLE[_button_id(button)] # Resolved once, not per step
+    if not smooth: # Press, jump, release: one SendInput batch
+        _send_input(
+            _mouse_input(MOUSEEVENTF_MOVE, start_point[0], start_point[1]),
+            _mouse_input(down_flag, start_point[0], start_point[1]),
+            _mouse_input(MOUSEEVENTF_MOVE, end_point[0], end_point[1]),
+            _mouse_input(up_flag, end_point[0], end_point[1]),
+        )
+        return
+
     move(start_point)
-    time.sleep(0.05) # Ensure move is processed before mousedown
-    mousedown(start_point, button)
-    time.sleep(0.05) # Ensure mousedown is processed
+    pause(_DELAYS["drag_settle"])
+    _mouse_event(down_flag, start_point[0], start_point[1])
+    pause(_DELAYS["drag_settle"])
 
     if duration <= 0:
         move(end_point) # Instantaneous move if no duration
     else:
         start_x, start_y = start_point
         end_x, end_y = end_point
-        num_steps = max(2, int(duration / 0.02)) # Aim for ~50 steps per second
+        num_steps = max(2, int(duration * 1000 / DRAG_STEP_MS))
         time_per_step = duration / num_steps
 
-        for i in range(num_steps + 1): # Include the end point
-            ratio = i / num_steps
-            current_x = int(start_x + (end_x - start_x) * ratio)
-            current_y = int(start_y + (end_y - start_y) * ratio)
-            move((current_x, current_y))
+        # Build every move event up front (end point included) so the paced loop below only
+        # points SendInput at the next element instead of constructing structures per step.
+        path = (INPUT * (num_steps + 1))(*(
+            _mouse_input(
+                MOUSEEVENTF_MOVE,
+                int(start_x + (end_x - start_x) * i / num_steps),
+                int(start_y + (end_y - start_y) * i / num_steps),
+            )
+            for i in range(num_steps + 1)
+        ))
+        for i in range(num_steps + 1):
+            _send_input_array(path, i, 1)
             if i < num_steps: # No sleep after the final move
                 time.sleep(time_per_step)
     
-    time.sleep(0.05) # Ensure final move/drag is processed
-    mouseup(end_point, button) # Release button at the destination
+    pause(_DELAYS["drag_settle"])
+    _mouse_event(up_flag, end_point[0], end_point[1]) # Release button at the destination
 
-def scroll(dx: int, dy: int) -> None:
+def scroll(dx: int, dy: int, point: tuple[int, int] | None = None) -> None:
     """
     Scrolls horizontally by dx units and vertically by dy units.
     Positive dx scrolls right, negative dx scrolls left.
     Positive dy scrolls down (towards user), negative dy scrolls up (away from user).
+    If point is given, the cursor is moved there first; move and wheel events go out in one SendInput call.
     """
+    inputs: list[INPUT] = []
+    if point is not None:
+        inputs.append(_mouse_input(MOUSEEVENTF_MOVE, point[0], point[1]))
     if dy != 0:
         # For MOUSEEVENTF_WHEEL:
         # Positive mouseData value indicates the wheel was rotated forward (away from the user - scroll UP).
         # Negative mouseData value indicates the wheel was rotated backward (towards the user - scroll DOWN).
         # So, if dy is intuitive (positive=down, negative=up), mouse_data needs inversion for dy.
-        _mouse_event(MOUSEEVENTF_WHEEL, mouse_data=int(dy * -WHEEL_DELTA))
-        time.sleep(0.01) # Small delay between scroll events if both are triggered
+        inputs.append(_mouse_input(MOUSEEVENTF_WHEEL, mouse_data=int(dy * -WHEEL_DELTA)))
     if dx != 0:
         # For MOUSEEVENTF_HWHEEL:
         # Positive mouseData scrolls RIGHT. Negative mouseData scrolls LEFT.
         # dx maps directly.
-        _mouse_event(MOUSEEVENTF_HWHEEL, mouse_data=int(dx * WHEEL_DELTA))
-        time.sleep(0.01)
+        inputs.append(_mouse_input(MOUSEEVENTF_HWHEEL, mouse_data=int(dx * WHEEL_DELTA)))
+    if inputs:
+        _send_input(*inputs)
 
 # Public Keyboard API
 def keydown(vk_code: int) -> None:
@@ -202,42 +300,36 @@ def keyup(vk_code: int) -> None:
 def press(vk_code: int) -> None:
     """Simulates a full key press (keydown followed by keyup)."""
     keydown(vk_code)
-    time.sleep(0.01) # Optional small delay between keydown and keyup
+    pause(_DELAYS["key_hold"])
     keyup(vk_code)
 
-def _send_unicode(char_code: int, is_key_up: bool = False) -> None:
-    """Helper to send a Unicode character event."""
-    # For Unicode input, wVk is 0. wScan is the Unicode character.
-    # KEYEVENTF_UNICODE flag must be set.
-    flags = KEYEVENTF_UNICODE
-    if is_key_up:
-        flags |= KEYEVENTF_KEYUP
-    ki = KEYBDINPUT(wVk=0, wScan=char_code, dwFlags=flags, time=0, dwExtraInfo=None)
-    _send_input(INPUT(type=INPUT_KEYBOARD, union=_INPUTunion(ki=ki)))
+# type_text writes into one preallocated batch of KEYEVENTF_UNICODE down/up records (even slots
+# down, odd slots up). Only wScan differs between characters, so it is filled in per batch with
+# strided memoryview assignments over the buffer viewed as 16-bit words; no INPUT objects per character.
+_TYPE_BATCH_UNITS = 1024 # UTF-16 code units per SendInput call (two events each)
+_type_buffer = (INPUT * (2 * _TYPE_BATCH_UNITS))()
+for _i, _record in enumerate(_type_buffer):
+    _record.type = INPUT_KEYBOARD
+    _record.union.ki.dwFlags = KEYEVENTF_UNICODE | (KEYEVENTF_KEYUP if _i % 2 else 0)
+del _i, _record
+_type_buffer_words = memoryview(_type_buffer).cast("B").cast("H")
+_type_buffer_lock = threading.Lock() # The buffer is shared by all threads
+_INPUT_WORDS = sizeof(INPUT) // 2
+_WSCAN_WORD = (INPUT.union.offset + KEYBDINPUT.wScan.offset) // 2 # wScan of record 0, in words
 
 def type_text(text: str) -> None:
     """
     Simulates typing of an arbitrary Unicode string.
-    For characters outside the Basic Multilingual Plane (BMP) (> 0xFFFF),
-    it sends the necessary surrogate pair.
+    Each batch of up to _TYPE_BATCH_UNITS UTF-16 code units goes out in one SendInput call as key
+    down/up pairs; characters outside the Basic Multilingual Plane (BMP) (> 0xFFFF) therefore
+    become their surrogate pair.
     """
-    for char_val in text:
-        char_code_point = ord(char_val)
-
-        if char_code_point <= 0xFFFF: # Character is in BMP
-            _send_unicode(char_code_point, is_key_up=False) # KeyDown
-            _send_unicode(char_code_point, is_key_up=True)  # KeyUp
-        else: # Character is outside BMP, needs surrogate pair
-            # Formula for surrogate pairs:
-            # H = (C - 0x10000) / 0x400 + 0xD800
-            # L = (C - 0x10000) % 0x400 + 0xDC00
-            # where C is the code point.
-            adjusted_code = char_code_point - 0x10000
-            high_surrogate = (adjusted_code // 0x400) + 0xD800
-            low_surrogate = (adjusted_code % 0x400) + 0xDC00
-
-            _send_unicode(high_surrogate, is_key_up=False)
-            _send_unicode(high_surrogate, is_key_up=True)
-            _send_unicode(low_surrogate, is_key_up=False)
-            _send_unicode(low_surrogate, is_key_up=True)
-        time.sleep(0.005) # Tiny delay between characters if needed
\ No newline at end of file
+    code_units = memoryview(text.encode("utf-16-le", "surrogatepass")).cast("H") # Native order; Windows is little-endian
+    pair_stride = 2 * _INPUT_WORDS
+    with _type_buffer_lock:
+        for start in range(0, len(code_units), _TYPE_BATCH_UNITS):
+            batch = code_units[start:start + _TYPE_BATCH_UNITS]
+            end = _WSCAN_WORD + len(batch) * pair_stride
+            _type_buffer_words[_WSCAN_WORD:end:pair_stride] = batch # Key down records
+            _type_buffer_words[_WSCAN_WORD + _INPUT_WORDS:end + _INPUT_WORDS:pair_stride] = batch # Key up records
+            _send_input_array(_type_buffer, 0, 2 * len(batch))
@@ -6,9 +6,14 @@ across the entire MCP application. Import `get_logger()` in other modules
 instead of configuring logging manually.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Any, Callable
 
 # --- Type Hinting ---
 # For Path | None, Python 3.10+ allows this directly.
@@ -19,6 +24,29 @@ from pathlib import Path
 _LOGGING_CONFIGURED: bool = False
 _DEFAULT_LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 _DEFAULT_LOG_LEVEL: int = logging.INFO
+_LEVELS: dict[str, int] = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+_BANNER_EMITTED: bool = False # The version banner is logged by the first setup_logging() only
+# The root logger only enqueues records; the console/file handlers run on the listener's thread,
+# so a slow terminal or disk never blocks an input or capture call that happens to log.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener: logging.handlers.QueueListener | None = None
+
+def _stop_log_listener() -> None:
+    """Flushes queued records and closes the real handlers (also registered with atexit)."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    listener, _log_listener = _log_listener, None
+    listener.stop() # Drains the queue before returning
+    for handler in listener.handlers:
+        handler.close()
 
 def setup_logging(
     level: int | str = _DEFAULT_LOG_LEVEL, # Allow string for level name e.g. "DEBUG"
@@ -40,7 +68,7 @@ def setup_logging(
         format_string: Custom log format string. Defaults to a standard format.
         force: If True, reconfigure logging even if already configured.
     """
-    global _LOGGING_CONFIGURED, _DEFAULT_LOG_LEVEL, _DEFAULT_LOG_FORMAT
+    global _LOGGING_CONFIGURED, _DEFAULT_LOG_LEVEL, _DEFAULT_LOG_FORMAT, _BANNER_EMITTED, _log_listener
 
     if _LOGGING_CONFIGURED and not force:
         # Logging already set up, and not forcing a re-configuration.
@@ -49,8 +77,8 @@ def setup_logging(
     # Determine the logging level
     actual_level: int
     if isinstance(level, str):
-        numeric_level = logging.getLevelName(level.upper())
-        if isinstance(numeric_level, int):
+        numeric_level = _LEVELS.get(level.upper())
+        if numeric_level is not None:
             actual_level = numeric_level
         else:
             print(f"Warning: Invalid log level string '{level}'. Defaulting to INFO.", file=sys.stderr)
@@ -67,11 +95,16 @@ def setup_logging(
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
         handler.close() # Close handler before removing
+    _stop_log_listener()
+
+    # One formatter shared by the real handlers
+    formatter = logging.Formatter(log_format_to_use)
+    handlers: list[logging.Handler] = []
 
     # Configure the console handler (always logs to sys.stdout)
     console_handler = logging.StreamHandler(sys.stderr)
-    console_handler.setFormatter(logging.Formatter(log_format_to_use))
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
 
     # Configure the file handler (optional)
     if log_file:
@@ -79,15 +112,21 @@ def setup_logging(
             log_file_path = Path(log_file)
             log_file_path.parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(log_file_path, mode='a') # Append mode
-            file_handler.setFormatter(logging.Formatter(log_format_to_use))
-            root_logger.addHandler(file_handler)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
         except Exception as e:
             # If file logging setup fails, log to console and continue
             print(f"Warning: Failed to set up file logging for '{log_file}': {e}", file=sys.stderr)
 
+    _log_listener = logging.handlers.QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    if not _LOGGING_CONFIGURED:
+        atexit.register(_stop_log_listener)
 
     # Set the determined level on the root logger
     root_logger.setLevel(actual_level)
+    refresh_debug_gates()
 
     # Optionally, reduce noise from verbose third-party libraries
     # These levels can be adjusted as needed.
@@ -104,7 +143,15 @@ def setup_logging(
     if log_file:
         root_logger.info(f"Logging to file: {Path(log_file).resolve()}")
 
+    if not _BANNER_EMITTED:
+        from mcp import __python_version__, __version__
+        logging.getLogger("mcp").info(
+            "MCP v%s on Python %s (%s)", __version__, __python_version__, sys.platform
+        )
+        _BANNER_EMITTED = True
 
+
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Retrieves a logger instance for the given module name.
@@ -113,6 +160,12 @@ def get_logger(name: str) -> logging.Logger:
     If logging hasn't been configured by `setup_logging` yet, this function
     will trigger a default setup.
 
+    Results are memoized per name, so repeated lookups skip the
+    `logging.Manager` lock. Only the lookup is cached, not a wrapper object:
+    loggers are never replaced by reconfiguration, so cached entries stay
+    valid after `setup_logging(force=True)`. The cache is bounded so that
+    callers building logger names dynamically cannot grow it without limit.
+
     Args:
         name: Logger name, typically `__name__` of the calling module.
 
@@ -132,16 +185,32 @@ def get_logger(name: str) -> logging.Logger:
 
     return logging.getLogger(name)
 
-# Convenience functions (optional, but can be useful for very common patterns)
-# These are not strictly necessary as one can use logger.debug(), logger.error() directly.
+# --- Debug gates ---
+# Each gate caches "is DEBUG enabled for this logger" in a one-element list, so a disabled debug
+# call costs a list index and a bool test instead of a method lookup plus isEnabledFor().
+_REGISTERED_GATES: list[tuple[logging.Logger, list[bool]]] = []
+
+def refresh_debug_gates() -> None:
+    """
+    Re-reads the DEBUG state of every logger that has a gate. setup_logging() calls this; call it
+    yourself after changing logger levels directly.
+    """
+    for gated_logger, enabled in _REGISTERED_GATES:
+        enabled[0] = gated_logger.isEnabledFor(logging.DEBUG)
+
+def make_debug_gate(logger: logging.Logger) -> Callable[..., None]:
+    """
+    Returns a `logger.debug` replacement for hot paths that skips the call entirely while DEBUG is
+    off. Use %-style arguments so disabled messages are never formatted.
 
-def log_debug(logger: logging.Logger, msg: str, *args, **kwargs) -> None:
-    """Logs a debug message with lazy formatting if enabled."""
-    if logger.isEnabledFor(logging.DEBUG):
-        logger.debug(msg, *args, **kwargs)
+    Example:
+        >>> log_debug = make_debug_gate(logger)
+        >>> log_debug("Moved to %d,%d", x, y)
+    """
+    enabled = [logger.isEnabledFor(logging.DEBUG)]
+    _REGISTERED_GATES.append((logger, enabled))
 
-def log_exception(logger: logging.Logger, msg: str, exc_info: bool = True) -> None:
-    """Logs an error message with exception information."""
-    # This is essentially what logger.error(msg, exc_info=True) does.
-    # Kept for conceptual clarity if desired, but logger.error is standard.
-    logger.error(msg, exc_info=exc_info)
\ No newline at end of file
+    def log_debug(msg: str, *args: Any, **kwargs: Any) -> None:
+        if enabled[0]:
+            logger.debug(msg, *args, **kwargs)
+    return log_debug
@@ -5,7 +5,6 @@ This module provides the HTTP API server implementation using FastAPI.
 It loads configuration, sets up logging, CORS, and mounts the MCP router.
 """
 import json
-import sys
 from pathlib import Path
 from typing import Any, Dict
 
@@ -14,8 +13,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 
+from mcp import _IS_WINDOWS
 from mcp.logger import get_logger, setup_logging
-from mcp.api.routes import router as mcp_router
+from mcp.api.routes import DEFAULT_RESPONSE_CLASS, click_worker_lifespan, router as mcp_router
 
 # Global configuration - needed for tests
 mcp_config: Dict[str, Any] = {}
@@ -95,6 +95,8 @@ def create_app(config: Dict[str, Any] | None = None) -> FastAPI:
         debug=config.get("debug", False),
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=click_worker_lifespan,
+        default_response_class=DEFAULT_RESPONSE_CLASS,
     )
     
     # Setup CORS
@@ -166,7 +168,7 @@ def main_api_server():
         log_level="info" if not debug else "debug",
         access_log=True,
         # Windows-specific optimizations
-        loop="asyncio" if sys.platform == "win32" else "auto",
+        loop="asyncio" if _IS_WINDOWS else "auto",
         workers=1,  # Single worker for Windows compatibility
     )
 
@@ -46,10 +46,10 @@ def get_vision_module():
 
 def get_input_module():
     """Get platform-specific input module"""
-    import sys
-    if sys.platform == "win32":
+    from mcp import _IS_MACOS, _IS_WINDOWS
+    if _IS_WINDOWS:
         from mcp.input import win as input_module
-    elif sys.platform == "darwin":
+    elif _IS_MACOS:
         from mcp.input import mac as input_module
     else:
         from mcp.input import linux as input_module
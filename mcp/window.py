@@ -7,16 +7,24 @@ Uses PyWinCtl as the primary backend, with PyGetWindow as a fallback.
 """
 from __future__ import annotations # Good for type hints like `Window` in methods
 
+import functools
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol, runtime_checkable # For structural subtyping
 
 # Local package imports
+from mcp import _IS_WINDOWS
 from mcp.logger import get_logger
 
 logger = get_logger(__name__)
 
+if _IS_WINDOWS:
+    # Must happen before any geometry is queried, otherwise bboxes are DPI-virtualized.
+    from mcp._win_dpi import ensure_per_monitor_dpi
+    ensure_per_monitor_dpi()
+
 # --- Backend Initialization ---
 # Attempt to import PyWinCtl (preferred, more feature-rich and cross-platform)
 _active_backend_module: Any = None
@@ -100,6 +108,11 @@ class WindowBackendInterface(Protocol):
     # The Window class will try to access these through hasattr.
 
 
+@functools.cache
+def _backend_capabilities(impl_type: type) -> tuple[bool, bool]:
+    """(supports minimize, supports maximize) for a backend window class, probed once per class."""
+    return hasattr(impl_type, 'minimize'), hasattr(impl_type, 'maximize')
+
 # --- Window Class ---
 @dataclass(repr=False) # Custom __repr__ is provided
 class Window:
@@ -109,9 +122,12 @@ class Window:
     """
     _window_impl: WindowBackendInterface # The actual backend window object (pywinctl/pygetwindow)
     _backend_name_used: str # Name of the backend ('pywinctl' or 'pygetwindow')
+    _supports_minimize: bool = field(init=False, default=False, compare=False)
+    _supports_maximize: bool = field(init=False, default=False, compare=False)
 
     def __post_init__(self):
         """Validates the window object after initialization."""
+        self._supports_minimize, self._supports_maximize = _backend_capabilities(type(self._window_impl))
         if not self.is_alive():
             # Try to get title for error message, even if not alive, but handle failure
             title_for_error = "unknown or closed window"
@@ -164,7 +180,7 @@ class Window:
                 elif hasattr(self._window_impl, '_winID'): # macOS/Linux
                     return self._window_impl._winID # type: ignore
             elif self._backend_name_used == "pygetwindow":
-                if sys.platform == "win32" and hasattr(self._window_impl, 'hWnd'): # Windows HWND
+                if _IS_WINDOWS and hasattr(self._window_impl, 'hWnd'): # Windows HWND
                     return self._window_impl.hWnd # type: ignore
                 # PyGetWindow on macOS/Linux doesn't provide a simple integer ID easily.
                 # It might wrap an object that can be stringified.
@@ -427,7 +443,7 @@ def _find_window_impl(title: str | None = None, window_id: int | str | None = No
             found_windows_backend = _active_backend_module.getWindowsWithTitle(title) # type: ignore
         elif window_id is not None: # pragma: no cover (pygetwindow has limited find-by-ID)
             logger.warning(f"Finding by raw window_id ({window_id}) with 'pygetwindow' backend is less reliable.")
-            if sys.platform == "win32" and isinstance(window_id, int):
+            if _IS_WINDOWS and isinstance(window_id, int):
                 # Try to find by HWND if on Windows
                 try:
                     win_by_hwnd = _active_backend_module.Win32Window(window_id) # type: ignore
@@ -516,6 +532,11 @@ def _find_window_impl(title: str | None = None, window_id: int | str | None = No
         return alive_backend_windows[0] # type: ignore
 
 
+WINDOW_LOOKUP_TTL_S = 0.25 # Coalesces the enumerations of back-to-back calls (info -> focus -> screenshot)
+WINDOW_LOOKUP_CACHE_SIZE = 64
+_window_lookup_cache: dict[tuple[str | None, int | str | None], tuple[Window, float]] = {} # -> (window, expiry)
+_window_lookup_lock = threading.Lock() # get_window runs on executor threads
+
 def get_window(*, title: str | None = None, window_id: int | str | None = None) -> Window:
     """
     Gets a `Window` handle by its title (substring match) or native window ID.
@@ -544,13 +565,26 @@ def get_window(*, title: str | None = None, window_id: int | str | None = None)
          raise TypeError(f"'window_id' must be an int or string if provided, got {type(window_id)}.")
 
     _ensure_backend_available() # Checks if _active_backend_module is loaded
+
+    # A lookup repeated within WINDOW_LOOKUP_TTL_S reuses the previous result while that window is alive
+    key = (title, window_id)
+    cached = _window_lookup_cache.get(key)
+    if cached is not None and time.monotonic() < cached[1] and cached[0].is_alive():
+        return cached[0]
+
     logger.debug(f"Attempting to get window: title='{title}', window_id={window_id}, backend='{_ACTIVE_BACKEND_NAME}'")
 
     try:
         # _find_window_impl returns the raw backend window object
         backend_window_obj = _find_window_impl(title=title, window_id=window_id)
         # Wrap it in our Window class
-        return Window(_window_impl=backend_window_obj, _backend_name_used=_ACTIVE_BACKEND_NAME)
+        win = Window(_window_impl=backend_window_obj, _backend_name_used=_ACTIVE_BACKEND_NAME)
+        with _window_lookup_lock:
+            _window_lookup_cache.pop(key, None)
+            if len(_window_lookup_cache) >= WINDOW_LOOKUP_CACHE_SIZE:
+                _window_lookup_cache.pop(next(iter(_window_lookup_cache))) # Oldest insertion first
+            _window_lookup_cache[key] = (win, time.monotonic() + WINDOW_LOOKUP_TTL_S)
+        return win
     except (WindowNotFoundError, WindowBackendNotAvailableError, ValueError, TypeError):
         raise # Re-raise specific known errors
     except Exception as e: # Catch any other unexpected error from backend or internal logic
@@ -603,6 +637,62 @@ def list_all_windows() -> list[Window]:
     logger.info(f"Found {len(mcp_windows)} valid and accessible windows.")
     return mcp_windows
 
+@dataclass(frozen=True, slots=True)
+class WindowSnapshot:
+    """Immutable point-in-time copy of the properties listing endpoints report for a window."""
+    title: str
+    window_id: int | str | None
+    is_visible: bool
+    bbox: BBox
+    backend: str
+
+    def as_dict(self) -> dict[str, object]:
+        """Returns the JSON shape used by the window listing API."""
+        left, top, width, height = self.bbox
+        return {
+            "title": self.title,
+            "window_id": self.window_id,
+            "is_visible": self.is_visible,
+            "bbox": {"left": left, "top": top, "width": width, "height": height},
+            "backend_used": self.backend,
+        }
+
+_UNTITLED_WINDOW_TITLES = frozenset({"", "Untitled Window"})
+
+def list_all_windows_snapshot(only_visible_titled: bool = False) -> list[WindowSnapshot]:
+    """
+    Enumerates windows once and reads title, ID, visibility and bbox of each in the same pass.
+    Meant to be run as a single worker-thread call by async callers, instead of one
+    thread hop per window property. Windows whose properties cannot be read are skipped.
+
+    Args:
+        only_visible_titled: Drop hidden and untitled windows (tray icons, tool windows) right
+                             after their title/visibility check, before bbox and ID are queried.
+
+    Raises:
+        WindowBackendNotAvailableError: If no windowing backend is loaded.
+        WindowOperationError: If the backend fails to enumerate windows.
+    """
+    snapshots: list[WindowSnapshot] = []
+    for win in list_all_windows():
+        try:
+            title = win.title
+            if only_visible_titled and title in _UNTITLED_WINDOW_TITLES:
+                continue
+            is_visible = win.is_visible()
+            if only_visible_titled and not is_visible:
+                continue
+            snapshots.append(WindowSnapshot(
+                title=title,
+                window_id=win.window_id,
+                is_visible=is_visible,
+                bbox=win.bbox,
+                backend=win._backend_name_used,
+            ))
+        except WindowError as e:
+            logger.debug(f"Skipping window during snapshot: {e!s}")
+    return snapshots
+
 def screenshot_window(window_id: int | str | None = None, title: str | None = None) -> bytes:
     """
     Takes a screenshot of a specific window or the entire screen.